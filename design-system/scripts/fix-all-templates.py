@@ -4,10 +4,17 @@ LYD Design System - Fix All Templates
 Behebt Logo und Navigation auf ALLEN Seiten
 """
 
+import argparse
 import os
 import re
+import shutil
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'scripts'))
+from lyd_ds.atomic import AtomicWriter, write_atomic
+from lyd_ds.dry_run import DiffPreview, TrackedText
+
 # Korrektes Logo SVG (von patterns/introduction)
 CORRECT_LOGO_SVG = '''<svg class="sidebar-logo" viewBox="0 0 990 800" xmlns="http://www.w3.org/2000/svg">
                 <defs>
@@ -78,55 +85,77 @@ CORRECT_NAVIGATION = '''            <div class="nav-section">
                 <a href="/patterns/lead-management/" class="nav-item">Lead Management</a>
             </div>'''
 
-def fix_html_file(file_path):
-    """Behebt Logo und Navigation in einer HTML-Datei"""
+# Logo ersetzen (alle möglichen Logo-Varianten)
+LOGO_PATTERNS = [
+    r'<svg class="lyd-logo"[^>]*>.*?</svg>',
+    r'<svg class="sidebar-logo"[^>]*>.*?</svg>',
+    r'<svg[^>]*viewBox="0 0 200 60"[^>]*>.*?</svg>'
+]
+
+# Navigation ersetzen
+NAV_PATTERNS = [
+    r'<div class="lyd-nav-section">.*?</div>\s*</nav>',
+    r'<div class="nav-section">.*?</div>\s*</nav>',
+    r'<div class="lyd-nav-section-title">Getting Started</div>.*?</div>\s*</nav>'
+]
+NAV_REPLACEMENT = CORRECT_NAVIGATION + '\n        </div>\n    </nav>'
+
+# CSS-Klassen vereinheitlichen (Reihenfolge wie bisher)
+CLASS_RENAMES = [
+    ('lyd-sidebar', 'sidebar'),
+    ('lyd-sidebar-header', 'sidebar-header'),
+    ('lyd-nav-section', 'nav-section'),
+    ('lyd-nav-item', 'nav-item'),
+    ('lyd-main-content', 'main-content'),
+    ('lyd-page-header', 'page-header'),
+    ('lyd-page-title', 'page-title'),
+    ('lyd-page-subtitle', 'page-subtitle'),
+    ('lyd-section', 'section'),
+    ('lyd-section-title', 'section-title'),
+    ('lyd-component-grid', 'component-grid'),
+    ('lyd-component-card', 'component-card'),
+    ('lyd-component-showcase', 'component-showcase'),
+]
+
+# Ab dieser Größe wird gestreamt statt die ganze Datei in den Speicher zu laden
+STREAM_THRESHOLD = 8 * 1024 * 1024
+
+
+def fix_html_file(file_path, stream=None, writer=None):
+    """Behebt Logo und Navigation in einer HTML-Datei (mit writer: erst beim Commit
+    geschrieben, mit DiffPreview als writer nur angezeigt)"""
     try:
+        file_path = Path(file_path)
+        dry_run = getattr(writer, 'tracks_edits', False)
+        if stream is None:
+            stream = file_path.stat().st_size >= STREAM_THRESHOLD
+        if stream and not dry_run:
+            return fix_html_file_streaming(file_path, writer)
+
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
         # Backup erstellen
-        backup_path = file_path.with_suffix('.html.backup-fix')
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        # Logo ersetzen (alle möglichen Logo-Varianten)
-        logo_patterns = [
-            r'<svg class="lyd-logo"[^>]*>.*?</svg>',
-            r'<svg class="sidebar-logo"[^>]*>.*?</svg>',
-            r'<svg[^>]*viewBox="0 0 200 60"[^>]*>.*?</svg>'
-        ]
+        if not dry_run:
+            backup_path = file_path.with_suffix('.html.backup-fix')
+            with open(backup_path, 'w', encoding='utf-8') as f:
+                f.write(content)
         
-        for pattern in logo_patterns:
-            content = re.sub(pattern, CORRECT_LOGO_SVG, content, flags=re.DOTALL)
+        doc = TrackedText(content, track=dry_run)
+        for pattern in LOGO_PATTERNS:
+            doc.sub(pattern, CORRECT_LOGO_SVG, flags=re.DOTALL)
         
-        # Navigation ersetzen
-        nav_patterns = [
-            r'<div class="lyd-nav-section">.*?</div>\s*</nav>',
-            r'<div class="nav-section">.*?</div>\s*</nav>',
-            r'<div class="lyd-nav-section-title">Getting Started</div>.*?</div>\s*</nav>'
-        ]
+        for pattern in NAV_PATTERNS:
+            doc.sub(pattern, NAV_REPLACEMENT, flags=re.DOTALL)
         
-        for pattern in nav_patterns:
-            content = re.sub(pattern, CORRECT_NAVIGATION + '\n        </div>\n    </nav>', content, flags=re.DOTALL)
-        
-        # CSS-Klassen vereinheitlichen
-        content = content.replace('lyd-sidebar', 'sidebar')
-        content = content.replace('lyd-sidebar-header', 'sidebar-header')
-        content = content.replace('lyd-nav-section', 'nav-section')
-        content = content.replace('lyd-nav-item', 'nav-item')
-        content = content.replace('lyd-main-content', 'main-content')
-        content = content.replace('lyd-page-header', 'page-header')
-        content = content.replace('lyd-page-title', 'page-title')
-        content = content.replace('lyd-page-subtitle', 'page-subtitle')
-        content = content.replace('lyd-section', 'section')
-        content = content.replace('lyd-section-title', 'section-title')
-        content = content.replace('lyd-component-grid', 'component-grid')
-        content = content.replace('lyd-component-card', 'component-card')
-        content = content.replace('lyd-component-showcase', 'component-showcase')
+        for old, new in CLASS_RENAMES:
+            doc.replace(old, new)
         
         # Aktualisierte Datei schreiben
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if writer:
+            writer.write(file_path, doc)
+        else:
+            write_atomic(file_path, doc.text)
         
         return True
         
@@ -134,9 +163,30 @@ def fix_html_file(file_path):
         print(f"Fehler bei {file_path}: {e}")
         return False
 
-def main():
-    """Behebt alle HTML-Dateien"""
-    design_system_root = Path(__file__).parent.parent
+def fix_html_file_streaming(file_path, writer=None):
+    """Wie fix_html_file, aber blockweise: Speicherbedarf ~ Fenstergröße statt Dateigröße
+    (mit writer landet die Datei im selben Batch wie die übrigen Seiten)"""
+    from lyd_ds.streaming import StreamRewriter
+
+    file_path = Path(file_path)
+    shutil.copyfile(file_path, file_path.with_suffix('.html.backup-fix'))
+
+    rewriter = StreamRewriter()
+    for pattern in LOGO_PATTERNS:
+        rewriter.sub(pattern, CORRECT_LOGO_SVG, flags=re.DOTALL)
+    for pattern in NAV_PATTERNS:
+        rewriter.sub(pattern, NAV_REPLACEMENT, flags=re.DOTALL)
+    for old, new in CLASS_RENAMES:
+        rewriter.replace(old, new)
+
+    stats = rewriter.rewrite_file(file_path, writer=writer)
+    print(f"🌊 Streamed {stats['bytes_in'] / 1024 / 1024:.1f} MB → "
+          f"{stats['bytes_out'] / 1024 / 1024:.1f} MB ({stats['subs']} replacements)")
+    return True
+
+def main(design_system_root=None, stream=None, dry_run=False):
+    """Behebt alle HTML-Dateien (dry_run: nur Diff anzeigen, nichts schreiben)"""
+    design_system_root = Path(design_system_root or Path(__file__).parent.parent)
     
     # Alle HTML-Dateien finden
     html_files = list(design_system_root.rglob('*.html'))
@@ -145,15 +195,25 @@ def main():
     print(f"Gefunden: {len(html_files)} HTML-Dateien")
     
     success_count = 0
-    for html_file in html_files:
-        print(f"Bearbeite: {html_file.relative_to(design_system_root)}")
-        if fix_html_file(html_file):
-            success_count += 1
-            print("✅ Erfolgreich")
-        else:
-            print("❌ Fehler")
+    writer = DiffPreview(design_system_root) if dry_run else AtomicWriter()
+    with writer:
+        for html_file in html_files:
+            if not dry_run:
+                print(f"Bearbeite: {html_file.relative_to(design_system_root)}")
+            if fix_html_file(html_file, stream, writer):
+                success_count += 1
+                if not dry_run:
+                    print("✅ Erfolgreich")
+            else:
+                print("❌ Fehler")
     
-    print(f"\n🎉 {success_count}/{len(html_files)} Dateien erfolgreich bearbeitet")
+    if not dry_run:
+        print(f"\n🎉 {success_count}/{len(html_files)} Dateien erfolgreich bearbeitet")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description='Fix logo and navigation on all pages')
+    parser.add_argument('--dry-run', action='store_true', help='Show a unified diff, write nothing')
+    parser.add_argument('--stream', action='store_true', default=None,
+                        help='Rewrite in bounded-memory chunks (default: only for files >= 8 MB)')
+    args = parser.parse_args()
+    main(stream=args.stream, dry_run=args.dry_run)
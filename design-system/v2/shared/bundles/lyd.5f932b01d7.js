@@ -0,0 +1,61 @@
+class LYDDropdownSystem{constructor(){this.openDropdowns=new Set();this.portalContainer=null;this.init();}
+init(){document.addEventListener('DOMContentLoaded',()=>{this.createPortalContainer();this.setupDropdowns();this.setupKeyboardNavigation();this.setupAccessibility();});}
+createPortalContainer(){this.portalContainer=document.createElement('div');this.portalContainer.id='lyd-dropdown-portal';this.portalContainer.style.cssText=`
+            position: fixed;
+            top: 0;
+            left: 0;
+            z-index: 999999;
+            pointer-events: none;
+        `;document.body.appendChild(this.portalContainer);console.log('🚀 Portal-Container erstellt (HeroUI-Pattern)');}
+setupDropdowns(){document.querySelectorAll('.lyd-select').forEach((select,index)=>{const trigger=select.querySelector('.lyd-select-trigger');const dropdown=select.querySelector('.lyd-select-dropdown');if(!trigger||!dropdown)return;const dropdownId='lyd-select-'+index;dropdown.id=dropdownId;trigger.addEventListener('click',(e)=>{e.preventDefault();e.stopPropagation();this.toggleSelect(select,trigger,dropdown);});dropdown.querySelectorAll('.lyd-select-option').forEach(option=>{option.addEventListener('click',(e)=>{e.preventDefault();e.stopPropagation();this.selectOption(select,trigger,dropdown,option);});});console.log('📋 Select '+index+' setup (HeroUI-Pattern)');});document.querySelectorAll('.lyd-dropdown').forEach((dropdown,index)=>{const trigger=dropdown.querySelector('.lyd-dropdown-trigger');const menu=dropdown.querySelector('.lyd-dropdown-menu');if(!trigger||!menu)return;const menuId='lyd-dropdown-'+index;menu.id=menuId;trigger.addEventListener('click',(e)=>{e.preventDefault();e.stopPropagation();this.toggleDropdown(dropdown,trigger,menu);});menu.querySelectorAll('.lyd-dropdown-item').forEach(item=>{item.addEventListener('click',(e)=>{e.preventDefault();e.stopPropagation();this.selectDropdownItem(dropdown,trigger,menu,item);});});console.log('📋 Dropdown '+index+' setup (HeroUI-Pattern)');});document.querySelectorAll('.lyd-autocomplete').forEach((autocomplete,index)=>{const input=autocomplete.querySelector('.lyd-autocomplete-input');const dropdown=autocomplete.querySelector('.lyd-autocomplete-dropdown');if(!input||!dropdown)return;const dropdownId='lyd-autocomplete-'+index;dropdown.id=dropdownId;input.addEventListener('focus',(e)=>{this.openAutocomplete(autocomplete,input,dropdown);});input.addEventListener('click',(e)=>{e.preventDefault();e.stopPropagation();this.openAutocomplete(autocomplete,input,dropdown);});input.addEventListener('input',(e)=>{this.filterAutocompleteOptions(dropdown,e.target.value);});dropdown.querySelectorAll('.lyd-autocomplete-item').forEach(item=>{item.addEventListener('click',(e)=>{e.preventDefault();e.stopPropagation();this.selectAutocompleteItem(autocomplete,input,dropdown,item);});});console.log('📋 Autocomplete '+index+' setup (HeroUI-Pattern)');});document.addEventListener('click',(e)=>{if(!e.target.closest('.lyd-select, .lyd-dropdown, .lyd-autocomplete, #lyd-dropdown-portal')){this.closeAllDropdowns();}});}
+toggleSelect(select,trigger,dropdown){const isOpen=dropdown.classList.contains('show');if(isOpen){this.closeDropdown(dropdown);}else{this.closeAllDropdowns();this.openDropdown(select,trigger,dropdown);}}
+toggleDropdown(container,trigger,menu){const isOpen=menu.classList.contains('active');if(isOpen){this.closeDropdown(menu);}else{this.closeAllDropdowns();this.openDropdown(container,trigger,menu);}}
+openDropdown(container,trigger,dropdown){const clone=dropdown.cloneNode(true);clone.style.pointerEvents='auto';const rect=trigger.getBoundingClientRect();clone.style.cssText+=`
+            position: fixed !important;
+            top: ${rect.bottom + 8}px !important;
+            left: ${rect.left}px !important;
+            width: ${rect.width}px !important;
+            min-width: 200px !important;
+            z-index: 999999 !important;
+            background: white !important;
+            border: 1px solid #e5e7eb !important;
+            border-radius: 8px !important;
+            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2) !important;
+            opacity: 1 !important;
+            visibility: visible !important;
+            transform: translateY(0) !important;
+        `;this.setupClonedEventHandlers(clone,container,trigger,dropdown);this.portalContainer.appendChild(clone);dropdown.style.display='none';container.classList.add('active');trigger.classList.add('active');dropdown.classList.add('show');this.openDropdowns.add({container,trigger,dropdown,clone});console.log('🔓 Dropdown opened (Portal-Rendered)');}
+setupClonedEventHandlers(clone,container,trigger,originalDropdown){clone.querySelectorAll('.lyd-select-option, .lyd-dropdown-item').forEach(item=>{item.addEventListener('click',(e)=>{e.preventDefault();e.stopPropagation();const selectedText=trigger.querySelector('.lyd-select-text, span:not(.lyd-dropdown-icon):not(.lyd-select-icon)');if(selectedText&&!item.classList.contains('checkbox')){selectedText.textContent=item.textContent.trim();}
+this.closeDropdown(originalDropdown);console.log('✅ Option selected:',item.textContent.trim());});});}
+closeDropdown(dropdown){this.openDropdowns.forEach(({container,trigger,dropdown:dd,clone})=>{if(dd===dropdown){if(clone&&clone.parentElement){clone.parentElement.removeChild(clone);}
+dd.style.display='';container.classList.remove('active');trigger.classList.remove('active');dd.classList.remove('show');this.openDropdowns.delete({container,trigger,dropdown:dd,clone});console.log('🔒 Dropdown closed (Portal-Removed)');}});}
+closeAllDropdowns(){this.openDropdowns.forEach(({container,trigger,dropdown,clone})=>{if(clone&&clone.parentElement){clone.parentElement.removeChild(clone);}
+dropdown.style.display='';container.classList.remove('active');trigger.classList.remove('active');dropdown.classList.remove('show');});this.openDropdowns.clear();console.log('🌍 All dropdowns closed');}
+selectOption(select,trigger,dropdown,option){const selectedText=trigger.querySelector('.lyd-select-text, span');if(selectedText){selectedText.textContent=option.textContent.trim();}
+dropdown.querySelectorAll('.lyd-select-option').forEach(opt=>{opt.classList.remove('selected');});option.classList.add('selected');this.closeDropdown(dropdown);}
+selectDropdownItem(container,trigger,menu,item){if(item.classList.contains('checkbox')){item.classList.toggle('selected');console.log('☑️ Checkbox toggled');return;}
+this.closeDropdown(menu);}
+openAutocomplete(container,input,dropdown){this.closeAllDropdowns();this.openDropdown(container,input,dropdown);console.log('🔓 Autocomplete opened');}
+selectAutocompleteItem(container,input,dropdown,item){input.value=item.textContent.trim();dropdown.querySelectorAll('.lyd-autocomplete-item').forEach(opt=>{opt.classList.remove('selected');});item.classList.add('selected');this.closeDropdown(dropdown);console.log('✅ Autocomplete option selected:',item.textContent.trim());}
+filterAutocompleteOptions(dropdown,searchValue){const items=dropdown.querySelectorAll('.lyd-autocomplete-item');const filter=searchValue.toLowerCase();items.forEach(item=>{const text=item.textContent.toLowerCase();item.style.display=text.includes(filter)?'':'none';});console.log('🔍 Autocomplete filtered:',searchValue);}
+setupKeyboardNavigation(){document.addEventListener('keydown',(e)=>{if(e.key==='Escape'){this.closeAllDropdowns();}});}
+setupAccessibility(){document.querySelectorAll('.lyd-select-trigger, .lyd-dropdown-trigger').forEach(trigger=>{trigger.setAttribute('aria-haspopup','true');trigger.setAttribute('aria-expanded','false');});}}
+window.LYDDropdownSystem=new LYDDropdownSystem();
+;
+window.LYDSiteSearch=(()=>{const WORD=/[a-z0-9äöüß]+(?:-[a-z0-9äöüß]+)*/g;const VLQ='ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/';const BASE='/shared/search/';let manifest=null;const shards=new Map();const cache=new Map();function terms(text){const found=[];(text.toLowerCase().match(WORD)||[]).forEach(word=>{found.push(word);if(word.includes('-'))found.push(...word.split('-'));});return[...new Set(found)].filter(term=>term.length>=2);}
+function decode(encoded){const values=[];let value=0,shift=0;for(const char of encoded){const digit=VLQ.indexOf(char);value|=(digit&31)<<shift;if(digit&32){shift+=5;}else{values.push(value);value=0;shift=0;}}
+const postings=[];for(let i=0,doc=0;i+1<values.length;i+=2){doc+=values[i];postings.push([doc,values[i+1]]);}
+return postings;}
+async function loadManifest(){if(!manifest){manifest=fetch(BASE+'manifest.json').then(response=>response.json());}
+return manifest;}
+function loadShard(index,key){if(!shards.has(key)){const name=index.shards[key];shards.set(key,name?fetch(BASE+name).then(response=>response.json()):Promise.resolve({}));}
+return shards.get(key);}
+function score(index,fields){let total=0;for(const field in index.weights)if(fields&field)total+=index.weights[field];return total;}
+async function query(text,limit=10){const words=terms(text);const key=words.join(' ')+'|'+limit;if(cache.has(key))return cache.get(key);const index=await loadManifest();const loaded=await Promise.all(words.map(word=>loadShard(index,word.slice(0,index.prefix))));let scores=null;words.forEach((word,i)=>{const matches=new Map();for(const term in loaded[i]){if(!term.startsWith(word))continue;decode(loaded[i][term]).forEach(([doc,fields])=>{const value=score(index,fields)+(term===word?1:0);if(!(matches.get(doc)>=value))matches.set(doc,value);});}
+if(scores===null){scores=matches;}else{const next=new Map();scores.forEach((value,doc)=>{if(matches.has(doc))next.set(doc,value+matches.get(doc));});scores=next;}});const results=[...(scores||new Map())]
+.sort((a,b)=>b[1]-a[1]||a[0]-b[0])
+.slice(0,limit)
+.map(([doc,value])=>({url:index.docs[doc][0],title:index.docs[doc][1],section:index.docs[doc][2],score:value}));cache.set(key,results);return results;}
+function bind(input){const list=document.getElementById(input.dataset.siteSearch);if(!list)return;let latest=0;input.addEventListener('input',async()=>{const current=++latest;const results=await query(input.value);if(current!==latest)return;list.replaceChildren(...results.map(result=>{const item=document.createElement('a');item.href=result.url;item.className='lyd-search-result';item.textContent=result.section?`${result.title} › ${result.section}`:result.title;return item;}));});input.addEventListener('focus',loadManifest,{once:true});}
+document.addEventListener('DOMContentLoaded',()=>{document.querySelectorAll('[data-site-search]').forEach(bind);});return{query,terms};})();
+;
@@ -0,0 +1,40 @@
+window.LYDModal={open:function(modalId){const backdrop=document.getElementById(modalId+'-backdrop');const modal=document.getElementById(modalId);if(backdrop&&modal){backdrop.classList.add('active');modal.classList.add('active');document.body.style.overflow='hidden';document.body.classList.add('modal-open');}},close:function(modalId){const backdrop=document.getElementById(modalId+'-backdrop');const modal=document.getElementById(modalId);if(backdrop&&modal){backdrop.classList.remove('active');modal.classList.remove('active');document.body.style.overflow='';document.body.classList.remove('modal-open');}},init:function(){document.querySelectorAll('.lyd-modal-backdrop').forEach(backdrop=>{backdrop.addEventListener('click',(e)=>{if(e.target===backdrop){const modalId=backdrop.id.replace('-backdrop','');this.close(modalId);}});});document.addEventListener('keydown',(e)=>{if(e.key==='Escape'){document.querySelectorAll('.lyd-modal-backdrop.active').forEach(backdrop=>{const modalId=backdrop.id.replace('-backdrop','');this.close(modalId);});}});}};window.LYDDropdown={toggle:function(dropdownId){const dropdown=document.getElementById(dropdownId);const trigger=dropdown?.previousElementSibling;if(dropdown&&trigger){document.querySelectorAll('.lyd-dropdown-menu').forEach(menu=>{if(menu.id!==dropdownId){menu.classList.remove('active');menu.style.display='none';}});document.querySelectorAll('.lyd-dropdown-trigger').forEach(btn=>{if(btn!==trigger){btn.classList.remove('active');}});const isActive=dropdown.classList.contains('active');if(isActive){dropdown.classList.remove('active');dropdown.style.display='none';trigger.classList.remove('active');}else{dropdown.classList.add('active');dropdown.style.display='block';dropdown.style.position='absolute';dropdown.style.top='calc(100% + 8px)';dropdown.style.left='0';dropdown.style.right='0';dropdown.style.zIndex='99999999';dropdown.style.background='white';dropdown.style.border='1px solid #e5e7eb';dropdown.style.borderRadius='8px';dropdown.style.boxShadow='0 10px 25px rgba(0,0,0,0.15)';trigger.classList.add('active');}}},init:function(){document.addEventListener('click',(e)=>{if(!e.target.closest('.lyd-dropdown')){document.querySelectorAll('.lyd-dropdown-menu.active').forEach(dropdown=>{dropdown.classList.remove('active');dropdown.style.display='none';});document.querySelectorAll('.lyd-dropdown-trigger.active').forEach(trigger=>{trigger.classList.remove('active');});}});}};window.LYDToast={container:null,init:function(){if(!this.container){this.container=document.createElement('div');this.container.className='lyd-toast-container';this.container.style.cssText=`
+                position: fixed;
+                top: 20px;
+                right: 20px;
+                z-index: 10000;
+                display: flex;
+                flex-direction: column;
+                gap: 12px;
+                max-width: 400px;
+            `;document.body.appendChild(this.container);}},show:function(message,type='info',duration=4000){this.init();const toast=document.createElement('div');toast.className=`luxury-toast ${type}`;toast.innerHTML=`
+            <div style="display: flex; align-items: center; gap: 12px;">
+                ${this.getIcon(type)}
+                <div style="flex: 1;">
+                    <div style="font-weight: 600; margin-bottom: 4px;">${this.getTitle(type)}</div>
+                    <div style="font-size: 14px; opacity: 0.9;">${message}</div>
+                </div>
+                <button onclick="this.parentElement.parentElement.remove()" style="background: none; border: none; cursor: pointer; opacity: 0.6; font-size: 18px;">&times;</button>
+            </div>
+        `;this.container.appendChild(toast);if(duration>0){setTimeout(()=>{if(toast.parentElement){toast.style.opacity='0';toast.style.transform='translateX(100%)';setTimeout(()=>toast.remove(),300);}},duration);}},getIcon:function(type){const icons={success:'<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="#10b981" stroke-width="2"><path d="M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z"/></svg>',error:'<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="#ef4444" stroke-width="2"><circle cx="12" cy="12" r="10"/><line x1="15" y1="9" x2="9" y2="15"/><line x1="9" y1="9" x2="15" y2="15"/></svg>',warning:'<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="#f59e0b" stroke-width="2"><path d="M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-3L13.732 4c-.77-1.333-2.694-1.333-3.464 0L3.34 16c-.77 1.333.192 3 1.732 3z"/></svg>',info:'<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="#3366CC" stroke-width="2"><circle cx="12" cy="12" r="10"/><path d="M12 16v-4m0-4h.01"/></svg>'};return icons[type]||icons.info;},getTitle:function(type){const titles={success:'Success',error:'Error',warning:'Warning',info:'Information'};return titles[type]||'Notification';}};window.LYDButton={init:function(){document.querySelectorAll('.lyd-button.loading').forEach(button=>{if(button.id==='loadingBtn'){setInterval(()=>{button.classList.toggle('loading');},3000);}});document.querySelectorAll('.lyd-button:not(.loading):not(:disabled)').forEach(button=>{button.addEventListener('click',function(e){this.style.transform='scale(0.98)';setTimeout(()=>{this.style.transform='';},100);});});},setLoading:function(buttonElement,isLoading=true){if(isLoading){buttonElement.classList.add('loading');buttonElement.disabled=true;}else{buttonElement.classList.remove('loading');buttonElement.disabled=false;}}};window.LYDDatePicker={currentDate:new Date(),toggle:function(pickerId){const picker=document.getElementById(pickerId);const calendar=picker?.querySelector('.lyd-datepicker-calendar');if(calendar){document.querySelectorAll('.lyd-datepicker-calendar.open').forEach(cal=>{if(cal!==calendar)cal.classList.remove('open');});calendar.classList.toggle('open');if(calendar.classList.contains('open')){this.generateCalendar(calendar,this.currentDate);}}},generateCalendar:function(calendar,date){console.log('Generating calendar for',date);},init:function(){document.addEventListener('click',(e)=>{if(!e.target.closest('.lyd-datepicker')){document.querySelectorAll('.lyd-datepicker-calendar.open').forEach(calendar=>{calendar.classList.remove('open');});}});}};window.LYDUtilities={copyToClipboard:function(element){const codeBlock=element.parentElement.querySelector('pre, code');const text=codeBlock?.textContent||element.dataset.clipboard;if(text&&navigator.clipboard){navigator.clipboard.writeText(text).then(()=>{const originalText=element.textContent;element.textContent='Copied!';element.classList.add('copied');setTimeout(()=>{element.textContent=originalText;element.classList.remove('copied');},2000);}).catch(()=>{const textArea=document.createElement('textarea');textArea.value=text;document.body.appendChild(textArea);textArea.select();document.execCommand('copy');document.body.removeChild(textArea);});}},init:function(){document.querySelectorAll('.lyd-button.copy, [data-clipboard]').forEach(button=>{button.addEventListener('click',()=>this.copyToClipboard(button));});}};document.addEventListener('DOMContentLoaded',function(){if(window.LYDModal)LYDModal.init();if(window.LYDDropdown)LYDDropdown.init();if(window.LYDToast)LYDToast.init();if(window.LYDButton)LYDButton.init();if(window.LYDDatePicker)LYDDatePicker.init();if(window.LYDUtilities)LYDUtilities.init();const currentPath=window.location.pathname;document.querySelectorAll('.nav-item').forEach(item=>{if(item.getAttribute('href')===currentPath){item.classList.add('active');}});});function openModal(modalId){LYDModal.open(modalId);}
+function closeModal(modalId){LYDModal.close(modalId);}
+function toggleDropdown(dropdownId){LYDDropdown.toggle(dropdownId);}
+function showToast(message,type,duration){LYDToast.show(message,type,duration);}
+;
+window.LYDSiteSearch=(()=>{const WORD=/[a-z0-9äöüß]+(?:-[a-z0-9äöüß]+)*/g;const VLQ='ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/';const BASE='/shared/search/';let manifest=null;const shards=new Map();const cache=new Map();function terms(text){const found=[];(text.toLowerCase().match(WORD)||[]).forEach(word=>{found.push(word);if(word.includes('-'))found.push(...word.split('-'));});return[...new Set(found)].filter(term=>term.length>=2);}
+function decode(encoded){const values=[];let value=0,shift=0;for(const char of encoded){const digit=VLQ.indexOf(char);value|=(digit&31)<<shift;if(digit&32){shift+=5;}else{values.push(value);value=0;shift=0;}}
+const postings=[];for(let i=0,doc=0;i+1<values.length;i+=2){doc+=values[i];postings.push([doc,values[i+1]]);}
+return postings;}
+async function loadManifest(){if(!manifest){manifest=fetch(BASE+'manifest.json').then(response=>response.json());}
+return manifest;}
+function loadShard(index,key){if(!shards.has(key)){const name=index.shards[key];shards.set(key,name?fetch(BASE+name).then(response=>response.json()):Promise.resolve({}));}
+return shards.get(key);}
+function score(index,fields){let total=0;for(const field in index.weights)if(fields&field)total+=index.weights[field];return total;}
+async function query(text,limit=10){const words=terms(text);const key=words.join(' ')+'|'+limit;if(cache.has(key))return cache.get(key);const index=await loadManifest();const loaded=await Promise.all(words.map(word=>loadShard(index,word.slice(0,index.prefix))));let scores=null;words.forEach((word,i)=>{const matches=new Map();for(const term in loaded[i]){if(!term.startsWith(word))continue;decode(loaded[i][term]).forEach(([doc,fields])=>{const value=score(index,fields)+(term===word?1:0);if(!(matches.get(doc)>=value))matches.set(doc,value);});}
+if(scores===null){scores=matches;}else{const next=new Map();scores.forEach((value,doc)=>{if(matches.has(doc))next.set(doc,value+matches.get(doc));});scores=next;}});const results=[...(scores||new Map())]
+.sort((a,b)=>b[1]-a[1]||a[0]-b[0])
+.slice(0,limit)
+.map(([doc,value])=>({url:index.docs[doc][0],title:index.docs[doc][1],section:index.docs[doc][2],score:value}));cache.set(key,results);return results;}
+function bind(input){const list=document.getElementById(input.dataset.siteSearch);if(!list)return;let latest=0;input.addEventListener('input',async()=>{const current=++latest;const results=await query(input.value);if(current!==latest)return;list.replaceChildren(...results.map(result=>{const item=document.createElement('a');item.href=result.url;item.className='lyd-search-result';item.textContent=result.section?`${result.title} › ${result.section}`:result.title;return item;}));});input.addEventListener('focus',loadManifest,{once:true});}
+document.addEventListener('DOMContentLoaded',()=>{document.querySelectorAll('[data-site-search]').forEach(bind);});return{query,terms};})();
+;
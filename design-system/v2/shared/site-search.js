@@ -0,0 +1,116 @@
+/* LYD Site Search - generated by scripts/lyd_ds/site_search.py, do not edit */
+window.LYDSiteSearch = (() => {
+    const WORD = /[a-z0-9äöüß]+(?:-[a-z0-9äöüß]+)*/g;
+    const VLQ = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/';
+    const BASE = '/shared/search/';
+    let manifest = null;
+    const shards = new Map();
+    const cache = new Map();
+
+    function terms(text) {
+        const found = [];
+        (text.toLowerCase().match(WORD) || []).forEach(word => {
+            found.push(word);
+            if (word.includes('-')) found.push(...word.split('-'));
+        });
+        return [...new Set(found)].filter(term => term.length >= 2);
+    }
+
+    function decode(encoded) {
+        const values = [];
+        let value = 0, shift = 0;
+        for (const char of encoded) {
+            const digit = VLQ.indexOf(char);
+            value |= (digit & 31) << shift;
+            if (digit & 32) { shift += 5; } else { values.push(value); value = 0; shift = 0; }
+        }
+        const postings = [];
+        for (let i = 0, doc = 0; i + 1 < values.length; i += 2) {
+            doc += values[i];
+            postings.push([doc, values[i + 1]]);
+        }
+        return postings;
+    }
+
+    async function loadManifest() {
+        if (!manifest) {
+            manifest = fetch(BASE + 'manifest.json').then(response => response.json());
+        }
+        return manifest;
+    }
+
+    function loadShard(index, key) {
+        if (!shards.has(key)) {
+            const name = index.shards[key];
+            shards.set(key, name ? fetch(BASE + name).then(response => response.json()) : Promise.resolve({}));
+        }
+        return shards.get(key);
+    }
+
+    function score(index, fields) {
+        let total = 0;
+        for (const field in index.weights) if (fields & field) total += index.weights[field];
+        return total;
+    }
+
+    async function query(text, limit = 10) {
+        const words = terms(text);
+        const key = words.join(' ') + '|' + limit;
+        if (cache.has(key)) return cache.get(key);
+        const index = await loadManifest();
+        const loaded = await Promise.all(words.map(word => loadShard(index, word.slice(0, index.prefix))));
+
+        let scores = null;
+        words.forEach((word, i) => {
+            const matches = new Map();
+            for (const term in loaded[i]) {
+                if (!term.startsWith(word)) continue;
+                decode(loaded[i][term]).forEach(([doc, fields]) => {
+                    const value = score(index, fields) + (term === word ? 1 : 0);
+                    if (!(matches.get(doc) >= value)) matches.set(doc, value);
+                });
+            }
+            if (scores === null) {
+                scores = matches;
+            } else {
+                const next = new Map();
+                scores.forEach((value, doc) => { if (matches.has(doc)) next.set(doc, value + matches.get(doc)); });
+                scores = next;
+            }
+        });
+
+        const results = [...(scores || new Map())]
+            .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+            .slice(0, limit)
+            .map(([doc, value]) => ({ url: index.docs[doc][0], title: index.docs[doc][1],
+                                      section: index.docs[doc][2], score: value }));
+        cache.set(key, results);
+        return results;
+    }
+
+    // <input data-site-search="results-id"> -> Trefferliste in #results-id
+    function bind(input) {
+        const list = document.getElementById(input.dataset.siteSearch);
+        if (!list) return;
+        let latest = 0;
+        input.addEventListener('input', async () => {
+            const current = ++latest;
+            const results = await query(input.value);
+            if (current !== latest) return;
+            list.replaceChildren(...results.map(result => {
+                const item = document.createElement('a');
+                item.href = result.url;
+                item.className = 'lyd-search-result';
+                item.textContent = result.section ? `${result.title} › ${result.section}` : result.title;
+                return item;
+            }));
+        });
+        input.addEventListener('focus', loadManifest, { once: true });
+    }
+
+    document.addEventListener('DOMContentLoaded', () => {
+        document.querySelectorAll('[data-site-search]').forEach(bind);
+    });
+
+    return { query, terms };
+})();
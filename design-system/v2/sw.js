@@ -0,0 +1,84 @@
+/* LYD Design System service worker - generated by scripts/lyd_ds/service_worker.py, do not edit */
+const PRECACHE = 'lyd-ds-precache';
+const PAGES = 'lyd-ds-pages';
+const RUNTIME_PREFIX = 'lyd-ds-immutable';
+const RUNTIME = `${RUNTIME_PREFIX}-b8a4abb89846`;
+const MANIFEST = [{"revision":"8b05104e932d","url":"/"},{"revision":"0df3b4d95301","url":"/components/"},{"revision":"356bc04a561b","url":"/components/accordion/"},{"revision":"e604039ac899","url":"/components/alert/"},{"revision":"46ad66d76559","url":"/components/autocomplete/"},{"revision":"b9f42942d167","url":"/components/avatar/"},{"revision":"6863e4204db1","url":"/components/badge/"},{"revision":"5ae1c1bb4c56","url":"/components/buttons/"},{"revision":"6df68e364365","url":"/components/calendar/"},{"revision":"9d7e8a7a76f8","url":"/components/cards/"},{"revision":"73497e31f1f4","url":"/components/checkbox/"},{"revision":"a7d315604977","url":"/components/date-picker/"},{"revision":"81c209334318","url":"/components/datepicker/"},{"revision":"661f3639a547","url":"/components/dropdown/"},{"revision":"a2b07bc1b512","url":"/components/inputs/"},{"revision":"a5a1ade4948f","url":"/components/modal/"},{"revision":"f83d048c3b4b","url":"/components/navbar/"},{"revision":"83025fb95b2c","url":"/components/overview/"},{"revision":"e5daee847f1b","url":"/components/pagination/"},{"revision":"ae8cb74a15ba","url":"/components/progress/"},{"revision":"9f8291a1cc88","url":"/components/radio/"},{"revision":"18e16b48e8fd","url":"/components/select/"},{"revision":"74416f7cea6e","url":"/components/slider/"},{"revision":"714310189a41","url":"/components/spinner/"},{"revision":"b57ec3100ad8","url":"/components/switch/"},{"revision":"673a0c3fee7c","url":"/components/table/"},{"revision":"a084b1c61788","url":"/components/tabs/"},{"revision":"c0f99d6d5176","url":"/components/textarea/"},{"revision":"d27a4d39021a","url":"/components/toast/"},{"revision":"2cab5862714d","url":"/components/tooltip/"},{"revision":"d4c4b8a0ec41","url":"/components/typography/"},{"revision":"bee8c5981350","url":"/design-principles/colors/"},{"revision":"bd7da23cb333","url":"/design-principles/grid/"},{"revision":"e09006199f8d","url":"/design-principles/overview/"},{"revision":"f5e4fd11b1e9","url":"/design-principles/spacing/"},{"revision":"2c5f12f83679","url":"/design-principles/typography/"},{"revision":"638913aa6af4","url":"/designing/"},{"revision":"fdfa5bbfb549","url":"/developing/"},{"revision":"7833e1b4c591","url":"/developing/nextjs/"},{"revision":"72ae7bf2c129","url":"/implementation/css/"},{"revision":"ecee9fbe564c","url":"/implementation/nextjs/"},{"revision":"1b09e9434df3","url":"/implementation/overview/"},{"revision":"e7c8d6f590f9","url":"/patterns/"},{"revision":"c099a9691bcc","url":"/patterns/footer/"},{"revision":"0da3f527397e","url":"/patterns/forms/"},{"revision":"b50f71649a21","url":"/patterns/header/"},{"revision":"5e17bb3fbb24","url":"/patterns/lead-management/"},{"revision":"7041b69f68a2","url":"/patterns/property-cards/"},{"revision":"97cfa52a0271","url":"/shared/lyd-logo.svg"},{"revision":"628aef4e78cb","url":"/shared/master.css"},{"revision":"bb554f0e0581","url":"/styles/"},{"revision":"de8b7dd49a30","url":"/styles/colors/"},{"revision":"82afdb04150e","url":"/styles/grid/"},{"revision":"608f57f17d98","url":"/styles/spacing/"},{"revision":"d6c4e6d2c6bd","url":"/styles/typography/"}];
+
+const HASHED = /\.[0-9a-f]{8,}\.(?:js|json|css)$/;
+const keyFor = entry => `${entry.url}?__rev=${entry.revision}`;
+const byUrl = new Map(MANIFEST.map(entry => [entry.url, keyFor(entry)]));
+
+function normalize(url) {
+    const path = new URL(url).pathname;
+    if (path.endsWith('/index.html')) return path.slice(0, -'index.html'.length);
+    if (!path.endsWith('/') && !path.split('/').pop().includes('.') && byUrl.has(path + '/')) return path + '/';
+    return path;
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(PRECACHE);
+        const cached = new Set((await cache.keys()).map(request => new URL(request.url).pathname + new URL(request.url).search));
+        const missing = MANIFEST.filter(entry => !cached.has(keyFor(entry)));
+        await Promise.all(missing.map(async entry => {
+            const response = await fetch(entry.url, { cache: 'no-cache' });
+            if (response.ok) await cache.put(keyFor(entry), response);
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        const current = new Set(byUrl.values());
+        const cache = await caches.open(PRECACHE);
+        for (const request of await cache.keys()) {
+            const url = new URL(request.url);
+            if (!current.has(url.pathname + url.search)) await cache.delete(request);
+        }
+        // Revalidierte Seiten verwerfen, deren Precache-Revision neuer ist
+        await caches.delete(PAGES);
+        for (const name of await caches.keys()) {
+            if (name.startsWith(RUNTIME_PREFIX) && name !== RUNTIME) await caches.delete(name);
+        }
+        await self.clients.claim();
+    })());
+});
+
+async function staleWhileRevalidate(event, path) {
+    const pages = await caches.open(PAGES);
+    const cached = await pages.match(path) ||
+        (byUrl.has(path) ? await caches.match(byUrl.get(path), { cacheName: PRECACHE }) : undefined);
+    const network = fetch(event.request).then(response => {
+        if (response.ok) pages.put(path, response.clone());
+        return response;
+    });
+    if (cached) {
+        event.waitUntil(network.catch(() => undefined));
+        return cached;
+    }
+    return network;
+}
+
+async function cacheFirst(request, key, cacheName) {
+    const cached = await caches.match(key, { cacheName });
+    if (cached) return cached;
+    const response = await fetch(request);
+    if (response.ok) (await caches.open(cacheName)).put(key, response.clone());
+    return response;
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET' || new URL(request.url).origin !== self.location.origin) return;
+    const path = normalize(request.url);
+
+    if (request.mode === 'navigate' || (byUrl.has(path) && path.endsWith('/'))) {
+        event.respondWith(staleWhileRevalidate(event, path));
+    } else if (byUrl.has(path)) {
+        event.respondWith(cacheFirst(request, byUrl.get(path), PRECACHE));
+    } else if (HASHED.test(path)) {
+        event.respondWith(cacheFirst(request, path, RUNTIME));
+    }
+});
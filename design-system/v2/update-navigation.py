@@ -4,17 +4,26 @@ Robustes Skript zur Aktualisierung der Navigation auf allen Seiten.
 Erhält den Content und ersetzt nur die Navigation.
 """
 
+import argparse
 import os
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'scripts'))
+from lyd_ds.atomic import AtomicWriter, write_atomic
+from lyd_ds.depindex import DependencyIndex
+from lyd_ds.dry_run import DiffPreview, TrackedText
+
+NAV_TEMPLATE = 'shared/navigation-template.html'
+
 def get_navigation_template():
     """Liest das Navigation-Template"""
-    with open('shared/navigation-template.html', 'r', encoding='utf-8') as f:
+    with open(NAV_TEMPLATE, 'r', encoding='utf-8') as f:
         return f.read()
 
-def update_navigation_in_file(filepath, nav_template):
-    """Aktualisiert die Navigation in einer HTML-Datei"""
+def update_navigation_in_file(filepath, nav_template, writer=None):
+    """Aktualisiert die Navigation in einer HTML-Datei (mit writer: erst beim Commit geschrieben)"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -75,11 +84,14 @@ def update_navigation_in_file(filepath, nav_template):
         
         # Prüfe ob Navigation existiert
         if re.search(nav_pattern, content, re.DOTALL):
-            new_content = re.sub(nav_pattern, new_nav.strip(), content, flags=re.DOTALL)
+            doc = TrackedText(content, track=getattr(writer, 'tracks_edits', False))
+            doc.sub(nav_pattern, new_nav.strip(), flags=re.DOTALL)
             
             # Speichere die aktualisierte Datei
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            if writer:
+                writer.write(filepath, doc)
+            else:
+                write_atomic(filepath, doc.text)
             
             return True, current_page
         else:
@@ -88,8 +100,9 @@ def update_navigation_in_file(filepath, nav_template):
     except Exception as e:
         return False, str(e)
 
-def main():
-    """Hauptfunktion"""
+def main(dry_run=False, changed=None):
+    """Hauptfunktion (dry_run: nur Diff anzeigen, nichts schreiben;
+    changed: nur Seiten, die von diesen Dateien abhängen)"""
     print("=== NAVIGATION UPDATE SCRIPT ===\n")
     
     # Basis-Verzeichnis
@@ -118,20 +131,32 @@ def main():
     
     print(f"📁 {len(html_files)} HTML-Dateien gefunden\n")
     
+    deps = DependencyIndex(Path(__file__).resolve().parents[2])
+    if changed is not None:
+        targets = deps.select('update-navigation', [str(path) for path in html_files], changed)
+        html_files = [Path(target) for target in targets]
+        print(f"🔁 {len(html_files)} betroffene Seite(n) für {', '.join(map(str, changed))}\n")
+    
     # Aktualisiere alle Dateien
     success_count = 0
     error_count = 0
     
-    for filepath in sorted(html_files):
-        relative_path = filepath.relative_to(base_dir)
-        success, info = update_navigation_in_file(filepath, nav_template)
-        
-        if success:
-            print(f"✅ {relative_path} - Aktive Seite: {info if info else 'Homepage'}")
-            success_count += 1
-        else:
-            print(f"❌ {relative_path} - Fehler: {info}")
-            error_count += 1
+    writer = DiffPreview(base_dir) if dry_run else AtomicWriter()
+    with writer:
+        for filepath in sorted(html_files):
+            relative_path = filepath.relative_to(base_dir)
+            success, info = update_navigation_in_file(filepath, nav_template, writer)
+            
+            if success:
+                deps.record('update-navigation', str(filepath), filepath, [NAV_TEMPLATE, __file__])
+                if not dry_run:
+                    print(f"✅ {relative_path} - Aktive Seite: {info if info else 'Homepage'}")
+                success_count += 1
+            else:
+                print(f"❌ {relative_path} - Fehler: {info}")
+                error_count += 1
+    if not dry_run:
+        deps.save()
     
     print(f"\n{'='*50}")
     print(f"✅ Erfolgreich: {success_count} Dateien")
@@ -139,4 +164,9 @@ def main():
     print(f"{'='*50}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description='Update the navigation on all pages')
+    parser.add_argument('--dry-run', action='store_true', help='Show a unified diff, write nothing')
+    parser.add_argument('--changed', nargs='+', metavar='PATH',
+                        help='Update only pages depending on these files (e.g. shared/navigation-template.html)')
+    args = parser.parse_args()
+    main(dry_run=args.dry_run, changed=args.changed)
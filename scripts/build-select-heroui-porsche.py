@@ -5,48 +5,71 @@ Systematischer Aufbau mit allen Features und Variants
 """
 
 import os
+import sys
 import re
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lyd_ds.atomic import write_atomic
+from lyd_ds.catalog import ComponentCatalog
+from lyd_ds.highlight import add_highlight_styles, highlight_blocks
+from lyd_ds.page_budget import BudgetError, gate_page
+from lyd_ds.tracing import Tracer
 
 class SelectComponentBuilder:
-    def __init__(self):
+    def __init__(self, tracer=None, budget_warn_only=False):
         self.base_path = '/Users/christianbernecker/live-your-dreams/design-system/components'
         self.template_path = f'{self.base_path}/buttons/index.html'
+        # Stufen-Timing, Trace-Datei via LYD_TRACE=<pfad>
+        self.tracer = tracer or Tracer.from_env('select-component-builder')
+        # Seitengewicht/DOM-Größe gegen "budget" aus content-fix/select.json
+        self.budget_warn_only = budget_warn_only
         
     def build_select_component(self):
         """Baue Select-Komponente nach HeroUI/Porsche Standards."""
         print("🚀 Building Select Component with HeroUI + Porsche standards...")
         
-        # Load clean template
-        with open(self.template_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 1. Update Meta Information
-        content = self.update_meta_info(content)
-        
-        # 2. Create Overview Section (HeroUI + Porsche style)
-        content = self.create_overview_section(content)
-        
-        # 3. Create Variants Section (comprehensive)
-        content = self.create_variants_section(content)
-        
-        # 4. Create Icon Library (proper sizing)
-        content = self.create_icon_library_section(content)
-        
-        # 5. Create Examples Section (real estate focused)
-        content = self.create_examples_section(content)
+        trace = self.tracer
         
-        # 6. Create API Section (Select-specific)
-        content = self.create_api_section(content)
-        
-        # 7. Create Accessibility Section
-        content = self.create_accessibility_section(content)
-        
-        # 8. Add Select-specific CSS
-        content = self.add_select_css(content)
-        
-        # 9. Write file atomically
-        self.write_file_atomically(content)
+        with trace.session('build_select_component'):
+            # Load clean template
+            with trace.stage('load_template') as span:
+                with open(self.template_path, 'r', encoding='utf-8') as f:
+                    content = span.output(f.read())
+            
+            # 1. Update Meta Information
+            content = trace.run('update_meta_info', self.update_meta_info, content)
+            
+            # 2. Create Overview Section (HeroUI + Porsche style)
+            content = trace.run('create_overview_section', self.create_overview_section, content)
+            
+            # 3. Create Variants Section (comprehensive)
+            content = trace.run('create_variants_section', self.create_variants_section, content)
+            
+            # 4. Create Icon Library (proper sizing)
+            content = trace.run('create_icon_library_section', self.create_icon_library_section, content)
+            
+            # 5. Create Examples Section (real estate focused)
+            content = trace.run('create_examples_section', self.create_examples_section, content)
+            
+            # 6. Create API Section (Select-specific)
+            content = trace.run('create_api_section', self.create_api_section, content)
+            
+            # 7. Create Accessibility Section
+            content = trace.run('create_accessibility_section', self.create_accessibility_section, content)
+            
+            # 8. Add Select-specific CSS
+            content = trace.run('add_select_css', self.add_select_css, content)
+            
+            # 9. Budget prüfen - bei Überschreitung wird nichts geschrieben
+            with trace.stage('check_budget', content):
+                gate_page('select', content, ComponentCatalog('content-fix')['select'],
+                          warn_only=self.budget_warn_only)
+            
+            # 10. Write file atomically
+            with trace.stage('write_file_atomically', content):
+                self.write_file_atomically(content)
         
         print("✅ Professional Select component created successfully!")
     
@@ -204,7 +227,7 @@ class SelectComponentBuilder:
         
         # Replace overview section completely
         pattern = r'<section class="section">\s*<h2 class="section-title">Button System Overview</h2>.*?</section>'
-        content = re.sub(pattern, overview_html, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, overview_html, content, flags=re.DOTALL)
         
         return content
     
@@ -481,7 +504,7 @@ class SelectComponentBuilder:
         
         # Replace variants section
         pattern = r'<section class="section">\s*<h2 class="section-title">Button Variants</h2>.*?</section>'
-        content = re.sub(pattern, variants_html, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, variants_html, content, flags=re.DOTALL)
         
         return content
     
@@ -568,7 +591,7 @@ class SelectComponentBuilder:
         
         # Replace icon library section
         pattern = r'<section class="section">\s*<h2 class="section-title">Icon Library</h2>.*?</section>'
-        content = re.sub(pattern, icon_html, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, icon_html, content, flags=re.DOTALL)
         
         return content
     
@@ -714,7 +737,7 @@ class SelectComponentBuilder:
         
         # Replace examples section
         pattern = r'<section class="section">\s*<h2 class="section-title">Real Estate Use Cases</h2>.*?</section>'
-        content = re.sub(pattern, examples_html, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, examples_html, content, flags=re.DOTALL)
         
         return content
     
@@ -976,11 +999,14 @@ export const useLydSelect = (
 };</code></pre>
         </section>'''
         
+        # TSX-Beispiele beim Build einfärben (kein Highlighting-JS auf der Seite)
+        api_html = highlight_blocks(api_html)
+        
         # Replace API section
         pattern = r'<section class="section api-section">\s*<h2 class="section-title">API Reference</h2>.*?</section>'
-        content = re.sub(pattern, api_html, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, api_html, content, flags=re.DOTALL)
         
-        return content
+        return add_highlight_styles(content)
     
     def create_accessibility_section(self, content):
         """Erstelle Select-spezifische Accessibility."""
@@ -1066,7 +1092,7 @@ export const useLydSelect = (
         
         # Replace accessibility section
         pattern = r'<section class="section">\s*<h2 class="section-title">Accessibility Guidelines</h2>.*?</section>'
-        content = re.sub(pattern, accessibility_html, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, accessibility_html, content, flags=re.DOTALL)
         
         return content
     
@@ -1410,26 +1436,10 @@ export const useLydSelect = (
     def write_file_atomically(self, content):
         """Schreibe Datei atomar."""
         file_path = f'{self.base_path}/select/index.html'
-        temp_path = f'{file_path}.tmp'
         
-        try:
-            # Write to temporary file first
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            # Validate temporary file
-            self.validate_file_content(temp_path)
-            
-            # If validation passes, replace original
-            import shutil
-            shutil.move(temp_path, file_path)
-            print("✅ Select file written atomically and validated")
-            
-        except Exception as e:
-            # Clean up temp file on error
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-            raise e
+        # Temp-Datei im selben Verzeichnis, validieren, dann os.replace (+ fsync)
+        write_atomic(file_path, content, validate=self.validate_file_content)
+        print("✅ Select file written atomically and validated")
     
     def validate_file_content(self, file_path):
         """Validiere Select-spezifischen Content."""
@@ -1463,8 +1473,19 @@ export const useLydSelect = (
 
 def main():
     """Baue professionelle Select-Komponente."""
-    builder = SelectComponentBuilder()
-    builder.build_select_component()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='LYD Design System Select Builder')
+    parser.add_argument('--budget-warn-only', action='store_true',
+                        help='Report pages over their budget without failing the build')
+    args = parser.parse_args()
+    
+    builder = SelectComponentBuilder(budget_warn_only=args.budget_warn_only)
+    try:
+        builder.build_select_component()
+    except BudgetError as error:
+        print(f"\n❌ {error} - nothing written")
+        sys.exit(1)
     
     print("\n🎯 Professional Select system completed!")
     print("📋 Features implemented:")
@@ -5,6 +5,18 @@ Create dedicated Icons page for the design system
 """
 
 import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lyd_ds.svg_optimizer import optimize_html_svgs, format_savings
+from lyd_ds.icon_search import (
+    SEARCH_RUNTIME_JS, build_search_index, parse_icon_library, render_index_script
+)
+from lyd_ds.icon_grid import (
+    VIRTUAL_GRID_CSS, build_grid_data, render_grid_data, render_icon_page_script,
+    virtualize_category_grids
+)
 
 def create_icons_page():
     """Erstelle eine dedizierte Icons-Seite."""
@@ -295,6 +307,11 @@ def create_icons_page():
         </section>
         </div>'''
     
+    # Icon-Karten als Daten statt DOM: Grids werden virtualisiert gerendert
+    icon_entries = parse_icon_library(categories_content)
+    icon_data = build_grid_data(icon_entries)
+    categories_content, static_cards = virtualize_category_grids(categories_content, icon_data)
+    
     # Create Usage Guidelines tab
     usage_content = '''        <!-- Tab Content: Usage Guidelines -->
         <div class="tab-content" id="usage">
@@ -610,7 +627,15 @@ export const Icon: React.FC&lt;IconProps&gt; = ({
 '''
     
     # Add CSS
-    content = content.replace('        \n    </style>', f'{icon_css}        \n    </style>')
+    content = content.replace('        \n    </style>', f'{icon_css}{VIRTUAL_GRID_CSS}        \n    </style>')
+    
+    # Icon-Daten, Suchindex und Virtual-Grid-Script einbetten
+    icon_scripts = (render_grid_data(icon_data) + render_index_script(build_search_index(icon_entries))
+                    + render_icon_page_script(SEARCH_RUNTIME_JS))
+    content = content.replace('</body>', f'{icon_scripts}</body>', 1)
+    
+    # Inline-SVGs optimieren (Koordinaten runden, Pfade zusammenführen)
+    content, svg_stats = optimize_html_svgs(content)
     
     # Write Icons page
     icons_file = f'{icons_dir}/index.html'
@@ -622,6 +647,8 @@ export const Icon: React.FC&lt;IconProps&gt; = ({
     print("  - ✅ 4-tab structure: Overview, Categories, Usage, Implementation")
     print("  - ✅ Comprehensive icon library")
     print("  - ✅ Usage guidelines and examples")
+    print(f"  - ✅ Virtualized icon grid: {len(icon_entries)} icons as data ({static_cards} static cards removed)")
+    print(f"  - {format_savings('icons', svg_stats)}")
 
 def main():
     create_icons_page()
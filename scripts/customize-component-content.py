@@ -5,8 +5,12 @@ Customize content for each component page with proper examples and content.
 
 import os
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lyd_ds.safe_regex import guarded
+
 # High-quality SVG icons (consistent across all components)
 SVG_ICONS = {
     'home': '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5"><path d="M3 9l9-7 9 7v11a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2z"/><polyline points="9,22 9,12 15,12 15,22"/></svg>',
@@ -67,8 +71,8 @@ def customize_inputs_page():
                     </div>
                 </div>'''
     
-    content = re.sub(r'<h2 class="section-title">Button System Overview</h2>.*?</div>\s*</div>', 
-                     overview_content + '\n        </div>', content, flags=re.DOTALL)
+    content = guarded.sub(r'<h2 class="section-title">Button System Overview</h2>.*?</div>\s*</div>', 
+                          overview_content + '\n        </div>', content, flags=re.DOTALL)
     
     # Add luxury input CSS
     input_css = '''
@@ -144,8 +148,8 @@ def customize_inputs_page():
         }'''
     
     # Insert input CSS after button styles
-    content = re.sub(r'(/* Luxury Button Tile Styles \*/.*?\n)', 
-                     r'\1\n' + input_css + '\n', content, flags=re.DOTALL)
+    content = guarded.sub(r'(/* Luxury Button Tile Styles \*/.*?\n)', 
+                          r'\1\n' + input_css + '\n', content, flags=re.DOTALL)
     
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
@@ -203,8 +207,8 @@ def customize_select_page():
                     </div>
                 </div>'''
     
-    content = re.sub(r'<h2 class="section-title">Button System Overview</h2>.*?</div>\s*</div>', 
-                     overview_content + '\n        </div>', content, flags=re.DOTALL)
+    content = guarded.sub(r'<h2 class="section-title">Button System Overview</h2>.*?</div>\s*</div>', 
+                          overview_content + '\n        </div>', content, flags=re.DOTALL)
     
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
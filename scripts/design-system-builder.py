@@ -5,15 +5,28 @@ Systematischer Aufbau aller Component-Seiten mit Validierung und Backup.
 """
 
 import os
+import sys
 import shutil
 import json
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lyd_ds.catalog import ComponentCatalog
+from lyd_ds.page_budget import BudgetError, gate_page
+from lyd_ds.tracing import Tracer
 
 class DesignSystemBuilder:
-    def __init__(self):
+    def __init__(self, tracer=None, budget_warn_only=False):
         self.base_path = '/Users/christianbernecker/live-your-dreams/design-system/components'
         self.template_path = f'{self.base_path}/buttons/index.html'
         self.backup_dir = '/Users/christianbernecker/live-your-dreams/backups'
+        # Component-Definitionen: scripts/component-data/builder/*.json (lazy geladen)
+        self.component_configs = ComponentCatalog('builder')
+        # Stufen-Timing, Trace-Datei via LYD_TRACE=<pfad>
+        self.tracer = tracer or Tracer.from_env('design-system-builder')
+        # Seitengewicht/DOM-Größe gegen "budget" aus der Komponenten-Config
+        self.budget_warn_only = budget_warn_only
         self.ensure_backup_dir()
     
     def ensure_backup_dir(self):
@@ -35,191 +48,41 @@ class DesignSystemBuilder:
     
     def get_input_component_config(self):
         """Definiere Input-Komponenten nach Material Design / Ant Design Standards."""
-        return {
-            'meta': {
-                'title': 'Input Components',
-                'subtitle': 'Complete input system with validation, icons, and specialized components for real estate data entry.',
-                'nav_active': 'inputs'
-            },
-            'overview': {
-                'title': 'Input System Overview',
-                'components': [
-                    {
-                        'name': 'lyd-input-text',
-                        'description': 'Standard text input with luxury styling and validation',
-                        'showcase': '<input type="text" class="luxury-input" placeholder="Property title" value="Luxury Villa Munich" />'
-                    },
-                    {
-                        'name': 'lyd-input-number',
-                        'description': 'Number input for prices, areas, and room counts',
-                        'showcase': '<input type="number" class="luxury-input" placeholder="Price in €" value="2,500,000" />'
-                    },
-                    {
-                        'name': 'lyd-input-email',
-                        'description': 'Email input with built-in validation patterns',
-                        'showcase': '<input type="email" class="luxury-input" placeholder="Contact email" value="agent@liveyourdreams.de" />'
-                    },
-                    {
-                        'name': 'lyd-input-search',
-                        'description': 'Search input with integrated icon and filtering',
-                        'showcase': '''<div style="position: relative;">
-                            <input type="search" class="luxury-input" placeholder="Search properties..." style="padding-left: 48px;" />
-                            <svg style="position: absolute; left: 16px; top: 50%; transform: translateY(-50%); width: 20px; height: 20px; color: #6b7280;" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5"><circle cx="11" cy="11" r="8"/><path d="m21 21-4.35-4.35"/></svg>
-                        </div>'''
-                    },
-                    {
-                        'name': 'lyd-textarea',
-                        'description': 'Multi-line text area for descriptions and notes',
-                        'showcase': '<textarea class="luxury-input" rows="3" placeholder="Property description">Beautiful luxury villa with panoramic views...</textarea>'
-                    },
-                    {
-                        'name': 'lyd-select',
-                        'description': 'Dropdown selection with custom luxury styling',
-                        'showcase': '''<div class="luxury-select">
-                            <div class="luxury-select-trigger">
-                                <span>Apartment</span>
-                                <div class="luxury-select-arrow"><svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><polyline points="6,9 12,15 18,9"/></svg></div>
-                            </div>
-                        </div>'''
-                    }
-                ]
-            },
-            'variants': {
-                'title': 'Input Variants & States',
-                'variants': [
-                    {
-                        'name': 'Default State',
-                        'description': 'Standard input appearance',
-                        'showcase': '''<div>
-                            <label class="luxury-label">Property Title</label>
-                            <input type="text" class="luxury-input" placeholder="Enter property title" />
-                        </div>'''
-                    },
-                    {
-                        'name': 'Success State',
-                        'description': 'Valid input with confirmation',
-                        'showcase': '''<div>
-                            <label class="luxury-label">Property Title</label>
-                            <input type="text" class="luxury-input" value="Luxury Villa Munich" style="border-color: #10b981; box-shadow: 0 0 0 3px rgba(16, 185, 129, 0.1);" />
-                            <div style="margin-top: 6px; font-size: 13px; color: #10b981; display: flex; align-items: center; gap: 6px;">
-                                <svg style="width: 16px; height: 16px;" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><polyline points="20,6 9,17 4,12"/></svg>
-                                Valid property title
-                            </div>
-                        </div>'''
-                    },
-                    {
-                        'name': 'Error State',
-                        'description': 'Invalid input with error message',
-                        'showcase': '''<div>
-                            <label class="luxury-label">Email Address</label>
-                            <input type="email" class="luxury-input" value="invalid-email" style="border-color: #ef4444; box-shadow: 0 0 0 3px rgba(239, 68, 68, 0.1);" />
-                            <div style="margin-top: 6px; font-size: 13px; color: #ef4444; display: flex; align-items: center; gap: 6px;">
-                                <svg style="width: 16px; height: 16px;" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="10"/><line x1="15" y1="9" x2="9" y2="15"/><line x1="9" y1="9" x2="15" y2="15"/></svg>
-                                Please enter a valid email address
-                            </div>
-                        </div>'''
-                    },
-                    {
-                        'name': 'Disabled State',
-                        'description': 'Non-editable input fields',
-                        'showcase': '''<div>
-                            <label class="luxury-label" style="color: #9ca3af;">Property ID</label>
-                            <input type="text" class="luxury-input" value="AUTO-GENERATED" disabled style="background: #f9fafb; color: #9ca3af; cursor: not-allowed;" />
-                        </div>'''
-                    },
-                    {
-                        'name': 'Input Sizes',
-                        'description': 'Small, medium, and large input sizes',
-                        'showcase': '''<div style="display: flex; flex-direction: column; gap: 16px;">
-                            <div>
-                                <label class="luxury-label" style="font-size: 12px;">Small Input</label>
-                                <input type="text" class="luxury-input" placeholder="Small input" style="padding: 10px 16px; min-height: 40px; font-size: 14px;" />
-                            </div>
-                            <div>
-                                <label class="luxury-label">Medium Input (Default)</label>
-                                <input type="text" class="luxury-input" placeholder="Medium input" />
-                            </div>
-                            <div>
-                                <label class="luxury-label" style="font-size: 16px;">Large Input</label>
-                                <input type="text" class="luxury-input" placeholder="Large input" style="padding: 20px 24px; min-height: 64px; font-size: 18px;" />
-                            </div>
-                        </div>'''
-                    }
-                ]
-            },
-            'examples': {
-                'title': 'Real Estate Form Examples',
-                'examples': [
-                    {
-                        'name': 'Property Creation Form',
-                        'description': 'Complete form for adding new properties',
-                        'showcase': '''<div class="form-container" style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px;">
-                            <div>
-                                <label class="luxury-label">Property Title *</label>
-                                <input type="text" class="luxury-input" placeholder="Enter property title" required />
-                            </div>
-                            <div>
-                                <label class="luxury-label">Property Type *</label>
-                                <div class="luxury-select">
-                                    <div class="luxury-select-trigger">
-                                        <span>Select type</span>
-                                        <div class="luxury-select-arrow"><svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><polyline points="6,9 12,15 18,9"/></svg></div>
-                                    </div>
-                                </div>
-                            </div>
-                            <div>
-                                <label class="luxury-label">Price in €</label>
-                                <input type="number" class="luxury-input" placeholder="0" min="0" step="1000" />
-                            </div>
-                            <div>
-                                <label class="luxury-label">Area in m²</label>
-                                <input type="number" class="luxury-input" placeholder="0" min="1" />
-                            </div>
-                        </div>
-                        <div style="margin-top: 24px;">
-                            <label class="luxury-label">Property Description</label>
-                            <textarea class="luxury-input" rows="4" placeholder="Describe the property features, location, and unique selling points..."></textarea>
-                        </div>'''
-                    }
-                ]
-            },
-            'api': {
-                'title': 'Input API Reference',
-                'component': 'lyd-input',
-                'properties': [
-                    {'name': 'type', 'type': 'string', 'default': 'text', 'description': 'Input type: text, email, number, search, tel, url'},
-                    {'name': 'size', 'type': 'string', 'default': 'medium', 'description': 'Input size: small, medium, large'},
-                    {'name': 'state', 'type': 'string', 'default': 'default', 'description': 'Visual state: default, success, error, disabled'},
-                    {'name': 'required', 'type': 'boolean', 'default': 'false', 'description': 'Mark input as required for validation'},
-                    {'name': 'disabled', 'type': 'boolean', 'default': 'false', 'description': 'Disable input interaction'}
-                ]
-            }
-        }
+        return self.component_configs['inputs']
     
     def build_component_page(self, component_name, config):
         """Baue eine Component-Seite mit Validierung."""
         print(f"\n🔄 Building {component_name} component page...")
         
         file_path = f'{self.base_path}/{component_name}/index.html'
+        trace = self.tracer
         
-        # 1. Backup existing file
-        self.backup_file(file_path, component_name)
-        
-        # 2. Load template
-        content = self.load_template()
-        
-        # 3. Apply systematic replacements
-        content = self.apply_meta_data(content, config['meta'])
-        content = self.apply_overview_section(content, config['overview'])
-        content = self.apply_variants_section(content, config['variants'])
-        content = self.apply_examples_section(content, config['examples'])
-        content = self.apply_api_section(content, config['api'])
-        
-        # 4. Add component-specific CSS
-        content = self.add_input_css(content)
-        
-        # 5. Write file with validation
-        self.write_and_validate(file_path, content, component_name)
+        with trace.session(f'build_component_page:{component_name}'):
+            # 1. Backup existing file
+            with trace.stage('backup_file'):
+                self.backup_file(file_path, component_name)
+            
+            # 2. Load template
+            with trace.stage('load_template') as span:
+                content = span.output(self.load_template())
+            
+            # 3. Apply systematic replacements
+            content = trace.run('apply_meta_data', self.apply_meta_data, content, config['meta'])
+            content = trace.run('apply_overview_section', self.apply_overview_section, content, config['overview'])
+            content = trace.run('apply_variants_section', self.apply_variants_section, content, config['variants'])
+            content = trace.run('apply_examples_section', self.apply_examples_section, content, config['examples'])
+            content = trace.run('apply_api_section', self.apply_api_section, content, config['api'])
+            
+            # 4. Add component-specific CSS
+            content = trace.run('add_input_css', self.add_input_css, content)
+            
+            # 5. Budget prüfen - bei Überschreitung wird nichts geschrieben
+            with trace.stage('check_budget', content):
+                gate_page(component_name, content, config, warn_only=self.budget_warn_only)
+            
+            # 6. Write file with validation
+            with trace.stage('write_and_validate', content):
+                self.write_and_validate(file_path, content, component_name)
     
     def apply_meta_data(self, content, meta):
         """Ersetze Meta-Daten (Title, Subtitle, Navigation)."""
@@ -259,7 +122,7 @@ class DesignSystemBuilder:
         
         # Replace entire overview section
         pattern = r'<section class="section">\s*<h2 class="section-title">Button System Overview</h2>.*?</section>'
-        content = re.sub(pattern, new_overview, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, new_overview, content, flags=re.DOTALL)
         
         return content
     
@@ -289,7 +152,7 @@ class DesignSystemBuilder:
         
         # Replace variants section
         pattern = r'<section class="section">\s*<h2 class="section-title">Button Variants</h2>.*?</section>'
-        content = re.sub(pattern, new_variants, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, new_variants, content, flags=re.DOTALL)
         
         return content
     
@@ -315,7 +178,7 @@ class DesignSystemBuilder:
         
         # Replace examples section
         pattern = r'<section class="section">\s*<h2 class="section-title">Real Estate Use Cases</h2>.*?</section>'
-        content = re.sub(pattern, new_examples, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, new_examples, content, flags=re.DOTALL)
         
         return content
     
@@ -358,7 +221,7 @@ class DesignSystemBuilder:
         
         # Replace API section
         pattern = r'<section class="section api-section">\s*<h2 class="section-title">API Reference</h2>.*?</section>'
-        content = re.sub(pattern, new_api, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, new_api, content, flags=re.DOTALL)
         
         return content
     
@@ -507,14 +370,25 @@ class DesignSystemBuilder:
 
 def main():
     """Hauptfunktion für robusten Design System Aufbau."""
-    builder = DesignSystemBuilder()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='LYD Design System Builder')
+    parser.add_argument('--budget-warn-only', action='store_true',
+                        help='Report pages over their budget without failing the build')
+    args = parser.parse_args()
+    
+    builder = DesignSystemBuilder(budget_warn_only=args.budget_warn_only)
     
     print("🚀 Starting robust Design System build...")
     print("📋 Using Material Design / Ant Design best practices")
     
     # Build Inputs page with systematic approach
     config = builder.get_input_component_config()
-    builder.build_component_page('inputs', config)
+    try:
+        builder.build_component_page('inputs', config)
+    except BudgetError as error:
+        print(f"\n❌ {error} - nothing written")
+        sys.exit(1)
     
     print("\n✅ Robust build completed!")
     print("\n📝 Next steps:")
@@ -5,153 +5,53 @@ Generiert konsistente Komponenten mit 4-Tab-Struktur
 """
 
 import os
+import sys
 import json
 import shutil
+from contextlib import nullcontext
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from lyd_ds.atomic import AtomicWriter, write_atomic
+from lyd_ds.catalog import ComponentCatalog
+from lyd_ds.depindex import DependencyIndex
+from lyd_ds.highlight import HIGHLIGHT_CSS, highlight_blocks
+from lyd_ds.page_budget import BudgetError, BudgetGate
+
+TABS = ('variants', 'examples', 'implementation', 'accessibility')
+DEFAULT_TAB = 'variants'
+# template: inaktive Tabs als inertes <template> in der Seite (kein DOM/Layout bis zum Öffnen)
+# fragment: inaktive Tabs als tabs/<tab>.html, erst beim Öffnen geladen (kleinere Seite)
+LAZY_TAB_MODES = ('template', 'fragment')
+
+INDEX_TARGET = '__index__'
+
 class ComponentGenerator:
-    def __init__(self, base_path: str = "/Users/christianbernecker/live-your-dreams"):
+    def __init__(self, base_path: str = "/Users/christianbernecker/live-your-dreams", budget_warn_only: bool = False,
+                 lazy_tabs: Optional[str] = None):
         self.base_path = Path(base_path)
         self.design_system_path = self.base_path / "design-system"
         self.components_path = self.design_system_path / "components"
         self.template_path = self.base_path / "scripts" / "design-system-refactor" / "master-template.html"
         
         # Component-Definitionen basierend auf Porsche Design System
-        self.components = {
-            # Foundation Components (8)
-            "button": {
-                "name": "Button",
-                "description": "Interactive button component with multiple variants, loading states, and icon support for real estate actions.",
-                "category": "foundation",
-                "variants": ["primary", "secondary", "outline", "ghost", "danger"],
-                "sizes": ["small", "medium", "large"],
-                "has_icons": True
-            },
-            "input": {
-                "name": "Input",
-                "description": "Form input component with variants for text, number, email, search, and real estate-specific inputs.",
-                "category": "form",
-                "variants": ["flat", "bordered", "faded", "underlined"],
-                "types": ["text", "email", "password", "number", "search", "tel", "url"],
-                "states": ["default", "success", "error", "disabled"]
-            },
-            "select": {
-                "name": "Select",
-                "description": "Dropdown selection component with search, multi-select, and grouped options for property filtering.",
-                "category": "form",
-                "variants": ["flat", "bordered", "faded", "underlined"],
-                "features": ["searchable", "multiple", "grouped"],
-                "states": ["default", "success", "error", "disabled"]
-            },
-            "textarea": {
-                "name": "Textarea",
-                "description": "Multi-line text input for property descriptions and detailed information.",
-                "category": "form",
-                "variants": ["flat", "bordered", "faded", "underlined"],
-                "features": ["auto-resize", "character-count"],
-                "states": ["default", "success", "error", "disabled"]
-            },
-            "checkbox": {
-                "name": "Checkbox",
-                "description": "Checkbox component for multiple selections in property features and amenities.",
-                "category": "foundation",
-                "variants": ["default", "indeterminate"],
-                "states": ["checked", "unchecked", "disabled"]
-            },
-            "radio": {
-                "name": "Radio",
-                "description": "Radio button component for single-choice selections in property forms.",
-                "category": "foundation",
-                "variants": ["default"],
-                "states": ["selected", "unselected", "disabled"]
-            },
-            "switch": {
-                "name": "Switch",
-                "description": "Toggle switch for binary choices like property availability or feature activation.",
-                "category": "foundation",
-                "variants": ["default"],
-                "states": ["on", "off", "disabled"]
-            },
-            "card": {
-                "name": "Card",
-                "description": "Flexible card component for displaying property information and content organization.",
-                "category": "display",
-                "variants": ["default", "elevated", "outlined"],
-                "features": ["header", "footer", "media"]
-            },
-            "modal": {
-                "name": "Modal",
-                "description": "Dialog component for property details, confirmations, and form overlays.",
-                "category": "feedback",
-                "variants": ["default", "fullscreen", "drawer"],
-                "sizes": ["small", "medium", "large", "xl"]
-            },
-            "accordion": {
-                "name": "Accordion",
-                "description": "Collapsible content sections for property features and FAQ organization.",
-                "category": "feedback",
-                "variants": ["default", "bordered", "splitted"],
-                "features": ["single", "multiple", "animated"]
-            },
-            "tabs": {
-                "name": "Tabs",
-                "description": "Tab navigation for organizing property details and multi-step forms.",
-                "category": "navigation",
-                "variants": ["default", "bordered", "underlined", "solid"],
-                "features": ["scrollable", "vertical"]
-            },
-            "table": {
-                "name": "Table",
-                "description": "Data table component for property listings and lead management.",
-                "category": "display",
-                "variants": ["default", "striped", "bordered"],
-                "features": ["sortable", "selectable", "pagination"]
-            },
-            "toast": {
-                "name": "Toast",
-                "description": "Notification component for success messages, errors, and system feedback.",
-                "category": "feedback",
-                "variants": ["success", "error", "warning", "info"],
-                "positions": ["top-right", "top-center", "bottom-center"]
-            },
-            "spinner": {
-                "name": "Spinner",
-                "description": "Loading indicator for async operations and data fetching.",
-                "category": "feedback",
-                "variants": ["default", "dots", "bars"],
-                "sizes": ["small", "medium", "large"]
-            },
-            "progress": {
-                "name": "Progress",
-                "description": "Progress indicator for multi-step forms and upload operations.",
-                "category": "feedback",
-                "variants": ["linear", "circular"],
-                "features": ["determinate", "indeterminate", "striped"]
-            },
-            "pagination": {
-                "name": "Pagination",
-                "description": "Page navigation for property listings and search results.",
-                "category": "navigation",
-                "variants": ["default", "rounded", "bordered"],
-                "features": ["compact", "siblings", "boundaries"]
-            },
-            "breadcrumb": {
-                "name": "Breadcrumb",
-                "description": "Navigation trail for property hierarchy and site structure.",
-                "category": "navigation",
-                "variants": ["default", "solid"],
-                "separators": ["slash", "chevron", "arrow"]
-            },
-            "stepper": {
-                "name": "Stepper",
-                "description": "Step indicator for property listing creation and multi-step processes.",
-                "category": "navigation",
-                "variants": ["horizontal", "vertical"],
-                "features": ["numbered", "dotted", "alternative"]
-            }
-        }
+        # (scripts/component-data/generator/*.json, erst bei Zugriff geladen)
+        self.components = ComponentCatalog('generator')
+        
+        # Eingaben -> generierte Seiten (für --changed)
+        self.deps = DependencyIndex(self.base_path)
+        
+        # Seitengewicht/DOM-Größe gegen "budget" aus der Komponenten-Config
+        self.budgets = BudgetGate(warn_only=budget_warn_only)
+        
+        # Nur der Standard-Tab inline, Rest lazy (None = alle Tabs inline)
+        if lazy_tabs not in (None, *LAZY_TAB_MODES):
+            raise ValueError(f"lazy_tabs must be one of {', '.join(LAZY_TAB_MODES)}")
+        self.lazy_tabs = lazy_tabs
+        # Fragmente früherer fragment-Builds, erst nach erfolgreichem Schreiben gelöscht
+        self.stale_fragments: List[Path] = []
     
     def generate_variants_content(self, component: Dict) -> str:
         """Generiert den Variants-Tab Inhalt"""
@@ -454,8 +354,9 @@ export default function PropertyForm() {{
         
         return accessibility_html
     
-    def generate_component(self, component_key: str, force: bool = False) -> bool:
-        """Generiert eine einzelne Komponente"""
+    def generate_component(self, component_key: str, force: bool = False,
+                           writer: Optional[AtomicWriter] = None) -> bool:
+        """Generiert eine einzelne Komponente (mit writer: erst beim Commit veröffentlicht)"""
         if component_key not in self.components:
             print(f"❌ Component '{component_key}' not found")
             return False
@@ -477,18 +378,27 @@ export default function PropertyForm() {{
             template = f.read()
         
         # Generate content for each tab
-        variants_content = self.generate_variants_content(component)
-        examples_content = self.generate_examples_content(component)
-        implementation_content = self.generate_implementation_content(component)
-        accessibility_content = self.generate_accessibility_content(component)
+        tab_contents = {
+            'variants': self.generate_variants_content(component),
+            'examples': self.generate_examples_content(component),
+            'implementation': self.generate_implementation_content(component),
+            'accessibility': self.generate_accessibility_content(component),
+        }
+        # Codebeispiele beim Build einfärben (kein Highlighting-JS auf der Seite)
+        tab_contents = {tab: highlight_blocks(content) for tab, content in tab_contents.items()}
         
         # Replace placeholders
         html_content = template.replace('{{COMPONENT_NAME}}', component['name'])
         html_content = html_content.replace('{{COMPONENT_DESCRIPTION}}', component['description'])
-        html_content = html_content.replace('{{VARIANTS_CONTENT}}', variants_content)
-        html_content = html_content.replace('{{EXAMPLES_CONTENT}}', examples_content)
-        html_content = html_content.replace('{{IMPLEMENTATION_CONTENT}}', implementation_content)
-        html_content = html_content.replace('{{ACCESSIBILITY_CONTENT}}', accessibility_content)
+        fragments = {}
+        for tab in TABS:
+            content = tab_contents[tab]
+            if self.lazy_tabs and tab != DEFAULT_TAB:
+                content = self.lazy_panel(component_path, tab, content, fragments)
+            html_content = html_content.replace(f"{{{{{tab.upper()}_CONTENT}}}}", content)
+        tabs_path = component_path / 'tabs'
+        if tabs_path.is_dir():
+            self.stale_fragments += [path for path in tabs_path.glob('*.html') if path not in fragments]
         
         # Set active navigation
         active_placeholder = f"{{{{ACTIVE_{component_key.upper()}}}}}"
@@ -501,13 +411,28 @@ export default function PropertyForm() {{
                 html_content = html_content.replace(placeholder, '')
         
         # Add component-specific styles and JavaScript
-        html_content = html_content.replace('{{COMPONENT_STYLES}}', '')
+        html_content = html_content.replace('{{COMPONENT_STYLES}}', HIGHLIGHT_CSS)
         html_content = html_content.replace('{{COMPONENT_JAVASCRIPT}}', '')
         
-        # Write component file
+        # Budget prüfen; mit writer erst am Ende des Builds (finish_budgets), sonst sofort
+        self.budgets.check(component_key, html_content, component)
+        if writer is None:
+            self.finish_budgets()
+        
+        # Write component file (mit Tab-Fragmenten gemeinsam veröffentlicht)
         output_file = component_path / 'index.html'
-        with open(output_file, 'w') as f:
-            f.write(html_content)
+        with nullcontext(writer) if writer else AtomicWriter() as page_writer:
+            page_writer.write(output_file, html_content)
+            for fragment_file, fragment in fragments.items():
+                page_writer.write(fragment_file, fragment)
+        if writer is None:
+            self.remove_stale_fragments()
+        
+        # Aktiv-Platzhalter hängen an der Schlüsselliste (Manifest), der Inhalt an der Datendatei
+        self.deps.record('component-generator', component_key, output_file, [
+            self.template_path, self.components.source(component_key),
+            self.components.manifest_path, __file__,
+        ], extra_outputs=fragments)
         
         print(f"✅ Generated component: {component['name']} -> {output_file}")
         return True
@@ -517,17 +442,68 @@ export default function PropertyForm() {{
         print("🚀 Starting component generation...")
         print(f"📁 Output directory: {self.components_path}")
         
-        success_count = 0
-        for component_key in self.components.keys():
-            if self.generate_component(component_key, force):
-                success_count += 1
-        
-        print(f"\n✅ Successfully generated {success_count}/{len(self.components)} components")
+        # Alle Seiten + Index gesammelt veröffentlichen (ein fsync pro Verzeichnis)
+        with AtomicWriter() as writer:
+            success_count = 0
+            for component_key in self.components.keys():
+                if self.generate_component(component_key, force, writer):
+                    success_count += 1
+            
+            print(f"\n✅ Successfully generated {success_count}/{len(self.components)} components")
+            
+            # Generate component index
+            self.generate_index(writer)
+            
+            # Über Budget: Exception -> AtomicWriter verwirft alle Seiten
+            self.finish_budgets()
+        self.remove_stale_fragments()
+        self.deps.save()
+    
+    def generate_changed(self, changed: List[str], force: bool = False):
+        """Baut nur die Seiten neu, die von den geänderten Dateien abhängen"""
+        targets = self.deps.select('component-generator', [*self.components.keys(), INDEX_TARGET], changed)
+        if not targets:
+            print("✅ No generated pages depend on the changed files")
+            return
         
-        # Generate component index
-        self.generate_index()
+        print(f"🔁 Rebuilding {len(targets)} affected page(s): {', '.join(targets)}")
+        with AtomicWriter() as writer:
+            for target in targets:
+                if target == INDEX_TARGET:
+                    self.generate_index(writer)
+                else:
+                    self.generate_component(target, force, writer)
+            self.finish_budgets()
+        self.remove_stale_fragments()
+        self.deps.save()
+    
+    def lazy_panel(self, component_path: Path, tab: str, content: str, fragments: Dict[Path, str]) -> str:
+        """Platzhalter für einen inaktiven Tab; das Tab-Script setzt den Inhalt beim
+        ersten Öffnen ein (fragment-Modus: Datei landet in fragments)"""
+        if self.lazy_tabs == 'fragment':
+            fragments[component_path / 'tabs' / f'{tab}.html'] = content.strip() + '\n'
+            return f'<template data-lazy-panel data-src="tabs/{tab}.html"></template>'
+        return f'<template data-lazy-panel>{content}</template>'
     
-    def generate_index(self):
+    def remove_stale_fragments(self):
+        """tabs/-Dateien löschen, die der aktuelle Modus nicht mehr erzeugt (leeres tabs/ mit)"""
+        stale, self.stale_fragments = self.stale_fragments, []
+        for path in stale:
+            path.unlink(missing_ok=True)
+        for tabs_path in {path.parent for path in stale}:
+            if not any(tabs_path.iterdir()):
+                tabs_path.rmdir()
+        if stale:
+            print(f"🗑️  Removed {len(stale)} stale tab fragment(s)")
+    
+    def finish_budgets(self):
+        """Budget-Bericht ausgeben; BudgetError bei Überschreitung (außer warn_only)"""
+        if self.budgets.reports:
+            print("\n📏 Page budgets:")
+            self.budgets.finish()
+            self.budgets.reports = []
+    
+    def generate_index(self, writer: Optional[AtomicWriter] = None):
         """Generiert die Komponenten-Übersichtsseite"""
         index_html = """
 <!DOCTYPE html>
@@ -557,8 +533,15 @@ export default function PropertyForm() {{
         """
         
         index_file = self.components_path / 'index.html'
-        with open(index_file, 'w') as f:
-            f.write(index_html)
+        if writer:
+            writer.write(index_file, index_html)
+        else:
+            write_atomic(index_file, index_html)
+        
+        self.deps.record('component-generator', INDEX_TARGET, index_file, [
+            self.components.manifest_path, __file__,
+            *(self.components.source(key) for key in self.components.keys()),
+        ])
         
         print(f"✅ Generated component index: {index_file}")
 
@@ -571,17 +554,33 @@ def main():
     parser.add_argument('--all', '-a', action='store_true', help='Generate all components')
     parser.add_argument('--force', '-f', action='store_true', help='Force overwrite without backup')
     parser.add_argument('--list', '-l', action='store_true', help='List all available components')
+    parser.add_argument('--changed', nargs='+', metavar='PATH',
+                        help='Regenerate only pages depending on these templates/data files')
+    parser.add_argument('--budget-warn-only', action='store_true',
+                        help='Report pages over their budget without failing the build')
+    parser.add_argument('--lazy-tabs', choices=LAZY_TAB_MODES,
+                        help='Render only the default tab inline, load the others on first activation')
     
     args = parser.parse_args()
     
-    generator = ComponentGenerator()
+    generator = ComponentGenerator(budget_warn_only=args.budget_warn_only, lazy_tabs=args.lazy_tabs)
     
+    try:
+        run(generator, args, parser)
+    except BudgetError as error:
+        print(f"\n❌ {error} - nothing written")
+        sys.exit(1)
+
+def run(generator, args, parser):
     if args.list:
         print("\n📋 Available Components:")
         for key, component in generator.components.items():
             print(f"  • {key}: {component['name']} - {component['category']}")
+    elif args.changed:
+        generator.generate_changed(args.changed, args.force)
     elif args.component:
         generator.generate_component(args.component, args.force)
+        generator.deps.save()
     elif args.all:
         generator.generate_all_components(args.force)
     else:
@@ -4,9 +4,22 @@ LYD Design System V2 - Component Generator
 Erstellt alle Komponenten-Seiten mit konsistenter Struktur
 """
 
+import argparse
 import os
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from lyd_ds.atomic import AtomicWriter
+from lyd_ds.baked_styles import bake_site
+from lyd_ds.js_bundle import build_bundles, print_report
+from lyd_ds.page_assets import include_assets, prune_site_assets, v2_assets
+from lyd_ds.service_worker import build_service_worker
+from lyd_ds.site_search import add_search_boxes, build_site_index
+from lyd_ds.depindex import DependencyIndex
+
+TEMPLATE_PATH = Path("/Users/christianbernecker/live-your-dreams/scripts/design-system-refactor/v2-component-template.html")
+
 # Komponenten-Definitionen
 COMPONENTS = {
     'buttons': 'Button',
@@ -43,11 +56,10 @@ OTHER_PAGES = {
 
 def load_template():
     """Lädt das Master-Template"""
-    template_path = Path("/Users/christianbernecker/live-your-dreams/scripts/design-system-refactor/v2-component-template.html")
-    with open(template_path, 'r', encoding='utf-8') as f:
+    with open(TEMPLATE_PATH, 'r', encoding='utf-8') as f:
         return f.read()
 
-def generate_component_page(component_key, component_name, template):
+def generate_component_page(component_key, component_name, template, assets):
     """Generiert eine Komponenten-Seite"""
     
     # Setze Active-States für Navigation
@@ -61,7 +73,8 @@ def generate_component_page(component_key, component_name, template):
     for key, value in active_states.items():
         content = content.replace('{{' + key + '}}', value)
     
-    return content
+    # Nur die Shared-Dateien der Komponenten, die die Seite tatsächlich enthält
+    return include_assets(content, assets)
 
 def create_directory_structure():
     """Erstellt die V2-Verzeichnisstruktur"""
@@ -79,55 +92,114 @@ def create_directory_structure():
     
     print("✅ Verzeichnisstruktur erstellt")
 
-def generate_all_pages():
-    """Generiert alle Seiten"""
+def generate_all_pages(changed=None):
+    """Generiert alle Seiten (changed: nur die, die von diesen Dateien/Einträgen abhängen)"""
     template = load_template()
     base_path = Path("/Users/christianbernecker/live-your-dreams/design-system/v2")
     
+    # Geänderte COMPONENTS/OTHER_PAGES-Einträge werden über Fingerprints erkannt
+    deps = DependencyIndex(base_path.parents[1])
+    targets = deps.select('generate-v2-components',
+                          [f'components/{key}' for key in COMPONENTS] + list(OTHER_PAGES), changed,
+                          configs=[(__file__, 'COMPONENTS', COMPONENTS), (__file__, 'OTHER_PAGES', OTHER_PAGES)])
+    if changed is not None:
+        print(f"\n🔁 {len(targets)} betroffene Seite(n): {', '.join(targets) or '-'}")
+    # Auslöser der Shared-Dateien aus deren aktuellem Inhalt
+    assets = v2_assets(base_path)
+    # Alle Seiten setzen die Active-Platzhalter aller Komponenten-Schlüssel
+    common_inputs = [TEMPLATE_PATH, __file__, deps.config(__file__, 'COMPONENTS', COMPONENTS)]
+    
     # Komponenten-Seiten generieren
     print("\n🔧 Generiere Komponenten-Seiten...")
     for component_key, component_name in COMPONENTS.items():
-        content = generate_component_page(component_key, component_name, template)
+        if f'components/{component_key}' not in targets:
+            continue
+        content = generate_component_page(component_key, component_name, template, assets)
         
         # Speichere die Seite
         output_file = base_path / "components" / component_key / "index.html"
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(content)
         
+        deps.record('generate-v2-components', f'components/{component_key}', output_file,
+                    common_inputs + [deps.config(__file__, 'COMPONENTS', COMPONENTS, component_key)])
         print(f"  ✅ {component_name} → /v2/components/{component_key}/")
     
     # Andere Seiten generieren (nur mit Headline)
     print("\n📄 Generiere andere Seiten...")
     for page_path, page_name in OTHER_PAGES.items():
+        if page_path not in targets:
+            continue
         content = template.replace('{{COMPONENT_NAME}}', page_name)
         
         # Entferne alle {{ACTIVE}} Platzhalter
         for comp_key in COMPONENTS.keys():
             content = content.replace('{{' + comp_key.upper().replace('-', '_') + '_ACTIVE}}', '')
+        content = include_assets(content, assets)
         
         # Speichere die Seite
         output_file = base_path / page_path / "index.html"
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(content)
         
+        deps.record('generate-v2-components', page_path, output_file,
+                    common_inputs + [deps.config(__file__, 'OTHER_PAGES', OTHER_PAGES, page_path)])
         print(f"  ✅ {page_name} → /v2/{page_path}/")
+    
+    deps.save()
 
 def create_components_index():
     """Erstellt die Components-Übersichtsseite"""
     # Diese bleibt die bestehende index.html im v2-Root
     print("\n📋 Components-Übersichtsseite bereits vorhanden")
 
-def main():
+def main(changed=None):
     print("🚀 LYD Design System V2 - Component Generator")
     print("=" * 50)
     
     # 1. Verzeichnisstruktur erstellen
     create_directory_structure()
     
-    # 2. Alle Seiten generieren
-    generate_all_pages()
+    # 2. Alle (bzw. die betroffenen) Seiten generieren
+    generate_all_pages(changed)
+    
+    # 3. Suchfeld in jede Sidebar; nicht benutzte Shared-Dateien (auch aus Bundles) entfernen
+    v2_root = Path("/Users/christianbernecker/live-your-dreams/design-system/v2")
+    with AtomicWriter() as writer:
+        boxes = add_search_boxes(v2_root, writer)
+    print(f"\n🔎 Suchfeld ergänzt: {len(boxes)} Seiten")
+    with AtomicWriter() as writer:
+        pruned = prune_site_assets(v2_root, writer)
+    print(f"\n✂️  Shared-Dateien reduziert: {len(pruned)} Seiten")
+    for result in pruned:
+        print(f"  • {result['page'].relative_to(v2_root)}: ohne {', '.join(result['removed'])}")
+    
+    # 4. force-consistency.js-Normalisierungen statisch einbacken (kein Layout-Pass zur Laufzeit)
+    with AtomicWriter() as writer:
+        stats = bake_site(Path("/Users/christianbernecker/live-your-dreams/design-system/v2"), writer)
+    print(f"\n🎯 Consistency-Styles eingebacken: {stats['pages']} Seiten, {stats['scripts']} Skript-Tags entfernt")
+    for page in stats['skipped']:
+        print(f"⚠️  {page}: lädt force-consistency.js, aber nicht shared/master.css - unverändert")
+    
+    # 5. Shared-Skripte pro Seitenprofil zu einem defer-Bundle zusammenfassen
+    with AtomicWriter() as writer:
+        report = build_bundles(v2_root, writer)
+    print(f"\n📦 Skript-Bundles: {len(report['bundles'])} Bundles, {len(report['pages'])} Seiten umgestellt")
+    print_report(report, v2_root)
+    
+    # 6. Suchindex (nach Präfix geshardet) über die fertigen Seiten
+    pages = {f'components/{key}': name for key, name in COMPONENTS.items()}
+    pages.update(OTHER_PAGES)
+    with AtomicWriter() as writer:
+        search = build_site_index(v2_root, writer, pages)
+    print(f"\n🔎 Suchindex: {search['docs']} Dokumente, {search['terms']} Terme in {search['shards']} Shards")
+    
+    # 7. Service Worker zuletzt - das Precache-Manifest hasht die fertigen Seiten
+    with AtomicWriter() as writer:
+        worker = build_service_worker(v2_root, writer)
+    print(f"\n📴 Service Worker: {worker['entries']} Precache-Einträge ({worker['assets']} Shared-Dateien)")
     
-    # 3. Zusammenfassung
+    # 8. Zusammenfassung
     print("\n" + "=" * 50)
     print("✨ GENERIERUNG ABGESCHLOSSEN")
     print("=" * 50)
@@ -149,4 +221,7 @@ def main():
     print(f"  ✅ Nur Headlines (bereit für Content)")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description='Generate the v2 component pages')
+    parser.add_argument('--changed', nargs='+', metavar='PATH',
+                        help='Regenerate only pages depending on these files (this script: changed COMPONENTS/OTHER_PAGES entries)')
+    main(changed=parser.parse_args().changed)
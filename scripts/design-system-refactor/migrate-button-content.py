@@ -3,10 +3,17 @@
 Migriert bestehenden Button-Content in neue 4-Tab-Struktur
 """
 
+import argparse
 import re
+import sys
 from pathlib import Path
 
-def migrate_button_content():
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from lyd_ds.atomic import AtomicWriter
+from lyd_ds.dry_run import DiffPreview, TrackedText
+
+def migrate_button_content(dry_run=False):
+    """dry_run: zeigt den Diff gegen die aktuelle Seite, schreibt nichts"""
     # Paths
     old_file = Path("/Users/christianbernecker/live-your-dreams/design-system/components/buttons/index.html.backup-6tabs")
     new_file = Path("/Users/christianbernecker/live-your-dreams/design-system/components/buttons/index.html")
@@ -17,7 +24,7 @@ def migrate_button_content():
     
     # Read new template
     with open(new_file, 'r') as f:
-        new_content = f.read()
+        page = TrackedText(f.read(), track=dry_run)
     
     # Extract valuable content from old file
     
@@ -452,16 +459,16 @@ export default function PropertiesPage() {
     """
     
     # Replace placeholders in new content
-    new_content = new_content.replace('{{VARIANTS_CONTENT}}', variants_section)
-    new_content = new_content.replace('{{EXAMPLES_CONTENT}}', examples_section)
-    new_content = new_content.replace('{{IMPLEMENTATION_CONTENT}}', implementation_section)
-    new_content = new_content.replace('{{ACCESSIBILITY_CONTENT}}', accessibility_section)
+    page.replace('{{VARIANTS_CONTENT}}', variants_section)
+    page.replace('{{EXAMPLES_CONTENT}}', examples_section)
+    page.replace('{{IMPLEMENTATION_CONTENT}}', implementation_section)
+    page.replace('{{ACCESSIBILITY_CONTENT}}', accessibility_section)
     
     # Fix active navigation
-    new_content = new_content.replace('{{ACTIVE_BUTTON}}', 'active')
+    page.replace('{{ACTIVE_BUTTON}}', 'active')
     
     # Remove all other active placeholders
-    new_content = re.sub(r'\{\{ACTIVE_[A-Z_]+\}\}', '', new_content)
+    page.sub(r'\{\{ACTIVE_[A-Z_]+\}\}', '')
     
     # Add button-specific styles
     button_styles = """
@@ -582,12 +589,15 @@ export default function PropertiesPage() {
         }
     """
     
-    new_content = new_content.replace('{{COMPONENT_STYLES}}', button_styles)
-    new_content = new_content.replace('{{COMPONENT_JAVASCRIPT}}', '')
+    page.replace('{{COMPONENT_STYLES}}', button_styles)
+    page.replace('{{COMPONENT_JAVASCRIPT}}', '')
     
     # Write updated content
-    with open(new_file, 'w') as f:
-        f.write(new_content)
+    writer = DiffPreview() if dry_run else AtomicWriter()
+    with writer:
+        writer.write(new_file, page)
+    if dry_run:
+        return
     
     print("✅ Button component migrated to 4-tab structure")
     print("  - Variants tab: Button types, variants, sizes, states")
@@ -596,5 +606,7 @@ export default function PropertiesPage() {
     print("  - Accessibility tab: WCAG guidelines, ARIA")
 
 if __name__ == "__main__":
-    migrate_button_content()
+    parser = argparse.ArgumentParser(description='Migrate button content into the 4-tab structure')
+    parser.add_argument('--dry-run', action='store_true', help='Show a unified diff, write nothing')
+    migrate_button_content(dry_run=parser.parse_args().dry_run)
 
@@ -7,27 +7,36 @@ Prüft alle Komponenten gegen die definierten Standards
 import os
 import sys
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import URLError
-import json
 from datetime import datetime
 
+# lyd_ds-Module und urllib erst bei Bedarf importieren (Startzeit)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
 class ComponentValidator:
-    def __init__(self):
+    def __init__(self, base_url=None):
         self.base_path = Path("/Users/christianbernecker/live-your-dreams/design-system/components")
-        self.base_url = "http://designsystem.liveyourdreams.online/components"
-        self.results = {}
+        # None: lokaler Server auf design-system/v2 statt der Produktions-Domain,
+        # gestartet erst beim ersten Live-Check
+        self._base_url = base_url
+        self.output_file = Path("/Users/christianbernecker/live-your-dreams/docs/design-system/validation-results.ndjson")
+        self.summary = None
+    
+    @property
+    def base_url(self) -> str:
+        if self._base_url is None:
+            from lyd_ds.static_server import local_url, site_root
+            self._base_url = local_url(site_root(self.base_path.parents[1]))
+        return self._base_url + "/components"
         
-    def validate_component(self, component_dir):
+    def validate_component(self, component_dir) -> 'ValidationRecord':
         """Validiert eine einzelne Komponente"""
+        from lyd_ds.results import ValidationRecord
+        
         component_name = component_dir.name
         index_file = component_dir / "index.html"
         
         if not index_file.exists():
-            return {
-                "exists": False,
-                "checks": {}
-            }
+            return ValidationRecord(component_name, "missing", checks={})
         
         with open(index_file, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -51,13 +60,7 @@ class ComponentValidator:
         total = len(checks)
         score = (passed / total) * 100
         
-        return {
-            "exists": True,
-            "checks": checks,
-            "score": score,
-            "passed": passed,
-            "total": total
-        }
+        return ValidationRecord(component_name, "pass" if passed == total else "fail", score, checks=checks)
     
     def check_logo(self, content):
         """Prüft ob das korrekte Logo verwendet wird"""
@@ -157,6 +160,8 @@ class ComponentValidator:
     
     def check_live_url(self, component_name):
         """Prüft ob die Live-URL erreichbar ist"""
+        from urllib.request import urlopen, Request
+        
         url = f"{self.base_url}/{component_name}/"
         try:
             req = Request(url, headers={'User-Agent': 'Mozilla/5.0'})
@@ -172,110 +177,96 @@ class ComponentValidator:
         print("="*80)
         print(f"\n📅 Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"📁 Base Path: {self.base_path}")
-        print(f"🌐 Base URL: {self.base_url}\n")
+        print(f"🌐 Base URL: {self._base_url or 'local server (design-system/v2)'}\n")
         print("="*80)
         
-        components = sorted([d for d in self.base_path.iterdir() 
-                           if d.is_dir() and not d.name.startswith('_')])
+        # Nur Namen sortieren (Path-Objekte erst pro Komponente)
+        components = sorted(entry.name for entry in os.scandir(self.base_path)
+                            if entry.is_dir() and not entry.name.startswith('_'))
         
-        total_score = 0
-        component_count = 0
-        
-        # Detaillierte Ergebnisse
-        for component_dir in components:
-            result = self.validate_component(component_dir)
-            self.results[component_dir.name] = result
-            
-            if result["exists"]:
-                component_count += 1
-                total_score += result["score"]
-                
-                # Status-Symbol basierend auf Score
-                if result["score"] >= 90:
-                    status = "✅"
-                elif result["score"] >= 70:
-                    status = "⚠️"
-                else:
-                    status = "❌"
-                
-                print(f"\n{status} {component_dir.name.upper()} - Score: {result['score']:.1f}% ({result['passed']}/{result['total']})")
-                print("  " + "-"*40)
-                
-                for check_name, passed in result["checks"].items():
-                    icon = "✓" if passed else "✗"
-                    check_display = check_name.replace("_", " ").title()
-                    print(f"  {icon} {check_display}")
+        # Ergebnisse werden während der Validierung exportiert (NDJSON, Zusammenfassung online)
+        self.summary = self.export_results(self.iter_results(components))
+        summary = self.summary
         
         # Zusammenfassung
         print("\n" + "="*80)
         print("📊 ZUSAMMENFASSUNG")
         print("="*80)
         
-        if component_count > 0:
-            avg_score = total_score / component_count
+        if summary.scored > 0:
+            avg_score = summary.average_score
             print(f"\n🎯 Durchschnittlicher Score: {avg_score:.1f}%")
-            print(f"📦 Komponenten geprüft: {component_count}")
+            print(f"📦 Komponenten geprüft: {summary.scored}")
             
             # Top Issues
             print("\n⚠️  HÄUFIGSTE PROBLEME:")
-            issue_counts = {}
-            for comp_name, result in self.results.items():
-                if result["exists"]:
-                    for check_name, passed in result["checks"].items():
-                        if not passed:
-                            if check_name not in issue_counts:
-                                issue_counts[check_name] = []
-                            issue_counts[check_name].append(comp_name)
-            
-            sorted_issues = sorted(issue_counts.items(), key=lambda x: len(x[1]), reverse=True)
-            for issue, components in sorted_issues[:5]:
+            for issue, count in summary.top_issues(5):
                 issue_display = issue.replace("_", " ").title()
-                print(f"  • {issue_display}: {len(components)} Komponenten")
-                if len(components) <= 3:
-                    print(f"    Betroffen: {', '.join(components)}")
+                print(f"  • {issue_display}: {count} Komponenten")
+                if count <= 3:
+                    print(f"    Betroffen: {', '.join(summary.examples[issue])}")
             
             # Empfehlungen
+            issue_counts = summary.issues
             print("\n💡 EMPFEHLUNGEN:")
-            if "correct_logo" in issue_counts and len(issue_counts["correct_logo"]) > 0:
+            if issue_counts["correct_logo"] > 0:
                 print("  1. Logo-Migration: Alle Komponenten auf Live_Your_Dreams_Perfect.svg umstellen")
             if avg_score < 80:
                 print("  2. Premium-Upgrade: Micro-Animationen und Glassmorphism hinzufügen")
             if "navigation_consistent" in issue_counts:
                 print("  3. Navigation-Fix: Einheitliche Sidebar auf allen Seiten implementieren")
-            if "accessibility" in issue_counts and len(issue_counts["accessibility"]) > 3:
+            if issue_counts["accessibility"] > 3:
                 print("  4. A11y-Verbesserung: ARIA-Labels und Keyboard-Navigation ergänzen")
         
         print("\n" + "="*80)
         print("✨ Validation Complete")
         print("="*80 + "\n")
+        print(f"📄 Ergebnisse exportiert nach: {self.output_file}")
         
-        # Export Ergebnisse als JSON
-        self.export_results()
-        
-        return avg_score if component_count > 0 else 0
+        return summary.average_score
     
-    def export_results(self):
-        """Exportiert Ergebnisse als JSON"""
-        output_file = Path("/Users/christianbernecker/live-your-dreams/docs/design-system/validation-results.json")
-        
-        export_data = {
-            "timestamp": datetime.now().isoformat(),
-            "components": self.results,
-            "summary": {
-                "total_components": len(self.results),
-                "average_score": sum(r["score"] for r in self.results.values() if r["exists"]) / 
-                               sum(1 for r in self.results.values() if r["exists"])
-                               if any(r["exists"] for r in self.results.values()) else 0
-            }
-        }
-        
-        with open(output_file, 'w') as f:
-            json.dump(export_data, f, indent=2)
+    def iter_results(self, components):
+        """Validiert und gibt jede Komponente aus, sobald sie fertig ist"""
+        for component_name in components:
+            component_dir = self.base_path / component_name
+            record = self.validate_component(component_dir)
+            
+            if record.status != "missing":
+                # Status-Symbol basierend auf Score
+                if record.score >= 90:
+                    status = "✅"
+                elif record.score >= 70:
+                    status = "⚠️"
+                else:
+                    status = "❌"
+                
+                passed = len(record.checks) - len(record.failed_checks)
+                print(f"\n{status} {component_dir.name.upper()} - Score: {record.score:.1f}% ({passed}/{len(record.checks)})")
+                print("  " + "-"*40)
+                
+                for check_name, ok in record.checks.items():
+                    icon = "✓" if ok else "✗"
+                    check_display = check_name.replace("_", " ").title()
+                    print(f"  {icon} {check_display}")
+            
+            yield record
+    
+    def export_results(self, records) -> 'RunSummary':
+        """Schreibt Ergebnisse als NDJSON, jede Zeile sobald das Ergebnis vorliegt"""
+        from lyd_ds.history import HISTORY_NAME, ValidationHistory
+        from lyd_ds.results import ResultStream
         
-        print(f"📄 Ergebnisse exportiert nach: {output_file}")
+        history = ValidationHistory(self.output_file.parent / HISTORY_NAME)
+        with ResultStream(self.output_file, history, validator="validate-all-components") as stream:
+            for record in records:
+                stream.write(record)
+        return stream.summary
 
 def main():
-    validator = ComponentValidator()
+    import argparse
+    parser = argparse.ArgumentParser(description='Validate all components')
+    parser.add_argument('--base-url', help='Site for the live URL check (default: local server on design-system/v2)')
+    validator = ComponentValidator(parser.parse_args().base_url)
     score = validator.validate_all()
     
     # Exit-Code basierend auf Score
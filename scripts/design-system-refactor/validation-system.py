@@ -6,21 +6,25 @@ Automatische Qualitätssicherung für alle Komponenten
 
 import os
 import re
+import sys
 import json
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 import html.parser
-import urllib.request
-import urllib.error
+
+# lyd_ds-Module erst bei Bedarf importieren (Startzeit von validate -c)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 class DesignSystemValidator:
-    def __init__(self, base_path: str = "/Users/christianbernecker/live-your-dreams"):
+    def __init__(self, base_path: str = "/Users/christianbernecker/live-your-dreams",
+                 base_url: Optional[str] = None):
         self.base_path = Path(base_path)
         self.design_system_path = self.base_path / "design-system"
         self.components_path = self.design_system_path / "components"
-        self.base_url = "http://designsystem.liveyourdreams.online"
+        # None: lokaler Server auf dem generierten Baum (offline, deterministisch)
+        self.base_url = base_url
         
         # Validation Rules
         self.required_tabs = ["variants", "examples", "implementation", "accessibility"]
@@ -33,19 +37,21 @@ class DesignSystemValidator:
             "tab-content": True
         }
         
-        self.validation_results = []
         self.auto_fixes = []
     
     def validate_component(self, component_name: str, fix: bool = True) -> Dict:
         """Validiert eine einzelne Komponente"""
+        return self.check_component(component_name, fix).to_dict()
+    
+    def check_component(self, component_name: str, fix: bool = True) -> 'ValidationRecord':
+        """Validiert eine Komponente und liefert den kompakten Ergebnis-Record"""
+        from lyd_ds.results import ValidationRecord
+        
         component_path = self.components_path / component_name / "index.html"
         
         if not component_path.exists():
-            return {
-                "component": component_name,
-                "status": "missing",
-                "errors": [f"Component file not found: {component_path}"]
-            }
+            return ValidationRecord(component_name, "missing",
+                                    errors=[f"Component file not found: {component_path}"])
         
         with open(component_path, 'r') as f:
             content = f.read()
@@ -100,23 +106,28 @@ class DesignSystemValidator:
         if 'typescript' not in content.lower() and 'tsx' not in content.lower():
             warnings.append("⚠️ No TypeScript examples found")
         
+        # Regel-Ergebnisse für den Verlauf (lyd_ds.history)
+        lowered = content.lower()
+        checks = {
+            "tab_count": len(tabs) == 4,
+            "required_tabs": all(tab in tab_names for tab in self.required_tabs),
+            "no_forbidden_classes": not any(forbidden in content for forbidden in self.forbidden_classes),
+            "web_components": len(web_components) >= 1,
+            "sidebar_present": '<nav class="sidebar">' in content,
+            "active_navigation": 'nav-item active' in content,
+            "aria_attributes": 'aria-' in lowered,
+            "role_attributes": 'role=' in lowered,
+            "typescript_examples": 'typescript' in lowered or 'tsx' in lowered,
+        }
+        
         # Calculate score
         score = 100
         score -= len(errors) * 10
         score -= len(warnings) * 3
         score = max(0, score)
         
-        result = {
-            "component": component_name,
-            "status": "fail" if errors else "pass",
-            "score": score,
-            "errors": errors,
-            "warnings": warnings,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        self.validation_results.append(result)
-        return result
+        return ValidationRecord(component_name, "fail" if errors else "pass", score, errors, warnings,
+                                checks, timestamp=datetime.now().isoformat())
     
     def fix_tab_structure(self, component_path: Path, content: str):
         """Korrigiert die Tab-Struktur auf 4 Tabs"""
@@ -177,7 +188,14 @@ class DesignSystemValidator:
     
     def validate_live_url(self, component_name: str) -> Dict:
         """Validiert die Live-URL einer Komponente"""
-        url = f"{self.base_url}/components/{component_name}/"
+        # Lazy import: urllib.request kostet ~60ms Startzeit, gebraucht nur für --live
+        # (ebenso der lokale Server: http.server, Thread-Pool)
+        import urllib.request
+        import urllib.error
+        from lyd_ds.static_server import local_url, site_root
+        
+        base_url = self.base_url or local_url(site_root(self.base_path))
+        url = f"{base_url}/components/{component_name}/"
         
         try:
             with urllib.request.urlopen(url, timeout=10) as response:
@@ -224,78 +242,68 @@ class DesignSystemValidator:
             }
     
     def validate_all_components(self, fix: bool = True) -> Dict:
-        """Validiert alle Komponenten"""
+        """Validiert alle Komponenten (Ergebnisse werden laufend als NDJSON geschrieben)"""
         print("🔍 Starting Design System Validation...")
         print("=" * 60)
         
         # Find all components
-        components = [d.name for d in self.components_path.iterdir() if d.is_dir()]
-        
-        total_score = 0
-        passed = 0
-        failed = 0
-        
-        for component in sorted(components):
-            print(f"\n📋 Validating: {component}")
-            result = self.validate_component(component, fix)
-            
-            if result['status'] == 'pass':
-                print(f"  ✅ PASSED (Score: {result['score']})")
-                passed += 1
-            else:
-                print(f"  ❌ FAILED (Score: {result['score']})")
-                failed += 1
+        components = sorted(d.name for d in self.components_path.iterdir() if d.is_dir())
+        
+        from lyd_ds.history import HISTORY_NAME, ValidationHistory
+        from lyd_ds.results import ResultStream
+        
+        results_file = self.base_path / "validation-results.ndjson"
+        history = ValidationHistory(self.base_path / HISTORY_NAME)
+        with ResultStream(results_file, history, validator="validation-system", fix=fix) as stream:
+            for component in components:
+                print(f"\n📋 Validating: {component}")
+                record = self.check_component(component, fix)
+                # Fixes gehören zum Record, die Liste wächst nicht über den Lauf
+                record.fixes, self.auto_fixes = self.auto_fixes, []
+                stream.write(record)
                 
-                if result['errors']:
-                    print("  Errors:")
-                    for error in result['errors']:
-                        print(f"    {error}")
-                
-                if result.get('warnings'):
-                    print("  Warnings:")
-                    for warning in result['warnings']:
-                        print(f"    {warning}")
-            
-            total_score += result['score']
+                if record.status == 'pass':
+                    print(f"  ✅ PASSED (Score: {record.score})")
+                else:
+                    print(f"  ❌ FAILED (Score: {record.score})")
+                    
+                    if record.errors:
+                        print("  Errors:")
+                        for error in record.errors:
+                            print(f"    {error}")
+                    
+                    if record.warnings:
+                        print("  Warnings:")
+                        for warning in record.warnings:
+                            print(f"    {warning}")
         
         # Summary
-        avg_score = total_score / len(components) if components else 0
+        summary = stream.summary
+        # Nenner wie bisher: alle Komponenten, fehlende zählen mit Score 0
+        average_score = summary.score_total / summary.total if summary.total else 0
         
         print("\n" + "=" * 60)
         print("📊 VALIDATION SUMMARY")
         print("=" * 60)
-        print(f"Total Components: {len(components)}")
-        print(f"Passed: {passed} ✅")
-        print(f"Failed: {failed} ❌")
-        print(f"Average Score: {avg_score:.1f}/100")
-        
-        if self.auto_fixes:
-            print(f"\n🔧 Auto-fixes applied: {len(self.auto_fixes)}")
-            for fix in self.auto_fixes[:5]:  # Show first 5 fixes
+        print(f"Total Components: {summary.total}")
+        print(f"Passed: {summary.passed} ✅")
+        print(f"Failed: {summary.failed + summary.missing} ❌")
+        if summary.missing:
+            print(f"  davon ohne index.html: {summary.missing} (Score 0)")
+        print(f"Average Score: {average_score:.1f}/100")
+        
+        if summary.fix_count:
+            print(f"\n🔧 Auto-fixes applied: {summary.fix_count}")
+            for fix in summary.fix_examples:  # Show first 5 fixes
                 print(f"  {fix}")
         
-        # Save results
-        results_file = self.base_path / "validation-results.json"
-        with open(results_file, 'w') as f:
-            json.dump({
-                "timestamp": datetime.now().isoformat(),
-                "summary": {
-                    "total": len(components),
-                    "passed": passed,
-                    "failed": failed,
-                    "average_score": avg_score
-                },
-                "components": self.validation_results,
-                "auto_fixes": self.auto_fixes
-            }, f, indent=2)
-        
-        print(f"\n💾 Results saved to: {results_file}")
+        print(f"\n💾 Results saved to: {results_file} (history: {history.path})")
         
         return {
-            "total": len(components),
-            "passed": passed,
-            "failed": failed,
-            "average_score": avg_score
+            "total": summary.total,
+            "passed": summary.passed,
+            "failed": summary.failed + summary.missing,
+            "average_score": average_score
         }
     
     def continuous_validation(self):
@@ -333,10 +341,11 @@ def main():
     parser.add_argument('--live', '-l', action='store_true', help='Validate live URLs')
     parser.add_argument('--fix', '-f', action='store_true', help='Auto-fix issues', default=True)
     parser.add_argument('--watch', '-w', action='store_true', help='Continuous validation')
+    parser.add_argument('--base-url', help='Site for --live (default: local server on design-system/v2)')
     
     args = parser.parse_args()
     
-    validator = DesignSystemValidator()
+    validator = DesignSystemValidator(base_url=args.base_url)
     
     if args.component:
         result = validator.validate_component(args.component, args.fix)
@@ -1,7 +1,15 @@
 #!/usr/bin/env python3
 
+import argparse
 import os
 import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lyd_ds.depindex import DependencyIndex
+
+GLOBAL_TEMPLATE = 'design-system/templates/global-template.html'
 
 # Komponenten-Definitionen
 components = {
@@ -452,7 +460,7 @@ def generate_component(name, config):
     """Generiert eine Komponenten-HTML-Datei"""
     
     # Template laden
-    with open('design-system/templates/global-template.html', 'r') as f:
+    with open(GLOBAL_TEMPLATE, 'r') as f:
         template = f.read()
     
     # Platzhalter ersetzen
@@ -697,8 +705,21 @@ def generate_component(name, config):
     
     print(f"✅ {config['title']} erstellt")
 
-# Alle Komponenten generieren
-for name, config in components.items():
-    generate_component(name, config)
+def main(changed=None):
+    """Alle Komponenten generieren (changed: nur die, die von diesen Dateien/Einträgen abhängen)"""
+    deps = DependencyIndex(Path(__file__).resolve().parent.parent)
+    names = deps.select('generate-components', components.keys(), changed,
+                        configs=[(__file__, 'components', components)])
+    for name in names:
+        generate_component(name, components[name])
+        deps.record('generate-components', name, f'design-system/components/{name}/index.html',
+                    [GLOBAL_TEMPLATE, __file__, deps.config(__file__, 'components', components, name)])
+    deps.save()
+    
+    print(f"🎉 {len(names)} Komponenten erfolgreich generiert!")
 
-print("🎉 Alle Komponenten erfolgreich generiert!")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Generate component pages from the global template')
+    parser.add_argument('--changed', nargs='+', metavar='PATH',
+                        help='Regenerate only pages depending on these files (this script: changed components entries)')
+    main(changed=parser.parse_args().changed)
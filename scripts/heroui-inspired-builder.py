@@ -5,43 +5,65 @@ Implementiert robuste Input-Komponenten nach HeroUI-Standards mit Porsche-Qualit
 """
 
 import os
-import shutil
+import sys
 import re
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lyd_ds.atomic import write_atomic
+from lyd_ds.catalog import ComponentCatalog
+from lyd_ds.highlight import add_highlight_styles, highlight_blocks
+from lyd_ds.page_budget import BudgetError, gate_page
+from lyd_ds.tracing import Tracer
 
 class HeroUIInspiredBuilder:
-    def __init__(self):
+    def __init__(self, tracer=None, budget_warn_only=False):
         self.base_path = '/Users/christianbernecker/live-your-dreams/design-system/components'
         self.template_path = f'{self.base_path}/buttons/index.html'
+        # Stufen-Timing, Trace-Datei via LYD_TRACE=<pfad>
+        self.tracer = tracer or Tracer.from_env('heroui-inspired-builder')
+        # Seitengewicht/DOM-Größe gegen "budget" aus builder/inputs.json
+        self.budget_warn_only = budget_warn_only
         
     def create_stable_inputs_page(self):
         """Erstelle eine stabile, HeroUI-inspirierte Inputs-Seite."""
         print("🚀 Building HeroUI-inspired Input Components...")
         
-        # Load clean template
-        with open(self.template_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 1. Update Meta Information
-        content = self.update_meta_info(content)
-        
-        # 2. Create Overview Section (HeroUI-style)
-        content = self.create_overview_section(content)
-        
-        # 3. Create Variants Section (HeroUI-style)
-        content = self.create_variants_section(content)
-        
-        # 4. Create Examples Section
-        content = self.create_examples_section(content)
+        trace = self.tracer
         
-        # 5. Create API Section
-        content = self.create_api_section(content)
-        
-        # 6. Add Input-specific CSS
-        content = self.add_heroui_inspired_css(content)
-        
-        # 7. Write file atomically
-        self.write_file_atomically(content)
+        with trace.session('create_stable_inputs_page'):
+            # Load clean template
+            with trace.stage('load_template') as span:
+                with open(self.template_path, 'r', encoding='utf-8') as f:
+                    content = span.output(f.read())
+            
+            # 1. Update Meta Information
+            content = trace.run('update_meta_info', self.update_meta_info, content)
+            
+            # 2. Create Overview Section (HeroUI-style)
+            content = trace.run('create_overview_section', self.create_overview_section, content)
+            
+            # 3. Create Variants Section (HeroUI-style)
+            content = trace.run('create_variants_section', self.create_variants_section, content)
+            
+            # 4. Create Examples Section
+            content = trace.run('create_examples_section', self.create_examples_section, content)
+            
+            # 5. Create API Section
+            content = trace.run('create_api_section', self.create_api_section, content)
+            
+            # 6. Add Input-specific CSS
+            content = trace.run('add_heroui_inspired_css', self.add_heroui_inspired_css, content)
+            
+            # 7. Budget prüfen - bei Überschreitung wird nichts geschrieben
+            with trace.stage('check_budget', content):
+                gate_page('inputs', content, ComponentCatalog('builder')['inputs'],
+                          warn_only=self.budget_warn_only)
+            
+            # 8. Write file atomically
+            with trace.stage('write_file_atomically', content):
+                self.write_file_atomically(content)
         
         print("✅ HeroUI-inspired Inputs page created successfully!")
     
@@ -151,7 +173,7 @@ class HeroUIInspiredBuilder:
         
         # Replace overview section completely
         pattern = r'<section class="section">\s*<h2 class="section-title">Button System Overview</h2>.*?</section>'
-        content = re.sub(pattern, overview_html, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, overview_html, content, flags=re.DOTALL)
         
         return content
     
@@ -308,7 +330,7 @@ class HeroUIInspiredBuilder:
         
         # Replace variants section
         pattern = r'<section class="section">\s*<h2 class="section-title">Button Variants</h2>.*?</section>'
-        content = re.sub(pattern, variants_html, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, variants_html, content, flags=re.DOTALL)
         
         return content
     
@@ -436,7 +458,7 @@ class HeroUIInspiredBuilder:
         
         # Replace examples section
         pattern = r'<section class="section">\s*<h2 class="section-title">Real Estate Use Cases</h2>.*?</section>'
-        content = re.sub(pattern, examples_html, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, examples_html, content, flags=re.DOTALL)
         
         return content
     
@@ -588,11 +610,14 @@ export default function CreatePropertyPage() {
 }</code></pre>
         </section>'''
         
+        # TSX-Beispiele beim Build einfärben (kein Highlighting-JS auf der Seite)
+        api_html = highlight_blocks(api_html)
+        
         # Replace API section
         pattern = r'<section class="section api-section">\s*<h2 class="section-title">API Reference</h2>.*?</section>'
-        content = re.sub(pattern, api_html, content, flags=re.DOTALL)
+        content = self.tracer.sub(pattern, api_html, content, flags=re.DOTALL)
         
-        return content
+        return add_highlight_styles(content)
     
     def add_heroui_inspired_css(self, content):
         """Füge HeroUI-inspirierte CSS-Klassen hinzu."""
@@ -899,25 +924,10 @@ export default function CreatePropertyPage() {
     def write_file_atomically(self, content):
         """Schreibe Datei atomar (alles oder nichts)."""
         file_path = f'{self.base_path}/inputs/index.html'
-        temp_path = f'{file_path}.tmp'
         
-        try:
-            # Write to temporary file first
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            # Validate temporary file
-            self.validate_file_content(temp_path)
-            
-            # If validation passes, replace original
-            shutil.move(temp_path, file_path)
-            print("✅ File written atomically and validated")
-            
-        except Exception as e:
-            # Clean up temp file on error
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-            raise e
+        # Temp-Datei im selben Verzeichnis, validieren, dann os.replace (+ fsync)
+        write_atomic(file_path, content, validate=self.validate_file_content)
+        print("✅ File written atomically and validated")
     
     def validate_file_content(self, file_path):
         """Validiere Datei-Inhalt."""
@@ -950,8 +960,19 @@ export default function CreatePropertyPage() {
 
 def main():
     """Baue robuste Input-Komponente nach HeroUI-Standards."""
-    builder = HeroUIInspiredBuilder()
-    builder.create_stable_inputs_page()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='LYD Design System HeroUI Inputs Builder')
+    parser.add_argument('--budget-warn-only', action='store_true',
+                        help='Report pages over their budget without failing the build')
+    args = parser.parse_args()
+    
+    builder = HeroUIInspiredBuilder(budget_warn_only=args.budget_warn_only)
+    try:
+        builder.create_stable_inputs_page()
+    except BudgetError as error:
+        print(f"\n❌ {error} - nothing written")
+        sys.exit(1)
     
     print("\n🎯 HeroUI-inspired Input system completed!")
     print("📋 Features implemented:")
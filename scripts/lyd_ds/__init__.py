@@ -0,0 +1,4 @@
+"""
+LYD Design System - Build Helpers
+Gemeinsame Bausteine für die Design-System-Skripte
+"""
@@ -0,0 +1,149 @@
+"""
+LYD Design System - Atomic Writes
+Ausgabedateien als Temp-Dateien im Zielverzeichnis vorbereiten, validieren und
+gesammelt per os.replace veröffentlichen (ein Verzeichnis-fsync pro Verzeichnis)
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+FSYNC_ENV = 'LYD_FSYNC'
+
+Content = Union[str, bytes, Any]
+Validator = Callable[[str], None]
+
+
+def _default_mode() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return 0o666 & ~mask
+
+
+def fsync_directory(directory: Path):
+    """Macht Umbenennungen im Verzeichnis dauerhaft (nicht überall möglich, z.B. Windows)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class AtomicWriter:
+    """Sammelt Ausgabedateien und veröffentlicht sie erst bei commit().
+
+    write() schreibt in eine Temp-Datei neben dem Ziel (gleiches Dateisystem, also
+    kein Kopieren wie bei shutil.move) und ruft validate(temp_path) auf; schlägt das
+    fehl, wird die Temp-Datei gelöscht und die Exception weitergereicht - eine zuvor
+    gestagte Version desselben Ziels bleibt erhalten. Als Kontextmanager wird am Ende
+    committet, bei einer Exception (also auch einer ungefangenen Validierung) werden
+    alle Temp-Dateien gelöscht und nichts veröffentlicht. Wer einzelne Dateien
+    überspringen will, fängt die Exception von write() selbst ab.
+    """
+
+    def __init__(self, durable: Optional[bool] = None):
+        if durable is None:
+            durable = os.environ.get(FSYNC_ENV, '1') != '0'
+        self.durable = durable
+        self._staged: Dict[Path, str] = {}
+        self._mode = None
+
+    def write(self, path, content: Content, validate: Optional[Validator] = None,
+              encoding: str = 'utf-8') -> Path:
+        # str, bytes oder TrackedText (lyd_ds.dry_run)
+        data = content if isinstance(content, bytes) else str(content).encode(encoding)
+        return self.write_chunks(path, (data,), validate, encoding)
+
+    def write_chunks(self, path, chunks: Iterable[Union[str, bytes]], validate: Optional[Validator] = None,
+                     encoding: str = 'utf-8') -> Path:
+        """Wie write(), aber blockweise (z.B. aus lyd_ds.streaming) - der Inhalt liegt nie ganz im Speicher"""
+        target = Path(path)
+        fd, temp_path = self._open_temp(target)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk if isinstance(chunk, bytes) else chunk.encode(encoding))
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.chmod(temp_path, self._target_mode(target))
+            if validate:
+                validate(temp_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        previous = self._staged.pop(target, None)
+        if previous:
+            os.unlink(previous)
+        self._staged[target] = temp_path
+        return target
+
+    def _open_temp(self, target: Path):
+        # Wie tempfile.mkstemp, aber mit lesbarem Namen: .index.html.<pid>.<n>.tmp
+        counter = len(self._staged)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            temp_path = str(target.parent / f'.{target.name}.{os.getpid()}.{counter}.tmp')
+            try:
+                return os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), temp_path
+            except FileExistsError:
+                counter += 1
+
+    def _target_mode(self, target: Path) -> int:
+        try:
+            return target.stat().st_mode & 0o777
+        except OSError:
+            if self._mode is None:
+                self._mode = _default_mode()
+            return self._mode
+
+    @property
+    def pending(self) -> int:
+        return len(self._staged)
+
+    def commit(self) -> int:
+        """Ersetzt alle Ziele; danach ein fsync pro betroffenem Verzeichnis"""
+        directories = set()
+        staged, self._staged = self._staged, {}
+        try:
+            for target in list(staged):
+                os.replace(staged[target], target)
+                del staged[target]
+                directories.add(target.parent)
+        finally:
+            for temp_path in staged.values():
+                os.unlink(temp_path)
+        if self.durable:
+            for directory in directories:
+                fsync_directory(directory)
+        return len(directories)
+
+    def abort(self):
+        staged, self._staged = self._staged, {}
+        for temp_path in staged.values():
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> 'AtomicWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+
+def write_atomic(path, content: Content, validate: Optional[Validator] = None,
+                 encoding: str = 'utf-8', durable: Optional[bool] = None) -> Path:
+    """Einzelne Datei atomar schreiben (Temp-Datei, validate, os.replace, fsync)"""
+    with AtomicWriter(durable) as writer:
+        return writer.write(path, content, validate, encoding)
@@ -0,0 +1,315 @@
+"""
+LYD Design System - Baked Consistency Styles
+Die Normalisierungen aus shared/force-consistency.js zur Build-Zeit anwenden:
+Regeln als markierter Block in master.css, überschriebene Inline-Styles aus dem
+Markup entfernen, <script src=".../force-consistency.js"> aus den Seiten streichen.
+Nur Seiten, die das Skript und master.css laden, bekommen die Klasse .lyd-consistent
+am <body> - alle anderen Seiten sehen aus wie bisher. Seiten mit Skript, aber ohne
+master.css, behalten das Skript (die Regeln kämen dort nie an).
+"""
+
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lyd_ds.dry_run import TrackedText
+
+BLOCK_START = '/* === LYD baked consistency (force-consistency.js) - generated, do not edit === */'
+BLOCK_END = '/* === /LYD baked consistency === */'
+
+BODY_CLASS = 'lyd-consistent'
+
+# Dieselben Werte, die force-consistency.js per style.cssText setzt. Die
+# Breakpoints sind die beabsichtigten aus applyResponsiveGrid() (dort wirkungslos,
+# weil '!important' in einem style-Property-Wert ungültig ist).
+BAKED_CSS = """
+.lyd-consistent .accessibility-grid {
+    display: grid !important;
+    grid-template-columns: repeat(4, 1fr) !important;
+    gap: 24px !important;
+    margin: 32px 0 !important;
+    padding: 32px !important;
+    background: #E8F0FE !important;
+    border-radius: 8px !important;
+    border: none !important;
+}
+
+.lyd-consistent .accessibility-grid * {
+    max-width: none !important;
+    width: auto !important;
+}
+
+.lyd-consistent .accessibility-item {
+    background: white !important;
+    padding: 20px !important;
+    border-radius: 6px !important;
+    box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1) !important;
+    border: none !important;
+    margin: 0 !important;
+    transition: all 0.3s ease !important;
+}
+
+.lyd-consistent .accessibility-item h4 {
+    font-size: 16px !important;
+    font-weight: 600 !important;
+    color: #111111 !important;
+    margin-bottom: 12px !important;
+    margin-top: 0 !important;
+}
+
+.lyd-consistent .accessibility-item ul {
+    list-style: none !important;
+    padding: 0 !important;
+    margin: 0 !important;
+}
+
+.lyd-consistent .accessibility-item ul li {
+    padding: 4px 0 !important;
+    color: #666666 !important;
+    font-size: 14px !important;
+    line-height: 1.6 !important;
+    display: flex !important;
+    align-items: flex-start !important;
+    gap: 8px !important;
+    margin: 0 !important;
+}
+
+.lyd-consistent .accessibility-item li:before {
+    content: "✓" !important;
+    color: #3366CC !important;
+    font-weight: bold !important;
+    margin-right: 8px !important;
+}
+
+.lyd-consistent .page-title,
+.lyd-consistent main h1 {
+    font-size: 48px !important;
+    font-weight: 400 !important;
+    font-family: system-ui, -apple-system, sans-serif !important;
+    letter-spacing: 6px !important;
+    margin-bottom: 16px !important;
+    background: linear-gradient(180deg, #3366CC 0%, #000066 100%) !important;
+    -webkit-background-clip: text !important;
+    -webkit-text-fill-color: transparent !important;
+    text-transform: uppercase !important;
+    color: transparent !important;
+}
+
+.lyd-consistent .lyd-button {
+    display: inline-flex !important;
+    align-items: center !important;
+    justify-content: center !important;
+    gap: 8px !important;
+    padding: 0 16px !important;
+    height: 40px !important;
+    border: none !important;
+    border-radius: 6px !important;
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
+    font-size: 14px !important;
+    font-weight: 500 !important;
+    cursor: pointer !important;
+    text-decoration: none !important;
+    transition: all 0.2s ease !important;
+    overflow: hidden !important;
+    background: #f3f4f6 !important;
+    color: #374151 !important;
+}
+
+.lyd-consistent .lyd-button.primary {
+    background: linear-gradient(135deg, #3366CC 0%, #0052CC 100%) !important;
+    color: white !important;
+    box-shadow: 0 4px 16px rgba(51, 102, 204, 0.3) !important;
+}
+
+.lyd-consistent .lyd-button.secondary {
+    background: transparent !important;
+    color: #3366CC !important;
+    border: 1px solid #3366CC !important;
+}
+
+.lyd-consistent .lyd-button.error {
+    background: linear-gradient(135deg, #dc3545 0%, #c82333 100%) !important;
+    color: white !important;
+    box-shadow: 0 4px 16px rgba(220, 53, 69, 0.3) !important;
+}
+
+.lyd-consistent .lyd-button.ghost {
+    background: transparent !important;
+    color: #6b7280 !important;
+}
+
+.lyd-consistent .lyd-button.copy {
+    position: absolute !important;
+    top: 16px !important;
+    right: 16px !important;
+    background: rgba(255, 255, 255, 0.1) !important;
+    color: #374151 !important;
+    border: 1px solid rgba(255, 255, 255, 0.2) !important;
+    backdrop-filter: blur(4px) !important;
+}
+
+@media (max-width: 1200px) {
+    .lyd-consistent .accessibility-grid {
+        grid-template-columns: repeat(2, 1fr) !important;
+    }
+}
+
+@media (max-width: 768px) {
+    .lyd-consistent .accessibility-grid {
+        grid-template-columns: 1fr !important;
+        padding: 16px !important;
+        gap: 16px !important;
+    }
+}
+"""
+
+SCRIPT_TAG = re.compile(r'[ \t]*<script\b[^>]*\bsrc="[^"]*force-consistency\.js"[^>]*>\s*</script>[ \t]*\n?')
+MASTER_LINK = re.compile(r'<link\b[^>]*\bhref\s*=\s*["\'][^"\']*shared/master\.css["\']', re.IGNORECASE)
+STYLE_ATTR = re.compile(r'\s+style\s*=\s*(?:"[^"]*"|\'[^\']*\')', re.IGNORECASE)
+WIDTH_DECLARATION = re.compile(r'(?:^|(?<=;))\s*(?:max-)?width\s*:[^;]*(?:;|$)', re.IGNORECASE)
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+             'param', 'source', 'track', 'wbr'}
+
+
+def bake_stylesheet(css: str) -> str:
+    """Setzt (oder ersetzt) den Consistency-Block am Ende von master.css"""
+    block = f'{BLOCK_START}\n{BAKED_CSS.strip()}\n{BLOCK_END}\n'
+    start = css.find(BLOCK_START)
+    if start >= 0:
+        end = css.find(BLOCK_END, start)
+        if end >= 0:
+            end += len(BLOCK_END)
+            if css.startswith('\n', end):
+                end += 1
+            return css[:start] + block + css[end:]
+    return css.rstrip('\n') + '\n\n' + block
+
+
+class _InlineStyleScanner(HTMLParser):
+    """Findet Start-Tags, deren Inline-Style force-consistency.js überschreiben würde.
+
+    cssText-Ziele (Grid, Items samt h4/ul/li, Seitentitel, Buttons) verlieren das
+    style-Attribut ganz, alle übrigen Nachfahren von .accessibility-grid nur
+    width/max-width.
+    """
+
+    def __init__(self, text: str):
+        super().__init__(convert_charrefs=True)
+        # getpos() zählt Zeilen nur an \n (nicht wie splitlines())
+        self.line_offsets = [0] + [match.end() for match in re.finditer('\n', text)]
+        self.stack: List[Tuple[str, frozenset]] = []
+        self.edits: List[Tuple[int, int, str]] = []
+
+    def _inside(self, class_name: str = None, tag: str = None) -> bool:
+        return any((class_name and class_name in classes) or (tag and name == tag)
+                   for name, classes in self.stack)
+
+    def handle_starttag(self, tag, attrs):
+        self._visit(tag, attrs)
+        if tag not in VOID_TAGS:
+            classes = frozenset((dict(attrs).get('class') or '').split())
+            self.stack.append((tag, classes))
+
+    def handle_startendtag(self, tag, attrs):
+        self._visit(tag, attrs)
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index][0] == tag:
+                del self.stack[index:]
+                break
+
+    def _tag_span(self) -> Tuple[int, int, str]:
+        raw = self.get_starttag_text()
+        line, column = self.getpos()
+        start = self.line_offsets[line - 1] + column
+        return start, start + len(raw), raw
+
+    def _visit(self, tag, attrs):
+        attributes = dict(attrs)
+        if tag == 'body':
+            start, end, raw = self._tag_span()
+            if 'class' in attributes:
+                new = re.sub(r'(\bclass\s*=\s*["\']?)', rf'\g<1>{BODY_CLASS} ', raw, count=1)
+            else:
+                new = raw[:5] + f' class="{BODY_CLASS}"' + raw[5:]
+            if BODY_CLASS not in (attributes.get('class') or '').split():
+                self.edits.append((start, end, new))
+        if attributes.get('style') is None:
+            return
+        classes = set((attributes.get('class') or '').split())
+        replaced = (
+            classes & {'accessibility-grid', 'accessibility-item', 'page-title', 'lyd-button'}
+            or (tag == 'h1' and self._inside(tag='main'))
+            or (tag in ('h4', 'ul', 'li') and self._inside('accessibility-item'))
+        )
+        if not replaced and not self._inside('accessibility-grid'):
+            return
+
+        start, end, raw = self._tag_span()
+        if replaced:
+            new = STYLE_ATTR.sub('', raw)
+        else:
+            new = STYLE_ATTR.sub(lambda match: self._strip_widths(match.group(0)), raw)
+        if new != raw:
+            self.edits.append((start, end, new))
+
+    @staticmethod
+    def _strip_widths(attribute: str) -> str:
+        name, _, value = attribute.partition('=')
+        quote = value.strip()[0]
+        declarations = WIDTH_DECLARATION.sub('', value.strip()[1:-1]).strip()
+        return f'{name}={quote}{declarations}{quote}' if declarations else ''
+
+
+def bake_page(doc: TrackedText) -> Dict[str, int]:
+    """Wendet die Normalisierungen auf eine Seite an (in place auf doc);
+    Seiten ohne force-consistency.js bleiben unverändert, Seiten ohne master.css
+    werden übersprungen (skipped=1)"""
+    if not SCRIPT_TAG.search(doc.text):
+        return {'tags': 0, 'scripts': 0, 'skipped': 0}
+    if not MASTER_LINK.search(doc.text):
+        return {'tags': 0, 'scripts': 0, 'skipped': 1}
+    scanner = _InlineStyleScanner(doc.text)
+    scanner.feed(doc.text)
+    scanner.close()
+    doc.splice(scanner.edits)
+    scripts_before = doc.subs
+    doc.sub(SCRIPT_TAG, '')
+    return {'tags': len(scanner.edits), 'scripts': doc.subs - scripts_before, 'skipped': 0}
+
+
+def iter_pages(v2_root: Path, skip: Iterable[str] = ('backups', 'node_modules')) -> Iterable[Path]:
+    skip = set(skip)
+    for path in sorted(Path(v2_root).rglob('*.html')):
+        if not skip.intersection(path.relative_to(v2_root).parts):
+            yield path
+
+
+def bake_site(v2_root, writer, pages: Optional[Iterable[Path]] = None) -> Dict[str, int]:
+    """master.css + alle Seiten unter v2_root (ohne backups/) über writer schreiben
+    (AtomicWriter oder DiffPreview); stats['skipped']: Seiten mit Skript, aber ohne master.css.
+    Den Block in master.css gibt es nur, wenn eine Seite gebacken wurde (oder er schon existiert)."""
+    v2_root = Path(v2_root)
+    track = getattr(writer, 'tracks_edits', False)
+    stats = {'pages': 0, 'tags': 0, 'scripts': 0, 'skipped': []}
+
+    for path in (pages if pages is not None else iter_pages(v2_root)):
+        doc = TrackedText(path.read_text(encoding='utf-8'), track=track)
+        page_stats = bake_page(doc)
+        if page_stats['skipped']:
+            stats['skipped'].append(path.relative_to(v2_root).as_posix())
+        if doc.changed:
+            writer.write(path, doc)
+            stats['pages'] += 1
+            stats['tags'] += page_stats['tags']
+            stats['scripts'] += page_stats['scripts']
+
+    stylesheet = v2_root / 'shared' / 'master.css'
+    css = stylesheet.read_text(encoding='utf-8')
+    if stats['pages'] or BLOCK_START in css:
+        baked = bake_stylesheet(css)
+        if baked != css:
+            writer.write(stylesheet, baked)
+    return stats
@@ -0,0 +1,271 @@
+"""
+LYD Design System - Transform Benchmarks
+Synthetische Seiten-Korpora aus den echten v2-Templates (10 KB - 5 MB, 10 - 10.000 Seiten),
+Messung der Hot Paths und Vergleich gegen JSON-Baselines
+"""
+
+import io
+import json
+import platform
+import re
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from itertools import product
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from lyd_ds.cli import load_script
+from lyd_ds.safe_regex import guarded
+
+SECTION_PATTERN = re.compile(r'<section\b.*?</section>', re.DOTALL)
+SIZE_UNITS = {'k': 1024, 'm': 1024 * 1024}
+
+# Profil -> Liste von (Seitengröße, Seitenanzahl)
+PROFILES = {
+    'smoke': [('10k', 10), ('100k', 10)],
+    'default': [('10k', 1000), ('100k', 100), ('1m', 20), ('5m', 5)],
+    'full': [('10k', 10000), ('100k', 1000), ('1m', 100), ('5m', 20)],
+}
+
+BENCHMARKS = ['fix_html_file', 'update_navigation_in_file', 'generate_component',
+              'validate_component', 'reorganize_select_regex']
+
+
+def parse_size(value: str) -> int:
+    """'10k' / '5m' / '2048' -> Bytes"""
+    value = value.strip().lower().rstrip('b')
+    if value[-1:] in SIZE_UNITS:
+        return int(float(value[:-1]) * SIZE_UNITS[value[-1]])
+    return int(value)
+
+
+def format_size(size: int) -> str:
+    if size >= SIZE_UNITS['m']:
+        return f'{size / SIZE_UNITS["m"]:g}MB'
+    return f'{size / SIZE_UNITS["k"]:g}KB'
+
+
+def load_seed_pages(root: Path) -> List[Tuple[str, str]]:
+    """Echte Komponenten-Seiten als Vorlage für den Korpus"""
+    seeds = []
+    for page in sorted((root / 'design-system' / 'v2' / 'components').glob('*/index.html')):
+        seeds.append((page.parent.name, page.read_text(encoding='utf-8')))
+    if not seeds:
+        raise FileNotFoundError(f'no component pages under {root}/design-system/v2/components')
+    return seeds
+
+
+def resize_page(html: str, target: int) -> str:
+    """Bringt eine Seite durch Duplizieren/Entfernen von <section>-Blöcken auf ~target Bytes"""
+    sections = SECTION_PATTERN.findall(html)
+    if not sections:
+        return html
+    if len(html) > target:
+        for section in reversed(sections):
+            if len(html) <= target:
+                break
+            html = html.replace(section, '', 1)
+        return html
+
+    insert_at = html.rfind('</main>')
+    if insert_at < 0:
+        insert_at = html.rfind('</body>')
+    missing = target - len(html)
+    filler = []
+    position = 0
+    while missing > 0:
+        section = sections[position % len(sections)]
+        filler.append(section)
+        missing -= len(section)
+        position += 1
+    return html[:insert_at] + '\n'.join(filler) + html[insert_at:]
+
+
+class Corpus:
+    """Seiten einer Größe/Anzahl unter <work>/design-system/components/<seed>-<n>/index.html"""
+
+    def __init__(self, work_dir: Path, seeds: List[Tuple[str, str]], size: int, count: int):
+        self.work_dir = work_dir
+        self.size = size
+        self.count = count
+        self.components_dir = work_dir / 'design-system' / 'components'
+        resized = [(name, resize_page(html, size)) for name, html in seeds]
+        self.pages = []
+        for index in range(count):
+            name, html = resized[index % len(resized)]
+            self.pages.append((f'{name}-{index}', html))
+        self.bytes = sum(len(html.encode('utf-8')) for _, html in self.pages)
+
+    def paths(self) -> List[Path]:
+        return [self.components_dir / name / 'index.html' for name, _ in self.pages]
+
+    def materialize(self):
+        """(Neu) schreiben - In-Place-Transformationen brauchen pro Lauf frische Dateien"""
+        for (name, html), path in zip(self.pages, self.paths()):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(html, encoding='utf-8')
+
+    def label(self) -> str:
+        return f'{format_size(self.size)}x{self.count}'
+
+
+def _timed(func: Callable, repeat: int, setup: Optional[Callable] = None) -> float:
+    """Bestes Ergebnis aus repeat Läufen (Setup nicht gemessen, Ausgaben unterdrückt)"""
+    best = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class BenchmarkRunner:
+    def __init__(self, root: Path, repeat: int = 3, benchmarks: Optional[List[str]] = None):
+        self.root = Path(root)
+        self.repeat = repeat
+        self.benchmarks = benchmarks or BENCHMARKS
+        self.seeds = load_seed_pages(self.root)
+        self.results: Dict[str, Dict] = {}
+        self._generated_counts = set()
+
+    def _record(self, name: str, corpus: Corpus, seconds: float, files: int, total_bytes: int):
+        key = f'{name}[{corpus.label()}]'
+        self.results[key] = {
+            'seconds': round(seconds, 6),
+            'files': files,
+            'bytes': total_bytes,
+            'per_file_ms': round(seconds * 1000 / max(files, 1), 4),
+            'mb_per_s': round(total_bytes / SIZE_UNITS['m'] / seconds, 2) if seconds else None,
+        }
+        print(f"  ⏱️  {key:<48} {seconds * 1000:10.1f} ms  "
+              f"{self.results[key]['per_file_ms']:8.3f} ms/file")
+
+    def run_corpus(self, corpus: Corpus):
+        paths = corpus.paths()
+
+        if 'fix_html_file' in self.benchmarks:
+            fix_html_file = load_script(self.root, 'fix-templates').fix_html_file
+            seconds = _timed(lambda: [fix_html_file(path) for path in paths],
+                             self.repeat, corpus.materialize)
+            self._record('fix_html_file', corpus, seconds, len(paths), corpus.bytes)
+
+        if 'update_navigation_in_file' in self.benchmarks:
+            update_navigation = load_script(self.root, 'navigation').update_navigation_in_file
+            nav_template = (self.root / 'design-system' / 'v2' / 'shared' /
+                            'navigation-template.html').read_text(encoding='utf-8')
+            seconds = _timed(lambda: [update_navigation(path, nav_template) for path in paths],
+                             self.repeat, corpus.materialize)
+            self._record('update_navigation_in_file', corpus, seconds, len(paths), corpus.bytes)
+
+        if 'validate_component' in self.benchmarks:
+            validator_module = load_script(self.root, 'validator')
+            validator = validator_module.DesignSystemValidator(base_path=str(corpus.work_dir))
+            names = [name for name, _ in corpus.pages]
+
+            def validate_all():
+                for name in names:
+                    validator.validate_component(name, fix=False)
+
+            corpus.materialize()
+            seconds = _timed(validate_all, self.repeat)
+            self._record('validate_component', corpus, seconds, len(names), corpus.bytes)
+
+        if 'reorganize_select_regex' in self.benchmarks:
+            passes = (load_script(self.root, 'reorganize-sections').REGEX_PASSES
+                      + load_script(self.root, 'reorganize-structure').REGEX_PASSES)
+            contents = [html for _, html in corpus.pages]
+
+            # Wie die Skripte über den Guarded-Executor (Literal-Vorfilter, Budget, Isolation)
+            def reorganize_all():
+                for content in contents:
+                    for pattern in passes:
+                        content = guarded.sub(pattern, '', content, flags=re.DOTALL)
+
+            seconds = _timed(reorganize_all, self.repeat)
+            self._record('reorganize_select_regex', corpus, seconds, len(contents), corpus.bytes)
+
+        # Generator hängt nicht von der Seitengröße ab: einmal pro Anzahl
+        if 'generate_component' in self.benchmarks and corpus.count not in self._generated_counts:
+            self._generated_counts.add(corpus.count)
+            generator_module = load_script(self.root, 'generator')
+            generator = generator_module.ComponentGenerator(base_path=str(self.root))
+            generator.components_path = corpus.work_dir / 'generated'
+            keys = list(generator.components)
+            calls = [keys[index % len(keys)] for index in range(corpus.count)]
+            seconds = _timed(lambda: [generator.generate_component(key, force=True) for key in calls],
+                             self.repeat)
+            output_bytes = sum(path.stat().st_size
+                               for path in generator.components_path.glob('*/index.html'))
+            self._record('generate_component', corpus, seconds, len(calls), output_bytes)
+
+    def run(self, matrix: List[Tuple[int, int]], work_dir: Optional[Path] = None) -> Dict:
+        print(f"🏁 Benchmarking {len(matrix)} corpora, {len(self.seeds)} seed pages, "
+              f"best of {self.repeat}")
+        temp_dir = None
+        if work_dir is None:
+            temp_dir = tempfile.mkdtemp(prefix='lyd-bench-')
+            work_dir = Path(temp_dir)
+        try:
+            for size, count in matrix:
+                corpus_dir = Path(work_dir) / f'{format_size(size)}x{count}'
+                corpus = Corpus(corpus_dir, self.seeds, size, count)
+                print(f"\n📦 Corpus {corpus.label()} ({corpus.bytes / SIZE_UNITS['m']:.1f} MB)")
+                self.run_corpus(corpus)
+                shutil.rmtree(corpus_dir, ignore_errors=True)
+        finally:
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        return self.report()
+
+    def report(self) -> Dict:
+        return {
+            'meta': {
+                'timestamp': datetime.now().isoformat(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'repeat': self.repeat,
+            },
+            'results': self.results,
+        }
+
+
+def build_matrix(profile: str, sizes: Optional[List[str]] = None,
+                 counts: Optional[List[int]] = None) -> List[Tuple[int, int]]:
+    """Explizite --sizes/--counts bilden ein Kreuzprodukt, sonst gilt das Profil"""
+    if sizes or counts:
+        profile_pairs = PROFILES[profile]
+        sizes = sizes or sorted({size for size, _ in profile_pairs}, key=parse_size)
+        counts = counts or sorted({count for _, count in profile_pairs})
+        return [(parse_size(size), count) for size, count in product(sizes, counts)]
+    return [(parse_size(size), count) for size, count in PROFILES[profile]]
+
+
+def compare_to_baseline(report: Dict, baseline: Dict, threshold_pct: float,
+                        min_seconds: float = 0.005) -> List[Dict]:
+    """Regressionen: langsamer als Baseline * (1 + threshold). Sehr kurze Messungen
+    (< min_seconds in der Baseline) werden wegen Messrauschen ignoriert."""
+    regressions = []
+    for key, result in report['results'].items():
+        base = baseline.get('results', {}).get(key)
+        if not base or base['seconds'] < min_seconds:
+            continue
+        change = (result['seconds'] - base['seconds']) / base['seconds'] * 100
+        if change > threshold_pct:
+            regressions.append({'benchmark': key, 'baseline': base['seconds'],
+                                'current': result['seconds'], 'change_pct': round(change, 1)})
+    return regressions
+
+
+def write_report(report: Dict, path: Path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
@@ -0,0 +1,139 @@
+"""
+LYD Design System - Component Catalog
+Komponenten-Definitionen aus JSON-Dateien, lazy pro Komponente geladen und
+als Pickle (Schlüssel: Datei-Hash) zwischengespeichert. Icons stehen als
+{{icon:name}} in den Daten und werden beim Laden aus der Icon-Tabelle eingesetzt.
+"""
+
+import hashlib
+import json
+import pickle
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+DATA_ROOT = Path(__file__).resolve().parent.parent / 'component-data'
+MANIFEST_NAME = 'index.json'
+CACHE_DIR_NAME = '__pycache__'
+ICON_PLACEHOLDER = re.compile(r'\{\{icon:([\w-]+)\}\}')
+
+
+class CatalogError(KeyError):
+    """Unbekannte Komponente oder fehlende Datendatei"""
+
+
+def _load_cached(path: Path, cache_dir: Path) -> Any:
+    """Lädt eine JSON-Datei über den Pickle-Cache (gültig solange der Datei-Hash passt)"""
+    raw = path.read_bytes()
+    digest = hashlib.sha1(raw).hexdigest()[:16]
+    cache_path = cache_dir / f'{path.stem}.{digest}.pickle'
+
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    data = json.loads(raw.decode('utf-8'))
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob(f'{path.stem}.*.pickle'):
+            stale.unlink()
+        temp_path = cache_path.with_suffix('.tmp')
+        with open(temp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        temp_path.replace(cache_path)
+    except OSError:
+        pass  # Cache ist optional (z.B. read-only Checkout)
+    return data
+
+
+def expand_icons(value: Any, icons: Mapping, source: str = '') -> Any:
+    """{{icon:name}} in allen Strings einer Definition durch icons[name] ersetzen"""
+    if isinstance(value, str):
+        def replace(match):
+            if match.group(1) not in icons:
+                raise CatalogError(f'{source}: unknown icon {match.group(1)!r}')
+            return icons[match.group(1)]
+        return ICON_PLACEHOLDER.sub(replace, value)
+    if isinstance(value, dict):
+        return {key: expand_icons(item, icons, source) for key, item in value.items()}
+    if isinstance(value, list):
+        return [expand_icons(item, icons, source) for item in value]
+    return value
+
+
+class ComponentCatalog(Mapping):
+    """Read-only Mapping component_key -> Definition.
+
+    Das Manifest (index.json) enthält nur Reihenfolge und Dateinamen; eine
+    Komponente wird erst beim ersten Zugriff geladen. icons: Tabelle für
+    {{icon:name}}-Platzhalter (z.B. SVG_ICONS), damit sie die einzige Quelle bleibt.
+    """
+
+    def __init__(self, name: str, data_root: Optional[Path] = None, icons: Optional[Mapping] = None):
+        self.name = name
+        self.icons = icons
+        self.data_dir = Path(data_root or DATA_ROOT) / name
+        self.cache_dir = self.data_dir / CACHE_DIR_NAME
+        self._manifest: Optional[Dict[str, str]] = None
+        self._loaded: Dict[str, Any] = {}
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.data_dir / MANIFEST_NAME
+
+    @property
+    def manifest(self) -> Dict[str, str]:
+        if self._manifest is None:
+            manifest_path = self.manifest_path
+            if manifest_path.exists():
+                self._manifest = _load_cached(manifest_path, self.cache_dir)
+            else:
+                self._manifest = {path.stem: path.name
+                                  for path in sorted(self.data_dir.glob('*.json'))}
+        return self._manifest
+
+    def source(self, key: str) -> Path:
+        """Datendatei einer Komponente (für Abhängigkeits-Index und Fehlermeldungen)"""
+        if key not in self.manifest:
+            raise CatalogError(f'{self.name}: unknown component {key!r}')
+        return self.data_dir / self.manifest[key]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._loaded:
+            path = self.source(key)
+            if not path.exists():
+                raise CatalogError(f'{self.name}: missing data file {path}')
+            definition = _load_cached(path, self.cache_dir)
+            if self.icons is not None:
+                definition = expand_icons(definition, self.icons, f'{self.name}/{path.name}')
+            self._loaded[key] = definition
+        return self._loaded[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.manifest
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.manifest)
+
+    def __len__(self) -> int:
+        return len(self.manifest)
+
+
+def write_catalog(name: str, components: Dict[str, Any], data_root: Optional[Path] = None) -> Path:
+    """Schreibt eine Komponenten-Sammlung als Datendateien + Manifest (Pflege/Migration)"""
+    data_dir = Path(data_root or DATA_ROOT) / name
+    data_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+    for key, definition in components.items():
+        file_name = key.replace('/', '--') + '.json'
+        manifest[key] = file_name
+        with open(data_dir / file_name, 'w', encoding='utf-8') as f:
+            json.dump(definition, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+    with open(data_dir / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    return data_dir
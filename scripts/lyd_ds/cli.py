@@ -0,0 +1,517 @@
+"""
+LYD Design System - lyd-ds CLI
+Ein Einstiegspunkt für Build, Validierung, Fixes, Navigation und Screenshots.
+Die eigentlichen Skripte werden erst beim Aufruf des Subcommands importiert.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+ROOT_ENV = 'LYD_DS_ROOT'
+
+# Subcommand -> Skript (relativ zum Repository-Root)
+SCRIPTS = {
+    'generator': 'scripts/design-system-refactor/component-generator.py',
+    'validator': 'scripts/design-system-refactor/validation-system.py',
+    'fix-templates': 'design-system/scripts/fix-all-templates.py',
+    'fix-components': 'scripts/fix-all-components-complete.py',
+    'navigation': 'design-system/v2/update-navigation.py',
+    'screenshots': 'tooling/screenshots/create_navigation_screenshots.py',
+    'reorganize-sections': 'scripts/reorganize-select-sections.py',
+    'reorganize-structure': 'scripts/reorganize-select-new-structure.py',
+}
+
+
+class RootNotFoundError(RuntimeError):
+    """Kein LYD-Repository gefunden"""
+
+
+def is_repo_root(path: Path) -> bool:
+    return (path / 'design-system').is_dir() and (path / 'scripts' / 'lyd_ds').is_dir()
+
+
+def find_repo_root(explicit: Optional[str] = None) -> Path:
+    """Repository-Root aus --root, $LYD_DS_ROOT, dem aktuellen Verzeichnis
+    (aufwärts gesucht) oder dem Ort dieses Pakets"""
+    candidates = []
+    if explicit:
+        candidates.append(Path(explicit))
+    elif os.environ.get(ROOT_ENV):
+        candidates.append(Path(os.environ[ROOT_ENV]))
+    else:
+        cwd = Path.cwd().resolve()
+        candidates.extend([cwd, *cwd.parents])
+        candidates.append(Path(__file__).resolve().parents[2])
+
+    for candidate in candidates:
+        if is_repo_root(candidate):
+            return candidate.resolve()
+    if explicit or os.environ.get(ROOT_ENV):
+        raise RootNotFoundError(f'{candidates[0]} is not a live-your-dreams repository')
+    raise RootNotFoundError('could not find the repository root, pass --root')
+
+
+def load_script(root: Path, key: str):
+    """Importiert ein (bindestrich-benanntes) Skript als Modul"""
+    path = root / SCRIPTS[key]
+    module_name = 'lyd_ds_script_' + key.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class _InDirectory:
+    """Für Skripte, die mit relativen Pfaden arbeiten"""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def __enter__(self):
+        self.previous = os.getcwd()
+        os.chdir(self.path)
+
+    def __exit__(self, *exc):
+        os.chdir(self.previous)
+
+
+def cmd_build(args) -> int:
+    from lyd_ds.page_budget import BudgetError
+
+    generator_module = load_script(args.root, 'generator')
+    generator = generator_module.ComponentGenerator(base_path=str(args.root),
+                                                    budget_warn_only=args.budget_warn_only,
+                                                    lazy_tabs=args.lazy_tabs)
+
+    if args.list:
+        print("\n📋 Available Components:")
+        for key, component in generator.components.items():
+            print(f"  • {key}: {component['name']} - {component['category']}")
+        return 0
+    try:
+        if args.changed:
+            generator.generate_changed(args.changed, args.force)
+            return 0
+        if args.component:
+            generated = generator.generate_component(args.component, args.force)
+            generator.deps.save()
+            return 0 if generated else 1
+        generator.generate_all_components(args.force)
+    except BudgetError as error:
+        print(f"\n❌ {error} - nothing written")
+        return 1
+    return 0
+
+
+def cmd_validate(args) -> int:
+    import json
+
+    validator_module = load_script(args.root, 'validator')
+    validator = validator_module.DesignSystemValidator(base_path=str(args.root), base_url=args.base_url)
+    fix = not args.no_fix
+
+    if args.component:
+        result = validator.validate_component(args.component, fix)
+        print(json.dumps(result, indent=2))
+        return 0 if result.get('status') == 'pass' else 1
+    if args.live:
+        components = [d.name for d in validator.components_path.iterdir() if d.is_dir()]
+        for component in components:
+            result = validator.validate_live_url(component)
+            print(f"{component}: {result['status']}")
+        return 0
+    if args.watch:
+        validator.continuous_validation()
+        return 0
+    validator.validate_all_components(fix)
+    return 0
+
+
+def cmd_history(args) -> int:
+    from lyd_ds.history import HISTORY_DIRS, HISTORY_NAME, ValidationHistory
+
+    # validation-system schreibt nach <root>/, validate-all-components (Regel-Ergebnisse)
+    # nach docs/design-system/ - ohne --db werden alle vorhandenen abgefragt
+    candidates = [Path(args.db)] if args.db else [args.root / directory / HISTORY_NAME for directory in HISTORY_DIRS]
+    db_paths = [path for path in candidates if path.exists()]
+    if not db_paths:
+        print(f"❌ No validation history at {', '.join(str(path) for path in candidates)} "
+              f"(run lyd-ds validate first)")
+        return 1
+
+    for db_path in db_paths:
+        if len(db_paths) > 1:
+            print(f"\n📚 {db_path.relative_to(args.root)}")
+        history = ValidationHistory(db_path)
+        if args.failing:
+            component, rule = args.failing
+            since = history.failing_since(component, rule)
+            if since:
+                print(f"❌ {component}: {rule} failing since run #{since['run_id']} ({since['started_at']})")
+            else:
+                print(f"✅ {component}: {rule} is passing")
+        elif args.rule:
+            failing = history.failing(args.rule)
+            for entry in failing:
+                print(f"❌ {entry['component']}: since run #{entry['run_id']} ({entry['started_at']})")
+            print(f"{len(failing)} component(s) failing {args.rule}")
+        else:
+            for component, points in history.score_trend(args.trend, args.runs).items():
+                scores = ' '.join('-' if point['score'] is None else f"{point['score']:g}" for point in points)
+                print(f"{component:<20} {scores}")
+        history.close()
+    return 0
+
+
+def cmd_fix(args) -> int:
+    if args.target == 'components':
+        with _InDirectory(args.root):
+            load_script(args.root, 'fix-components').main(args.dry_run, args.budget_warn_only)
+    else:
+        load_script(args.root, 'fix-templates').main(args.root / 'design-system', args.stream, args.dry_run)
+    return 0
+
+
+def cmd_nav(args) -> int:
+    with _InDirectory(args.root / 'design-system' / 'v2'):
+        load_script(args.root, 'navigation').main(args.dry_run, args.changed)
+    return 0
+
+
+def cmd_bake(args) -> int:
+    from lyd_ds.atomic import AtomicWriter
+    from lyd_ds.baked_styles import bake_site
+    from lyd_ds.dry_run import DiffPreview
+
+    v2_root = args.root / 'design-system' / 'v2'
+    with (DiffPreview(args.root) if args.dry_run else AtomicWriter()) as writer:
+        stats = bake_site(v2_root, writer)
+    if not args.dry_run:
+        print(f"✅ Baked force-consistency.js into master.css and {stats['pages']} page(s) "
+              f"({stats['tags']} tag(s) rewritten, {stats['scripts']} script tag(s) removed)")
+    for page in stats['skipped']:
+        print(f"⚠️  {page}: loads force-consistency.js but not shared/master.css - left unchanged")
+    return 0
+
+
+def cmd_bundle(args) -> int:
+    from lyd_ds.atomic import AtomicWriter
+    from lyd_ds.dry_run import DiffPreview
+    from lyd_ds.js_bundle import build_bundles, print_report
+
+    v2_root = args.root / 'design-system' / 'v2'
+    with (DiffPreview(args.root) if args.dry_run else AtomicWriter()) as writer:
+        report = build_bundles(v2_root, writer)
+    if not args.dry_run:
+        print(f"✅ {len(report['bundles'])} bundle(s), {len(report['pages'])} page(s) rewritten")
+    print_report(report, v2_root)
+    return 0
+
+
+def cmd_assets(args) -> int:
+    from lyd_ds.atomic import AtomicWriter
+    from lyd_ds.dry_run import DiffPreview
+    from lyd_ds.js_bundle import build_bundles, print_report
+    from lyd_ds.page_assets import prune_site_assets
+
+    v2_root = args.root / 'design-system' / 'v2'
+    with (DiffPreview(args.root) if args.dry_run else AtomicWriter()) as writer:
+        pruned = prune_site_assets(v2_root, writer)
+    for result in pruned:
+        print(f"✂️  {result['page'].relative_to(v2_root)}: dropped {', '.join(result['removed'])}")
+    if args.dry_run or not pruned:
+        print(f"✅ {len(pruned)} page(s) {'would change' if args.dry_run else 'changed'}")
+        return 0
+    # Aufgelöste Bundle-Tags wieder zusammenfassen
+    with AtomicWriter() as writer:
+        report = build_bundles(v2_root, writer)
+    print(f"✅ {len(pruned)} page(s) pruned, {len(report['bundles'])} bundle(s)")
+    print_report(report, v2_root)
+    return 0
+
+
+def cmd_search(args) -> int:
+    from lyd_ds.atomic import AtomicWriter
+    from lyd_ds.dry_run import DiffPreview
+    from lyd_ds.site_search import INDEX_DIR, SiteSearch, add_search_boxes, build_site_index
+
+    v2_root = args.root / 'design-system' / 'v2'
+    if args.query:
+        search = SiteSearch(v2_root / 'shared' / INDEX_DIR)
+        for result in search.query(' '.join(args.query), args.limit):
+            section = f" › {result['section']}" if result['section'] else ''
+            print(f"{result['score']:>4}  {result['title']}{section}  ({result['url']})")
+        print(f"\n📦 Shards loaded: {', '.join(search.loaded) or '-'} of {len(search.manifest['shards'])}")
+        return 0
+
+    with (DiffPreview(args.root) if args.dry_run else AtomicWriter()) as writer:
+        boxes = add_search_boxes(v2_root, writer)
+        stats = build_site_index(v2_root, writer)
+    if not args.dry_run:
+        print(f"✅ Search index: {stats['pages']} page(s), {stats['docs']} document(s), "
+              f"{stats['terms']} term(s) in {stats['shards']} shard(s); search box added to {len(boxes)} page(s)")
+        if boxes:
+            print("   Run `lyd-ds bundle` and `lyd-ds sw` to bundle the runtime and refresh the precache")
+    for path in stats['stale']:
+        print(f"🗑️  Unreferenced shard: {path.name}")
+    return 0
+
+
+def cmd_sw(args) -> int:
+    from lyd_ds.atomic import AtomicWriter
+    from lyd_ds.dry_run import DiffPreview
+    from lyd_ds.service_worker import build_service_worker
+
+    v2_root = args.root / 'design-system' / 'v2'
+    with (DiffPreview(args.root) if args.dry_run else AtomicWriter()) as writer:
+        stats = build_service_worker(v2_root, writer)
+    if not args.dry_run:
+        print(f"✅ sw.js: {stats['entries']} precache entries ({stats['pages']} page(s), "
+              f"{stats['assets']} shared asset(s)); registration added to {stats['registered']} page(s)")
+    return 0
+
+
+def cmd_serve(args) -> int:
+    from lyd_ds.static_server import LocalServer, site_root
+
+    server = LocalServer(args.site or site_root(args.root), port=args.port, workers=args.workers, verbose=True)
+    print(f"🌐 Serving {server.httpd.RequestHandlerClass.site.root} at {server.url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+def cmd_links(args) -> int:
+    from lyd_ds.link_graph import CACHE_PATH, LinkGraph, print_report
+    from lyd_ds.static_server import site_root
+
+    cache = None if args.no_cache else args.root / CACHE_PATH
+    graph = LinkGraph(args.site or site_root(args.root), cache).scan(args.jobs)
+    print_report(graph)
+    return 1 if graph.broken else 0
+
+
+def cmd_budget(args) -> int:
+    from lyd_ds.baked_styles import iter_pages
+    from lyd_ds.catalog import ComponentCatalog
+    from lyd_ds.page_budget import SITE_PAGES, BudgetError, BudgetGate
+    from lyd_ds.service_worker import page_url
+    from lyd_ds.static_server import site_root
+
+    site = Path(args.site) if args.site else site_root(args.root)
+    catalogs = {}
+    gate = BudgetGate(warn_only=args.warn_only)
+    for path in iter_pages(site, ('backups', 'node_modules', 'templates', 'shared')):
+        page = page_url(site, path)
+        # Seiten ohne Eintrag in SITE_PAGES messen gegen DEFAULT_BUDGET
+        config = None
+        entry = SITE_PAGES.get(path.parent.relative_to(site).as_posix())
+        if entry:
+            catalog_name, key = entry
+            if catalog_name not in catalogs:
+                catalogs[catalog_name] = ComponentCatalog(catalog_name)
+            config = catalogs[catalog_name][key]
+        gate.check(page, path.read_text(encoding='utf-8'), config)
+
+    print(f"📏 Page budgets ({site}):")
+    try:
+        gate.finish()
+    except BudgetError as error:
+        print(f"\n❌ {error}")
+        return 1
+    return 0
+
+
+def cmd_screenshot(args) -> int:
+    screenshots = load_script(args.root, 'screenshots')
+    if args.base_url or args.live:
+        screenshots.BASE_URL = args.base_url or screenshots.PRODUCTION_URL
+    output_dir = Path(args.output or args.root / 'screenshots')
+    output_dir.mkdir(parents=True, exist_ok=True)
+    screenshots.main(str(output_dir))
+    return 0
+
+
+def cmd_bench(args) -> int:
+    import json
+    from lyd_ds import bench
+
+    matrix = bench.build_matrix(args.profile, args.sizes, args.counts)
+    runner = bench.BenchmarkRunner(args.root, repeat=args.repeat, benchmarks=args.only)
+    report = runner.run(matrix)
+
+    if args.output:
+        bench.write_report(report, args.output)
+        print(f"\n💾 Results written: {args.output}")
+    if args.save_baseline:
+        bench.write_report(report, args.save_baseline)
+        print(f"💾 Baseline written: {args.save_baseline}")
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = bench.compare_to_baseline(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:g}%:")
+            for regression in regressions:
+                print(f"  - {regression['benchmark']}: {regression['baseline'] * 1000:.1f} ms → "
+                      f"{regression['current'] * 1000:.1f} ms (+{regression['change_pct']}%)")
+            return 1
+        print(f"\n✅ No regressions beyond {args.threshold:g}% against {args.baseline}")
+    return 0
+
+
+def cmd_lint_regex(args) -> int:
+    from lyd_ds.safe_regex import lint_paths
+
+    paths = args.paths or [args.root / 'scripts', args.root / 'design-system']
+    findings = lint_paths(paths)
+    for finding in findings:
+        print(f"❌ {finding['file']}:{finding['line']}: {finding['problem']}: {finding['pattern']}")
+    if findings:
+        print(f"\n{len(findings)} risky regex pattern(s) found")
+        return 1
+    print("✅ No nested quantifiers in regex patterns")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='lyd-ds', description='LYD Design System tools')
+    parser.add_argument('--root', help=f'Repository root (default: ${ROOT_ENV} or auto-discovery)')
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    build = subparsers.add_parser('build', help='Generate component pages')
+    build.add_argument('--component', '-c', help='Generate specific component')
+    build.add_argument('--force', '-f', action='store_true', help='Force overwrite without backup')
+    build.add_argument('--list', '-l', action='store_true', help='List all available components')
+    build.add_argument('--changed', nargs='+', metavar='PATH',
+                       help='Regenerate only pages depending on these templates/data files')
+    build.add_argument('--budget-warn-only', action='store_true',
+                       help='Report pages over their budget without failing the build')
+    build.add_argument('--lazy-tabs', choices=('template', 'fragment'),
+                       help='Render only the default tab inline, load the others on first activation')
+    build.set_defaults(handler=cmd_build)
+
+    validate = subparsers.add_parser('validate', help='Validate component pages')
+    validate.add_argument('--component', '-c', help='Validate specific component')
+    validate.add_argument('--live', '-l', action='store_true', help='Validate live URLs')
+    validate.add_argument('--base-url', help='Site for --live (default: local server on design-system/v2; '
+                                            'production: http://designsystem.liveyourdreams.online)')
+    validate.add_argument('--watch', '-w', action='store_true', help='Continuous validation')
+    validate.add_argument('--no-fix', action='store_true', help='Report only, no auto-fixes')
+    validate.set_defaults(handler=cmd_validate)
+
+    history = subparsers.add_parser('history', help='Query the validation history (default: score trend)')
+    history.add_argument('--db', help='History database (default: every validation-history.sqlite '
+                                      'in <root>/ and <root>/docs/design-system/)')
+    history.add_argument('--failing', nargs=2, metavar=('COMPONENT', 'RULE'),
+                         help='Show since when RULE has been failing for COMPONENT')
+    history.add_argument('--rule', help='List all components currently failing RULE')
+    history.add_argument('--trend', metavar='COMPONENT', help='Score trend of one component (default: all)')
+    history.add_argument('--runs', type=int, default=100, help='Number of recent runs in the trend')
+    history.set_defaults(handler=cmd_history)
+
+    fix = subparsers.add_parser('fix', help='Apply template/content fixes')
+    fix.add_argument('--target', choices=['templates', 'components'], default='templates',
+                     help='templates: fix_html_file on all pages, components: component content')
+    fix.add_argument('--stream', action='store_true', default=None,
+                     help='Rewrite templates in bounded-memory chunks (default: only for files >= 8 MB)')
+    fix.add_argument('--dry-run', action='store_true', help='Show a unified diff, write nothing')
+    fix.add_argument('--budget-warn-only', action='store_true',
+                     help='components: report pages over their budget without failing')
+    fix.set_defaults(handler=cmd_fix)
+
+    nav = subparsers.add_parser('nav', help='Update the v2 navigation on all pages')
+    nav.add_argument('--dry-run', action='store_true', help='Show a unified diff, write nothing')
+    nav.add_argument('--changed', nargs='+', metavar='PATH',
+                     help='Update only pages depending on these files (e.g. shared/navigation-template.html)')
+    nav.set_defaults(handler=cmd_nav)
+
+    bake = subparsers.add_parser('bake', help='Bake force-consistency.js styles into master.css and the v2 pages')
+    bake.add_argument('--dry-run', action='store_true', help='Show a unified diff, write nothing')
+    bake.set_defaults(handler=cmd_bake)
+
+    bundle = subparsers.add_parser('bundle', help='Bundle the shared scripts of each v2 page into one deferred file')
+    bundle.add_argument('--dry-run', action='store_true', help='Show a unified diff, write nothing')
+    bundle.set_defaults(handler=cmd_bundle)
+
+    assets = subparsers.add_parser('assets', help='Drop shared CSS/JS that a v2 page does not use, then re-bundle')
+    assets.add_argument('--dry-run', action='store_true', help='Show a unified diff, write nothing')
+    assets.set_defaults(handler=cmd_assets)
+
+    search = subparsers.add_parser('search', help='Build the sharded v2 search index (or query it)')
+    search.add_argument('query', nargs='*', help='Query the built index instead of rebuilding it')
+    search.add_argument('--limit', type=int, default=10, help='Results to show (default: 10)')
+    search.add_argument('--dry-run', action='store_true', help='Show a unified diff, write nothing')
+    search.set_defaults(handler=cmd_search)
+
+    sw = subparsers.add_parser('sw', help='Generate the v2 service worker and its precache manifest (run last)')
+    sw.add_argument('--dry-run', action='store_true', help='Show a unified diff, write nothing')
+    sw.set_defaults(handler=cmd_sw)
+
+    serve = subparsers.add_parser('serve', help='Serve the generated site locally like the production host')
+    serve.add_argument('--port', '-p', type=int, default=8000, help='Port (default: 8000)')
+    serve.add_argument('--workers', type=int, default=8, help='Request thread pool size (default: 8)')
+    serve.add_argument('--site', help='Directory to serve (default: <root>/design-system/v2)')
+    serve.set_defaults(handler=cmd_serve)
+
+    links = subparsers.add_parser('links', help='Check internal links, anchors and asset references offline')
+    links.add_argument('--site', help='Directory to check (default: <root>/design-system/v2)')
+    links.add_argument('--jobs', '-j', type=int, help='Parser processes (default: CPU count)')
+    links.add_argument('--no-cache', action='store_true', help='Reparse every page')
+    links.set_defaults(handler=cmd_links)
+
+    budget = subparsers.add_parser('budget', help='Check page weight and DOM size against component budgets')
+    budget.add_argument('--site', help='Directory to check (default: <root>/design-system/v2)')
+    budget.add_argument('--warn-only', action='store_true', help='Report violations but exit 0')
+    budget.set_defaults(handler=cmd_budget)
+
+    screenshot = subparsers.add_parser('screenshot', help='Screenshot all navigation pages')
+    screenshot.add_argument('--output', '-o', help='Screenshot directory (default: <root>/screenshots)')
+    screenshot.add_argument('--base-url', help='Site to capture (default: local server on design-system/v2)')
+    screenshot.add_argument('--live', action='store_true', help='Capture the production site')
+    screenshot.set_defaults(handler=cmd_screenshot)
+
+    bench = subparsers.add_parser('bench', help='Benchmark transforms on synthetic page corpora')
+    bench.add_argument('--profile', choices=['smoke', 'default', 'full'], default='default',
+                       help='Corpus sizes/counts (smoke: seconds, full: 10,000 pages and 5 MB pages)')
+    bench.add_argument('--sizes', nargs='+', help='Page sizes, e.g. 10k 1m 5m (cross product with --counts)')
+    bench.add_argument('--counts', nargs='+', type=int, help='Page counts, e.g. 10 100 10000')
+    bench.add_argument('--only', nargs='+', choices=['fix_html_file', 'update_navigation_in_file',
+                                                      'generate_component', 'validate_component',
+                                                      'reorganize_select_regex'],
+                       help='Run only these benchmarks')
+    bench.add_argument('--repeat', type=int, default=3, help='Runs per benchmark (best is kept)')
+    bench.add_argument('--output', '-o', help='Write results JSON')
+    bench.add_argument('--baseline', help='Compare against this baseline JSON (exit 1 on regression)')
+    bench.add_argument('--save-baseline', help='Write results as new baseline JSON')
+    bench.add_argument('--threshold', type=float, default=10.0,
+                       help='Allowed slowdown in percent before a benchmark counts as regression')
+    bench.set_defaults(handler=cmd_bench)
+
+    lint_regex = subparsers.add_parser('lint-regex', help='Flag regex patterns with nested quantifiers')
+    lint_regex.add_argument('paths', nargs='*', type=Path, help='Files/directories (default: scripts, design-system)')
+    lint_regex.set_defaults(handler=cmd_lint_regex)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        args.root = find_repo_root(args.root)
+    except RootNotFoundError as e:
+        parser.error(str(e))
+    return args.handler(args)
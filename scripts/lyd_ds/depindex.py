@@ -0,0 +1,194 @@
+"""
+LYD Design System - Dependency Index
+Merkt sich pro Generator, aus welchen Eingaben (Templates, Datendateien, Config-Einträge)
+jede Ausgabeseite entsteht; --changed <pfad> baut daraus nur die betroffenen Seiten neu
+"""
+
+import ast
+import hashlib
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from lyd_ds.atomic import write_atomic
+
+INDEX_PATH = Path('.lyd-ds') / 'deps.json'
+INDEX_VERSION = 1
+
+# (Quelldatei, Name des Dicts, aktuelles Dict) - z.B. (__file__, 'COMPONENTS', COMPONENTS)
+ConfigSource = Tuple[Any, str, Mapping]
+
+
+def _digest(value: Any) -> str:
+    raw = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def code_digest(path: Path, names: Iterable[str]) -> Optional[str]:
+    """Hash einer Quelldatei ohne die Zuweisungen der Config-Dicts names (nur der Code);
+    None wenn die Datei fehlt. Nicht parsebare Dateien zählen komplett als Code."""
+    try:
+        text = Path(path).read_text(encoding='utf-8')
+    except OSError:
+        return None
+    names = set(names)
+    lines = text.splitlines(keepends=True)
+    try:
+        tree = ast.parse(text)
+    except SyntaxError:
+        tree = None
+    for node in (tree.body if tree else ()):
+        targets = node.targets if isinstance(node, ast.Assign) else (
+            [node.target] if isinstance(node, ast.AnnAssign) else [])
+        if any(isinstance(target, ast.Name) and target.id in names for target in targets):
+            for number in range(node.lineno - 1, node.end_lineno):
+                lines[number] = ''
+    return hashlib.sha1(''.join(lines).encode('utf-8')).hexdigest()[:16]
+
+
+class DependencyIndex:
+    """Vorwärts gespeichert (Generator -> Ziel -> Ausgabe + Eingaben), rückwärts
+    beim Abfragen aufgebaut (Eingabe -> Ziele). Eingaben sind Dateien relativ zum
+    Repository-Root oder Config-Einträge der Form 'pfad.py::NAME[key]'."""
+
+    def __init__(self, root, index_path: Optional[Path] = None):
+        self.root = Path(root).resolve()
+        self.path = Path(index_path) if index_path else self.root / INDEX_PATH
+        self._data: Optional[Dict] = None
+        self._dirty = False
+        self._code_names: Dict[str, Set[str]] = defaultdict(set)   # Quelldatei -> Config-Dicts
+        self._code_rebuilt: Set[str] = set()   # Quelldateien, deren Abhängige alle neu gebaut werden
+
+    @property
+    def data(self) -> Dict:
+        if self._data is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') != INDEX_VERSION:
+                    raise ValueError('index version changed')
+            except (OSError, ValueError):
+                data = {'version': INDEX_VERSION, 'generators': {}, 'fingerprints': {}}
+            self._data = data
+        return self._data
+
+    def key(self, path) -> str:
+        """Pfad -> Schlüssel relativ zum Root (Config-Schlüssel bleiben unverändert)"""
+        if isinstance(path, str) and '::' in path:
+            return path
+        path = Path(path)
+        if not path.is_absolute():
+            path = Path.cwd() / path
+        path = path.resolve()
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def config(self, source, name: str, mapping: Mapping, key: Optional[str] = None) -> str:
+        """Abhängigkeit auf einen Config-Eintrag (key) oder die Schlüsselliste (key=None)"""
+        dependency = f'{self.key(source)}::{name}' + (f'[{key}]' if key is not None else '')
+        value = mapping[key] if key is not None else list(mapping)
+        digest = _digest(value)
+        if self.data['fingerprints'].get(dependency) != digest:
+            self.data['fingerprints'][dependency] = digest
+            self._dirty = True
+        return dependency
+
+    def changed_config(self, source, name: str, mapping: Mapping) -> Set[str]:
+        """Config-Einträge, deren Inhalt sich seit dem letzten Build geändert hat"""
+        prefix = f'{self.key(source)}::{name}'
+        fingerprints = self.data['fingerprints']
+        changed = set()
+        if fingerprints.get(prefix) != _digest(list(mapping)):
+            changed.add(prefix)
+        for key, value in mapping.items():
+            dependency = f'{prefix}[{key}]'
+            if fingerprints.get(dependency) != _digest(value):
+                changed.add(dependency)
+        return changed
+
+    def _code_key(self, key: str) -> str:
+        return f'{key}::'
+
+    def code_changed(self, key: str) -> bool:
+        """Hat sich außerhalb der Config-Dicts von key Code geändert? (unbekannt = ja)"""
+        current = code_digest(self.root / key, self._code_names[key])
+        return self.data['fingerprints'].get(self._code_key(key)) != current
+
+    def _update_code(self, key: str):
+        digest = code_digest(self.root / key, self._code_names[key])
+        if self.data['fingerprints'].get(self._code_key(key)) != digest:
+            self.data['fingerprints'][self._code_key(key)] = digest
+            self._dirty = True
+
+    def record(self, generator: str, target: str, output, inputs: Iterable, extra_outputs: Iterable = ()):
+        """extra_outputs: weitere Dateien desselben Ziels (z.B. Tab-Fragmente einer Seite)"""
+        entry = {'output': self.key(output), 'inputs': sorted({self.key(item) for item in inputs})}
+        for key in entry['inputs']:
+            if key in self._code_rebuilt:
+                self._update_code(key)
+        extra = sorted({self.key(item) for item in extra_outputs})
+        if extra:
+            entry['outputs'] = extra
+        targets = self.data['generators'].setdefault(generator, {})
+        if targets.get(target) != entry:
+            targets[target] = entry
+            self._dirty = True
+
+    def reverse(self, generator: str) -> Dict[str, Set[str]]:
+        """Eingabe (oder Ausgabeseite selbst) -> Ziele des Generators"""
+        reverse: Dict[str, Set[str]] = defaultdict(set)
+        for target, entry in self.data['generators'].get(generator, {}).items():
+            for output in (entry['output'], *entry.get('outputs', ())):
+                reverse[output].add(target)
+            for dependency in entry['inputs']:
+                reverse[dependency].add(target)
+        return reverse
+
+    def select(self, generator: str, targets: Iterable[str], changed: Optional[Iterable] = None,
+               configs: Iterable[ConfigSource] = ()) -> List[str]:
+        """Ziele, die nach Änderung von changed neu gebaut werden müssen.
+
+        changed=None -> alle. Für Quelldateien mit Config-Dicts zählen die
+        geänderten Einträge; hat sich außerdem der Code außerhalb der Dicts geändert
+        (oder ist kein Eintrag geändert), sind alle Ziele betroffen, die von der
+        Datei selbst abhängen. Ziele ohne Eintrag im Index (noch nie gebaut) werden
+        immer gebaut.
+        """
+        targets = list(targets)
+        configs = list(configs)
+        for source, name, _ in configs:
+            self._code_names[self.key(source)].add(name)
+        if changed is None:
+            self._code_rebuilt.update(self._code_names)
+            return targets
+
+        dependencies = set()
+        for path in changed:
+            key = self.key(path)
+            config_changes = set()
+            for source, name, mapping in configs:
+                if self.key(source) == key:
+                    config_changes |= self.changed_config(source, name, mapping)
+            dependencies |= config_changes
+            if not config_changes or self.code_changed(key):
+                dependencies.add(key)
+                if key in self._code_names:
+                    self._code_rebuilt.add(key)
+
+        reverse = self.reverse(generator)
+        affected = set()
+        for dependency in dependencies:
+            affected |= reverse.get(dependency, set())
+        known = self.data['generators'].get(generator, {})
+        return [target for target in targets if target in affected or target not in known]
+
+    def save(self) -> Optional[Path]:
+        if not self._dirty:
+            return None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.path, json.dumps(self.data, indent=1, sort_keys=True, ensure_ascii=False) + '\n')
+        self._dirty = False
+        return self.path
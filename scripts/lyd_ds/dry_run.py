@@ -0,0 +1,396 @@
+"""
+LYD Design System - Dry Run
+Ersetzungen mit Aufzeichnung der geänderten Spannen; der Unified Diff wird direkt
+aus den Spannen erzeugt (kein difflib über ganze Seiten)
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from lyd_ds.safe_regex import guarded
+
+DEFAULT_CONTEXT = 3
+DEFAULT_WIDTH = 240   # längere Zeilen (einzeiliges HTML/SVG) werden um die Änderung gekürzt
+NO_NEWLINE = '\\ No newline at end of file'
+
+Replacement = Union[str, Callable[[re.Match], str]]
+Span = Tuple[int, int, int, int]   # (original_start, original_end, new_start, new_end)
+
+
+def _common_prefix(a: str, b: str, limit: Optional[int] = None) -> int:
+    """Länge des gemeinsamen Präfixes (Binärsuche über Slice-Vergleiche)"""
+    low, high = 0, min(len(a), len(b)) if limit is None else limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[low:middle] == b[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[len(a) - middle:len(a) - low] == b[len(b) - middle:len(b) - low]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def changed_span(original: str, new: str) -> List[Span]:
+    """Eine Spanne zwischen gemeinsamem Präfix und Suffix (für nicht aufgezeichnete Inhalte)"""
+    if original == new:
+        return []
+    prefix = _common_prefix(original, new)
+    suffix = _common_suffix(original, new, min(len(original), len(new)) - prefix)
+    return [(prefix, len(original) - suffix, prefix, len(new) - suffix)]
+
+
+class TrackedText:
+    """Text mit re.sub/str.replace-Semantik, der die geänderten Spannen mitschreibt.
+
+    Die Spannen werden über alle Schritte hinweg auf das Original zurückgerechnet,
+    sodass diff() auch nach mehreren überlappenden Ersetzungen stimmt. Mit
+    track=False ist es ein dünner Wrapper um re.subn/str.replace.
+    """
+
+    def __init__(self, text: str, track: bool = True):
+        self.original = text
+        self.text = text
+        self.track = track
+        self.subs = 0
+        self._regions: List[List[int]] = []   # [start, end, original_start, original_end]
+
+    def __str__(self) -> str:
+        return self.text
+
+    @property
+    def changed(self) -> bool:
+        return self.text != self.original
+
+    @property
+    def regions(self) -> List[Span]:
+        return [(orig_start, orig_end, start, end) for start, end, orig_start, orig_end in self._regions]
+
+    def sub(self, pattern, repl: Replacement, count: int = 0, flags: int = 0) -> str:
+        compiled = guarded.compile(pattern, flags)
+        if not self.track:
+            self.text, subs = compiled.subn(repl, self.text, count)
+            self.subs += subs
+            return self.text
+
+        if callable(repl):
+            expand = repl
+        elif '\\' in repl:
+            expand = lambda match: match.expand(repl)
+        else:
+            expand = lambda match: repl
+        edits = []
+        for match in compiled.finditer(self.text):
+            edits.append((match.start(), match.end(), expand(match)))
+            if count and len(edits) == count:
+                break
+        return self._apply(edits)
+
+    def replace(self, old: str, new: str, count: int = -1) -> str:
+        if count == 0:
+            return self.text
+        if not self.track:
+            occurrences = self.text.count(old)
+            self.subs += occurrences if count < 0 else min(count, occurrences)
+            self.text = self.text.replace(old, new, count)
+            return self.text
+        return self.sub(re.escape(old), lambda match: new, max(count, 0))
+
+    def splice(self, edits: Sequence[Tuple[int, int, str]]) -> str:
+        """Explizite Edits (start, end, ersatz) in aktuellen Koordinaten, z.B. aus einem HTMLParser"""
+        return self._apply(sorted(edits))
+
+    def _apply(self, edits: Sequence[Tuple[int, int, str]]) -> str:
+        text = self.text
+        parts = []
+        recorded = []
+        position = 0
+        for start, end, replacement in edits:
+            parts.append(text[position:start])
+            parts.append(replacement)
+            position = end
+            old = text[start:end]
+            if old == replacement:
+                continue
+            # Nur den wirklich geänderten Kern merken (z.B. unveränderte \1-Gruppen)
+            prefix = _common_prefix(old, replacement)
+            suffix = _common_suffix(old, replacement, min(len(old), len(replacement)) - prefix)
+            recorded.append((start + prefix, end - suffix, len(replacement) - prefix - suffix))
+        parts.append(text[position:])
+        self.subs += len(edits)
+        self.text = ''.join(parts)
+        if recorded:
+            self._merge(recorded)
+        return self.text
+
+    def _merge(self, edits: List[Tuple[int, int, int]]):
+        """Führt die Edits eines Schritts (aktuelle Koordinaten) mit den bisherigen Regionen zusammen"""
+        regions = self._regions
+        merged = []
+        i = j = 0
+        shift = 0   # (aktuell - original) aller Regionen vor der Position
+        delta = 0   # (neu - aktuell) aller Edits vor der Position
+        while i < len(regions) or j < len(edits):
+            if j >= len(edits) or (i < len(regions) and regions[i][0] <= edits[j][0]):
+                start = regions[i][0]
+            else:
+                start = edits[j][0]
+            orig_start = start - shift
+            end = start
+            cluster_delta = 0
+            while True:
+                if i < len(regions) and regions[i][0] <= end:
+                    region_start, region_end, region_orig_start, region_orig_end = regions[i]
+                    end = max(end, region_end)
+                    shift += (region_end - region_start) - (region_orig_end - region_orig_start)
+                    i += 1
+                elif j < len(edits) and edits[j][0] <= end:
+                    edit_start, edit_end, new_length = edits[j]
+                    end = max(end, edit_end)
+                    cluster_delta += new_length - (edit_end - edit_start)
+                    j += 1
+                else:
+                    break
+            merged.append([start + delta, end + delta + cluster_delta, orig_start, end - shift])
+            delta += cluster_delta
+        self._regions = merged
+
+    def diff(self, from_file: str, to_file: Optional[str] = None, context: int = DEFAULT_CONTEXT,
+             width: Optional[int] = DEFAULT_WIDTH) -> List[str]:
+        return unified_diff(self.original, self.text, self.regions, from_file, to_file or from_file,
+                            context, width)
+
+
+def _line_end(text: str, position: int) -> int:
+    index = text.find('\n', position)
+    return len(text) if index < 0 else index + 1
+
+
+def _split_lines(text: str, start: int, end: int) -> List[str]:
+    lines = text[start:end].split('\n')
+    if lines and lines[-1] == '':
+        lines.pop()
+    return lines
+
+
+def _lines_before(text: str, position: int, count: int) -> int:
+    """Startposition von bis zu count ganzen Zeilen vor position (Zeilenanfang)"""
+    for _ in range(count):
+        if position == 0:
+            break
+        position = text.rfind('\n', 0, position - 1) + 1
+    return position
+
+
+def _lines_after(text: str, position: int, count: int) -> int:
+    for _ in range(count):
+        if position >= len(text):
+            break
+        position = _line_end(text, position)
+    return position
+
+
+def _clip(line: str, width: Optional[int], focus: int = 0) -> str:
+    if not width or len(line) <= width:
+        return line
+    start = max(0, min(focus - width // 4, len(line) - width))
+    clipped = line[start:start + width]
+    head = f'…[{start}]' if start else ''
+    rest = len(line) - start - width
+    tail = f'…[+{rest}]' if rest > 0 else ''
+    return head + clipped + tail
+
+
+def _format_range(start: int, length: int) -> str:
+    """Wie difflib: 1-basiert, leere Bereiche zeigen auf die Zeile davor"""
+    beginning = start + 1
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f'{beginning},{length}'
+
+
+def unified_diff(original: str, new: str, spans: Sequence[Span], from_file: str, to_file: str,
+                 context: int = DEFAULT_CONTEXT, width: Optional[int] = DEFAULT_WIDTH) -> List[str]:
+    """Unified Diff aus geänderten Spannen; Text außerhalb der Spannen gilt als identisch"""
+    # 1. Spannen auf ganze Zeilen erweitern: [old_start, old_end, new_start, new_end]
+    chunks: List[List[int]] = []
+    for orig_start, orig_end, new_start, new_end in spans:
+        line_start = original.rfind('\n', 0, orig_start) + 1
+        chunk = [line_start, _line_end(original, orig_end),
+                 new_start - (orig_start - line_start), _line_end(new, new_end)]
+        if chunks and chunk[0] < chunks[-1][1]:
+            chunks[-1][1], chunks[-1][3] = chunk[1], chunk[3]
+        else:
+            chunks.append(chunk)
+
+    # 2. Zeilen + Zeilennummern; gleiche Rand-Zeilen fallen weg. Eine letzte Zeile
+    #    ohne Zeilenumbruch ("offen") gilt nie als gleich mit einer abgeschlossenen.
+    missing_newline = not original.endswith('\n')
+    new_missing_newline = not new.endswith('\n')
+    changes = []
+    line_number, counted_to, line_delta = 0, 0, 0
+    for old_start, old_end, new_start, new_end in chunks:
+        old_lines = _split_lines(original, old_start, old_end)
+        new_lines = _split_lines(new, new_start, new_end)
+        old_open = old_end >= len(original) and missing_newline and bool(old_lines)
+        new_open = new_end >= len(new) and new_missing_newline and bool(new_lines)
+        old_keys = old_lines[:-1] + [(old_lines[-1],)] if old_open else old_lines
+        new_keys = new_lines[:-1] + [(new_lines[-1],)] if new_open else new_lines
+        line_number += original.count('\n', counted_to, old_start)
+        counted_to = old_start
+
+        shorter = min(len(old_keys), len(new_keys))
+        lead = 0
+        while lead < shorter and old_keys[lead] == new_keys[lead]:
+            lead += 1
+        trail = 0
+        while trail < shorter - lead and old_keys[-1 - trail] == new_keys[-1 - trail]:
+            trail += 1
+        if lead == len(old_keys) == len(new_keys):
+            continue
+        for _ in range(lead):
+            old_start = _line_end(original, old_start)
+        for _ in range(trail):
+            old_end = original.rfind('\n', 0, old_end - 1) + 1
+        old_lines = old_lines[lead:len(old_lines) - trail]
+        new_lines = new_lines[lead:len(new_lines) - trail]
+        first = line_number + lead
+        changes.append((first, first + line_delta, old_start, max(old_end, old_start), old_lines, new_lines,
+                        old_open and not trail, new_open and not trail))
+        line_delta += len(new_lines) - len(old_lines)
+
+    # 3. Hunks mit Kontext; nahe Änderungen werden zusammengelegt
+    groups: List[List[Tuple]] = []
+    for change in changes:
+        if groups:
+            previous = groups[-1][-1]
+            if change[0] - (previous[0] + len(previous[4])) <= 2 * context:
+                groups[-1].append(change)
+                continue
+        groups.append([change])
+
+    if not groups:
+        return []
+    output = [f'--- {from_file}', f'+++ {to_file}']
+    for group in groups:
+        first, last = group[0], group[-1]
+        before_start = _lines_before(original, first[2], context)
+        before = _split_lines(original, before_start, first[2])
+        after_end = _lines_after(original, last[3], context)
+        after = _split_lines(original, last[3], after_end)
+
+        body = [' ' + _clip(line, width) for line in before]
+        old_count = new_count = len(before)
+        for index, (_, _, old_start, old_end, old_lines, new_lines, old_open, new_open) in enumerate(group):
+            if index:
+                between = _split_lines(original, group[index - 1][3], old_start)
+                body.extend(' ' + _clip(line, width) for line in between)
+                old_count += len(between)
+                new_count += len(between)
+            for number, line in enumerate(old_lines):
+                counterpart = new_lines[number] if number < len(new_lines) else ''
+                body.append('-' + _clip(line, width, _common_prefix(line, counterpart)))
+            if old_open:
+                body.append(NO_NEWLINE)
+            for number, line in enumerate(new_lines):
+                counterpart = old_lines[number] if number < len(old_lines) else ''
+                body.append('+' + _clip(line, width, _common_prefix(line, counterpart)))
+            if new_open:
+                body.append(NO_NEWLINE)
+            old_count += len(old_lines)
+            new_count += len(new_lines)
+        body.extend(' ' + _clip(line, width) for line in after)
+        if after and after_end >= len(original) and missing_newline:
+            body.append(NO_NEWLINE)
+        old_count += len(after)
+        new_count += len(after)
+
+        old_first = first[0] - len(before)
+        new_first = first[1] - len(before)
+        output.append(f'@@ -{_format_range(old_first, old_count)} '
+                      f'+{_format_range(new_first, new_count)} @@')
+        output.extend(body)
+    return output
+
+
+class DiffPreview:
+    """Ersatz für AtomicWriter bei --dry-run: zeigt den Diff statt zu schreiben.
+
+    TrackedText-Inhalte liefern ihre Spannen selbst; für reine Strings wird die
+    Datei auf der Platte mit gemeinsamem Präfix/Suffix verglichen.
+    """
+
+    tracks_edits = True
+
+    def __init__(self, root: Optional[Path] = None, context: int = DEFAULT_CONTEXT,
+                 width: Optional[int] = DEFAULT_WIDTH, out=None):
+        self.root = Path(root).resolve() if root else Path.cwd()
+        self.context = context
+        self.width = width
+        self.out = out or sys.stdout
+        self.files = 0
+        self.unchanged = 0
+        self.added = 0
+        self.removed = 0
+
+    def _label(self, path: Path) -> str:
+        try:
+            return str(path.resolve().relative_to(self.root))
+        except ValueError:
+            return str(path)
+
+    def write(self, path, content, validate=None, encoding: str = 'utf-8') -> Path:
+        path = Path(path)
+        if isinstance(content, TrackedText):
+            original, new, spans = content.original, content.text, content.regions
+        else:
+            new = content.decode(encoding) if isinstance(content, bytes) else content
+            original = path.read_text(encoding=encoding) if path.exists() else ''
+            spans = changed_span(original, new)
+
+        label = self._label(path)
+        lines = unified_diff(original, new, spans, f'a/{label}', f'b/{label}',
+                             self.context, self.width)
+        if not lines:
+            self.unchanged += 1
+            return path
+        self.files += 1
+        for line in lines[2:]:
+            if line.startswith('+'):
+                self.added += 1
+            elif line.startswith('-'):
+                self.removed += 1
+        print('\n'.join(lines), file=self.out)
+        return path
+
+    @property
+    def pending(self) -> int:
+        return self.files
+
+    def commit(self) -> int:
+        print(f"\n📝 Dry run: {self.files} file(s) would change (+{self.added} -{self.removed} lines), "
+              f"{self.unchanged} unchanged - nothing written", file=self.out)
+        return self.files
+
+    def abort(self):
+        pass
+
+    def __enter__(self) -> 'DiffPreview':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
@@ -0,0 +1,322 @@
+"""
+LYD Design System - Syntax Highlighting
+Färbt TSX/TypeScript- und HTML-Codebeispiele beim Build ein: ein kleiner Tokenizer
+erzeugt <span class="hl-…">-Markup, die Seite braucht nur HIGHLIGHT_CSS und kein
+Highlighting-JS. Ergebnisse werden pro Build nach Snippet-Hash zwischengespeichert.
+"""
+
+import hashlib
+import html
+import re
+from typing import Dict, List, Optional, Tuple
+
+KEYWORDS = frozenset('''
+    abstract as async await break case catch class const continue debugger declare default
+    delete do else enum export extends finally for from function get global if implements
+    import in instanceof interface keyof let namespace new of private protected public
+    readonly return set static super switch this throw try type typeof var void while with
+    yield
+'''.split())
+CONSTANTS = frozenset(('true', 'false', 'null', 'undefined', 'NaN', 'Infinity'))
+BUILTIN_TYPES = frozenset('any bigint boolean never number object string symbol unknown'.split())
+
+# Code-Sprach-Label / language-Klasse -> Tokenizer
+LANGUAGES = {
+    'tsx': 'tsx', 'ts': 'tsx', 'typescript': 'tsx', 'jsx': 'tsx', 'js': 'tsx', 'javascript': 'tsx',
+    'html': 'html', 'xml': 'html',
+}
+
+# Farben passend zu den dunklen Codeblöcken (#1e1e2e / --lyd-gray-900)
+HIGHLIGHT_CSS = '''
+        /* Syntax Highlighting (lyd_ds.highlight) */
+        .hl-com { color: #7f849c; font-style: italic; }
+        .hl-kw { color: #cba6f7; }
+        .hl-str { color: #a6e3a1; }
+        .hl-num, .hl-const { color: #fab387; }
+        .hl-fn { color: #89b4fa; }
+        .hl-type { color: #f9e2af; }
+        .hl-tag { color: #f38ba8; }
+        .hl-attr { color: #94e2d5; }
+'''
+STYLE_ID = 'lyd-highlight'
+
+Token = Tuple[Optional[str], str]   # (CSS-Klasse oder None, Text)
+
+_COMMENT = re.compile(r'//[^\n]*|/\*.*?(?:\*/|$)', re.DOTALL)
+_STRING = re.compile(r'''(['"])(?:\\.|(?!\1)[^\\\n])*\1?|`(?:\\.|[^`\\])*`?''', re.DOTALL)
+_NUMBER = re.compile(r'(?:0[xXbBoO][\da-fA-F_]+|\d[\d_]*(?:\.\d+)?(?:[eE][+-]?\d+)?)n?\b')
+_IDENTIFIER = re.compile(r'[A-Za-z_$][\w$]*')
+_SPACE = re.compile(r'\s+')
+_CALL = re.compile(r'\s*\(')
+_KEY = re.compile(r'\s*\??:')
+_TAG_NAME = re.compile(r'[A-Za-z][\w.:-]*')
+_ATTRIBUTE = re.compile(r'[A-Za-z_:@][\w:.@-]*')
+_ATTR_VALUE = re.compile(r'''"[^"]*"?|'[^']*'?''')
+_HTML_COMMENT = re.compile(r'<!--.*?(?:-->|$)', re.DOTALL)
+
+# Nach diesen Zeichen/Wörtern beginnt ein Ausdruck: "<" ist dort JSX, sonst Vergleich/Generic
+_EXPRESSION_START = frozenset('( , = { [ ? : ; ! & | => return && || ?? default'.split())
+
+
+class _Lexer:
+    """Zustandsautomat über code (JS/TS), tag (<x …>) und children (JSX-/HTML-Text)"""
+
+    def __init__(self, source: str, language: str):
+        self.source = source
+        self.jsx = language == 'tsx'
+        self.tokens: List[Token] = []
+        self.position = 0
+        self.previous: Optional[str] = None     # letztes signifikantes Code-Token
+        # Zustände: ['code', Klammertiefe] | ['tag', schließend?] | ['children']
+        self.stack: List[list] = [['code', 0]] if self.jsx else [['children']]
+
+    def emit(self, kind: Optional[str], text: str):
+        if text:
+            self.tokens.append((kind, text))
+
+    def match(self, pattern) -> Optional[str]:
+        found = pattern.match(self.source, self.position)
+        if not found or not found.group(0):
+            return None
+        self.position = found.end()
+        return found.group(0)
+
+    def run(self) -> List[Token]:
+        while self.position < len(self.source):
+            state = self.stack[-1][0]
+            if state == 'code':
+                self.code()
+            elif state == 'tag':
+                self.tag()
+            else:
+                self.children()
+        return self.tokens
+
+    # --- JS/TS ------------------------------------------------------------
+
+    def code(self):
+        source, position = self.source, self.position
+        char = source[position]
+        space = self.match(_SPACE)
+        if space:
+            self.emit(None, space)
+            return
+        for pattern, kind in ((_COMMENT, 'hl-com'), (_STRING, 'hl-str'), (_NUMBER, 'hl-num')):
+            text = self.match(pattern)
+            if text:
+                self.emit(kind, text)
+                if kind != 'hl-com':
+                    self.previous = text
+                return
+        word = self.match(_IDENTIFIER)
+        if word:
+            # Eigenschaften (obj.type, { type: … }) sind keine Schlüsselwörter
+            is_property = self.previous == '.' or (self.previous in ('{', ',') and _KEY.match(source, self.position))
+            if is_property and not _CALL.match(source, self.position):
+                kind = None
+            elif word in KEYWORDS and not is_property:
+                kind = 'hl-kw'
+            elif word in CONSTANTS:
+                kind = 'hl-const'
+            elif _CALL.match(source, self.position):
+                kind = 'hl-fn'
+            elif word[0].isupper() or word in BUILTIN_TYPES:
+                kind = 'hl-type'
+            else:
+                kind = None
+            self.emit(kind, word)
+            self.previous = word
+            return
+        if char == '<' and self.previous_starts_expression() and self.open_tag():
+            return
+        frame = self.stack[-1]
+        if char == '{':
+            frame[1] += 1
+        elif char == '}':
+            if frame[1] == 0 and len(self.stack) > 1:
+                # Ende einer {…}-Einbettung in JSX
+                self.stack.pop()
+                self.emit(None, char)
+                self.position += 1
+                return
+            frame[1] -= 1
+        operator = source[position:position + 2]
+        if operator in ('=>', '&&', '||', '??'):
+            self.emit(None, operator)
+            self.previous = operator
+            self.position += 2
+            return
+        self.emit(None, char)
+        self.previous = char
+        self.position += 1
+
+    def previous_starts_expression(self) -> bool:
+        return self.previous is None or self.previous in _EXPRESSION_START
+
+    # --- Tags ---------------------------------------------------------------
+
+    def open_tag(self) -> bool:
+        """'<name', '</name' oder JSX-Fragment '<>' / '</>' an der aktuellen Position"""
+        source, start = self.source, self.position
+        closing = source.startswith('</', start)
+        name_start = start + (2 if closing else 1)
+        name = _TAG_NAME.match(source, name_start)
+        if name is None and not (self.jsx and source.startswith('>', name_start)):
+            return False
+        end = name.end() if name else name_start
+        self.emit('hl-tag', source[start:end])
+        self.position = end
+        self.stack.append(['tag', closing])
+        return True
+
+    def tag(self):
+        closing = self.stack[-1][1]
+        space = self.match(_SPACE)
+        if space:
+            self.emit(None, space)
+            return
+        for end in ('/>', '>'):
+            if self.source.startswith(end, self.position):
+                self.emit('hl-tag', end)
+                self.position += len(end)
+                self.stack.pop()
+                if not self.jsx:
+                    return
+                if closing:
+                    # </x> beendet die children des passenden <x>
+                    if self.stack[-1][0] == 'children':
+                        self.stack.pop()
+                    self.previous = ')'
+                elif end == '>':
+                    self.stack.append(['children'])
+                else:
+                    self.previous = ')'
+                return
+        if self.jsx and self.source.startswith('{', self.position):
+            self.emit(None, '{')
+            self.position += 1
+            self.stack.append(['code', 0])
+            self.previous = '{'
+            return
+        attribute = self.match(_ATTRIBUTE)
+        if attribute:
+            self.emit('hl-attr', attribute)
+            return
+        value = self.match(_ATTR_VALUE)
+        if value:
+            self.emit('hl-str', value)
+            return
+        self.emit(None, self.source[self.position])
+        self.position += 1
+
+    # --- Text zwischen Tags -------------------------------------------------
+
+    def children(self):
+        source, position = self.source, self.position
+        if not self.jsx:
+            comment = self.match(_HTML_COMMENT)
+            if comment:
+                self.emit('hl-com', comment)
+                return
+        if source.startswith('<', position) and self.open_tag():
+            return
+        if self.jsx and source.startswith('{', position):
+            self.emit(None, '{')
+            self.position += 1
+            self.stack.append(['code', 0])
+            self.previous = '{'
+            return
+        stops = '<{' if self.jsx else '<'
+        end = position + 1
+        while end < len(source) and source[end] not in stops:
+            end += 1
+        self.emit(None, source[position:end])
+        self.position = end
+
+
+def tokenize(source: str, language: str = 'tsx') -> List[Token]:
+    """Quelltext -> [(Klasse, Text)]; benachbarte Tokens gleicher Klasse zusammengefasst"""
+    merged: List[Token] = []
+    for kind, text in _Lexer(source, LANGUAGES.get(language, language)).run():
+        if merged and merged[-1][0] == kind:
+            merged[-1] = (kind, merged[-1][1] + text)
+        else:
+            merged.append((kind, text))
+    return merged
+
+
+def render(tokens: List[Token]) -> str:
+    parts = []
+    for kind, text in tokens:
+        text = html.escape(text, quote=False)
+        parts.append(f'<span class="{kind}">{text}</span>' if kind else text)
+    return ''.join(parts)
+
+
+_cache: Dict[str, str] = {}
+_stats = {'hits': 0, 'misses': 0}
+
+
+def highlight(source: str, language: str = 'tsx') -> str:
+    """Quelltext (unescaped) -> HTML mit Highlight-Spans; pro Snippet-Hash nur einmal berechnet"""
+    language = LANGUAGES.get(language.lower(), language.lower())
+    key = hashlib.sha1(f'{language}\0{source}'.encode('utf-8')).hexdigest()
+    cached = _cache.get(key)
+    if cached is not None:
+        _stats['hits'] += 1
+        return cached
+    _stats['misses'] += 1
+    result = _cache[key] = render(tokenize(source, language))
+    return result
+
+
+def cache_info() -> Dict[str, int]:
+    return dict(_stats, size=len(_cache))
+
+
+def guess_language(source: str) -> str:
+    return 'html' if source.lstrip().startswith('<') else 'tsx'
+
+
+_PRE_CODE = re.compile(r'(<pre\b[^>]*>\s*<code\b([^>]*)>)(.*?)(</code>\s*</pre>)', re.DOTALL | re.IGNORECASE)
+_CODE_BLOCK = re.compile(
+    r'(<div class="code-block">.*?<span class="code-language">([^<]*)</span>.*?<code\b([^>]*)>)(.*?)(</code>)',
+    re.DOTALL)
+_LANGUAGE_CLASS = re.compile(r'\blanguage-([\w-]+)')
+
+
+def _highlight_code(code_html: str, label: Optional[str], attributes: str) -> Optional[str]:
+    if 'class="hl-' in code_html:
+        return None   # schon eingefärbt (idempotent)
+    declared = _LANGUAGE_CLASS.search(attributes)
+    name = (declared.group(1) if declared else label or '').strip().lower()
+    source = html.unescape(code_html)
+    language = LANGUAGES.get(name) if name else guess_language(source)
+    if language is None:
+        return None   # z.B. CSS/Bash: unverändert lassen
+    return highlight(source, language)
+
+
+def highlight_blocks(page: str) -> str:
+    """Codeblöcke einer Seite einfärben: <pre><code>…</code></pre> und
+    <div class="code-block"> mit .code-language-Label; Inline-<code> bleibt unberührt"""
+    def replace_block(match):
+        highlighted = _highlight_code(match.group(4), match.group(2), match.group(3))
+        return match.group(0) if highlighted is None else match.group(1) + highlighted + match.group(5)
+
+    def replace_pre(match):
+        highlighted = _highlight_code(match.group(3), None, match.group(2))
+        return match.group(0) if highlighted is None else match.group(1) + highlighted + match.group(4)
+
+    page = _CODE_BLOCK.sub(replace_block, page)
+    return _PRE_CODE.sub(replace_pre, page)
+
+
+def add_highlight_styles(page: str) -> str:
+    """HIGHLIGHT_CSS als <style id="lyd-highlight"> vor </head> (idempotent)"""
+    if f'id="{STYLE_ID}"' in page:
+        return page
+    end = page.find('</head>')
+    if end < 0:
+        return page
+    return f'{page[:end]}    <style id="{STYLE_ID}">{HIGHLIGHT_CSS}    </style>\n{page[end:]}'
@@ -0,0 +1,196 @@
+"""
+LYD Design System - Validation History
+SQLite-Verlauf der Validierungsläufe: pro Lauf werden nur geänderte Scores und
+Regel-Ergebnisse gespeichert (Änderungsprotokoll), Abfragen laufen über Indizes
+"""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from lyd_ds.results import RunSummary, ValidationRecord
+
+HISTORY_NAME = 'validation-history.sqlite'
+# Ablageorte relativ zur Repo-Wurzel: validation-system, validate-all-components
+HISTORY_DIRS = ('.', 'docs/design-system')
+
+# Nur vollständige Läufe zählen (wie score_trend); ältere Dateien können noch
+# Zeilen aus abgebrochenen Läufen enthalten
+COMPLETE_RUNS = 'SELECT id FROM runs WHERE complete = 1'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    validator TEXT,
+    total INTEGER,
+    passed INTEGER,
+    failed INTEGER,
+    missing INTEGER,
+    average_score REAL,
+    complete INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS runs_started_at ON runs (started_at);
+
+-- Score/Status einer Komponente ab run_id (gilt bis zur nächsten Zeile)
+CREATE TABLE IF NOT EXISTS score_changes (
+    component TEXT NOT NULL,
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    status TEXT NOT NULL,
+    score REAL,
+    PRIMARY KEY (component, run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS score_changes_run ON score_changes (run_id);
+
+-- Ergebnis einer Regel ab run_id
+CREATE TABLE IF NOT EXISTS rule_changes (
+    component TEXT NOT NULL,
+    rule TEXT NOT NULL,
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    passed INTEGER NOT NULL,
+    PRIMARY KEY (component, rule, run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS rule_changes_rule ON rule_changes (rule, run_id);
+"""
+
+
+class ValidationHistory:
+    """Verlauf in einer SQLite-Datei.
+
+    start_run() lädt den letzten Stand (eine Zeile pro Komponente/Regel),
+    add() vergleicht dagegen und merkt sich nur Abweichungen, finish_run()
+    schreibt sie in einer Transaktion. Ein Lauf ohne Änderungen kostet eine Zeile.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._db: Optional[sqlite3.Connection] = None
+        self.run_id: Optional[int] = None
+        self._scores: Dict[str, Tuple[str, Optional[float]]] = {}
+        self._rules: Dict[Tuple[str, str], int] = {}
+        self._seen: Set[str] = set()
+        self._score_rows: List[Tuple] = []
+        self._rule_rows: List[Tuple] = []
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    # --- Schreiben -------------------------------------------------------
+
+    def start_run(self, validator: str = '', started_at: Optional[str] = None) -> int:
+        db = self.db
+        with db:
+            cursor = db.execute('INSERT INTO runs (started_at, validator) VALUES (?, ?)',
+                                (started_at or datetime.now().isoformat(), validator))
+        self.run_id = cursor.lastrowid
+        # SQLite liefert bei MAX() die übrigen Spalten aus derselben Zeile
+        self._scores = {component: (status, score) for component, status, score, _ in db.execute(
+            'SELECT component, status, score, MAX(run_id) FROM score_changes '
+            f'WHERE run_id IN ({COMPLETE_RUNS}) GROUP BY component')}
+        self._rules = {(component, rule): passed for component, rule, passed, _ in db.execute(
+            'SELECT component, rule, passed, MAX(run_id) FROM rule_changes '
+            f'WHERE run_id IN ({COMPLETE_RUNS}) GROUP BY component, rule')}
+        self._seen = set()
+        self._score_rows = []
+        self._rule_rows = []
+        return self.run_id
+
+    def add(self, record: ValidationRecord):
+        component = record.component
+        self._seen.add(component)
+        score = None if record.status == 'missing' else record.score
+        if self._scores.get(component) != (record.status, score):
+            self._score_rows.append((component, self.run_id, record.status, score))
+        # Wieder aufgetauchte Komponente: Regeln neu beginnen lassen
+        returning = self._scores.get(component, (None, None))[0] == 'missing'
+        for rule, passed in (record.checks or {}).items():
+            passed = int(bool(passed))
+            if returning or self._rules.get((component, rule)) != passed:
+                self._rule_rows.append((component, rule, self.run_id, passed))
+
+    def finish_run(self, summary: RunSummary, complete: bool = True):
+        if complete:
+            # Nicht mehr vorhandene Komponenten als missing markieren
+            for component, (status, _) in self._scores.items():
+                if component not in self._seen and status != 'missing':
+                    self._score_rows.append((component, self.run_id, 'missing', None))
+        else:
+            # Abgebrochener Lauf: nur die Zusammenfassung, kein Zustand
+            self._score_rows, self._rule_rows = [], []
+        with self.db as db:
+            db.executemany('INSERT INTO score_changes VALUES (?, ?, ?, ?)', self._score_rows)
+            db.executemany('INSERT INTO rule_changes VALUES (?, ?, ?, ?)', self._rule_rows)
+            db.execute('UPDATE runs SET finished_at = ?, total = ?, passed = ?, failed = ?, missing = ?, '
+                       'average_score = ?, complete = ? WHERE id = ?',
+                       (datetime.now().isoformat(), summary.total, summary.passed, summary.failed,
+                        summary.missing, summary.average_score, int(complete), self.run_id))
+        changes = len(self._score_rows) + len(self._rule_rows)
+        self._scores, self._rules, self._seen = {}, {}, set()
+        self._score_rows, self._rule_rows = [], []
+        return changes
+
+    # --- Abfragen --------------------------------------------------------
+
+    def _removed(self) -> Set[str]:
+        """Komponenten, deren letzter Stand missing ist (entfernt oder ohne Seite)"""
+        return {component for component, status, _ in self.db.execute(
+            'SELECT component, status, MAX(run_id) FROM score_changes '
+            f'WHERE run_id IN ({COMPLETE_RUNS}) GROUP BY component') if status == 'missing'}
+
+    def failing_since(self, component: str, rule: str) -> Optional[Dict]:
+        """Lauf, seit dem die Regel für die Komponente durchgehend fehlschlägt (None: besteht
+        oder Komponente entfernt)"""
+        row = self.db.execute(
+            'SELECT c.passed, r.id, r.started_at FROM rule_changes c JOIN runs r ON r.id = c.run_id '
+            'WHERE c.component = ? AND c.rule = ? AND r.complete = 1 ORDER BY c.run_id DESC LIMIT 1',
+            (component, rule)).fetchone()
+        if row is None or row[0] or component in self._removed():
+            return None
+        return {'run_id': row[1], 'started_at': row[2]}
+
+    def failing(self, rule: str) -> List[Dict]:
+        """Alle vorhandenen Komponenten, die die Regel aktuell nicht bestehen, mit Beginn"""
+        rows = self.db.execute(
+            'SELECT c.component, c.passed, MAX(c.run_id), r.started_at FROM rule_changes c '
+            'JOIN runs r ON r.id = c.run_id WHERE c.rule = ? AND r.complete = 1 GROUP BY c.component',
+            (rule,))
+        removed = self._removed()
+        return [{'component': component, 'run_id': run_id, 'started_at': started_at}
+                for component, passed, run_id, started_at in rows if not passed and component not in removed]
+
+    def score_trend(self, component: Optional[str] = None, runs: int = 100) -> Dict[str, List[Dict]]:
+        """Score pro Komponente in den letzten runs Läufen (jeweils letzter Stand bis zum Lauf)"""
+        components = 'SELECT DISTINCT component FROM score_changes'
+        params: Tuple = (runs,)
+        if component:
+            components += ' WHERE component = ?'
+            params += (component,)
+        rows = self.db.execute(
+            'WITH recent AS (SELECT id, started_at FROM runs WHERE complete = 1 ORDER BY id DESC LIMIT ?) '
+            'SELECT c.component, r.id, r.started_at, '
+            '  (SELECT s.status || \'|\' || IFNULL(s.score, \'\') FROM score_changes s '
+            '   WHERE s.component = c.component AND s.run_id <= r.id ORDER BY s.run_id DESC LIMIT 1) '
+            f'FROM recent r, ({components}) c ORDER BY c.component, r.id', params)
+
+        trend: Dict[str, List[Dict]] = {}
+        for name, run_id, started_at, state in rows:
+            if state is None:
+                continue  # Komponente gab es in diesem Lauf noch nicht
+            status, _, score = state.partition('|')
+            trend.setdefault(name, []).append({
+                'run_id': run_id, 'started_at': started_at, 'status': status,
+                'score': float(score) if score else None,
+            })
+        return trend
@@ -0,0 +1,230 @@
+"""
+LYD Design System - Virtualized Icon Grid
+Icon-Daten als JSON statt Inline-SVG-Karten; der Browser rendert nur sichtbare Zeilen
+"""
+
+import json
+import re
+from typing import Dict, List, Tuple
+
+from lyd_ds.svg_optimizer import optimize_svg_cached
+
+DATA_ELEMENT_ID = 'icon-library-data'
+ICON_CARD_BLOCK_PATTERN = re.compile(
+    r'\s*<div class="icon-card"[^>]*>\s*<div class="icon-display">.*?</div>\s*'
+    r'<span class="icon-name">[^<]*</span>\s*</div>',
+    re.DOTALL
+)
+CATEGORY_BLOCK_PATTERN = re.compile(
+    r'(<h3>(.*?)</h3>\s*<div class="icon-grid category-grid")>', re.DOTALL
+)
+
+
+def build_grid_data(entries: List[Dict[str, str]]) -> Dict:
+    """Parallele Listen (names/categories/cats/svgs) in Reihenfolge der Icon Library"""
+    categories = []
+    category_ids = {}
+    data = {'names': [], 'categories': categories, 'cats': [], 'svgs': []}
+    for entry in entries:
+        category = entry.get('category', '')
+        if category not in category_ids:
+            category_ids[category] = len(categories)
+            categories.append(category)
+        data['names'].append(entry['name'])
+        data['cats'].append(category_ids[category])
+        data['svgs'].append(optimize_svg_cached(entry['svg']))
+    return data
+
+
+def render_grid_data(data: Dict) -> str:
+    """Bettet die Icon-Daten als JSON-Datenblock ein"""
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    payload = payload.replace('</', '<\\/')
+    return f'<script type="application/json" id="{DATA_ELEMENT_ID}">{payload}</script>'
+
+
+def virtualize_category_grids(section_html: str, data: Dict) -> Tuple[str, int]:
+    """Entfernt die statischen Icon-Karten und markiert die Kategorie-Grids für den
+    Virtual Grid (data-icon-category = Index in data['categories'])"""
+    section_html, removed = ICON_CARD_BLOCK_PATTERN.subn('', section_html)
+
+    def mark(match):
+        title = match.group(2).strip()
+        if title not in data['categories']:
+            return match.group(0)
+        return f'{match.group(1)} data-icon-category="{data["categories"].index(title)}">'
+
+    return CATEGORY_BLOCK_PATTERN.sub(mark, section_html), removed
+
+
+VIRTUAL_GRID_CSS = '''
+        /* Virtualized Icon Grid */
+        .icon-grid.virtual-icon-grid {
+            display: block;
+            position: relative;
+            contain: layout paint;
+        }
+
+        .virtual-icon-grid > .icon-card {
+            position: absolute;
+            top: 0;
+            left: 0;
+            box-sizing: border-box;
+            will-change: transform;
+        }
+
+        .virtual-icon-grid > .icon-card[hidden] {
+            display: none;
+        }
+'''
+
+# Zeilen werden relativ zum Viewport berechnet (Window-Scroll), pro Grid nur
+# sichtbare Zeilen + Overscan im DOM; Karten werden per Icon-Index wiederverwendet
+VIRTUAL_GRID_JS = r'''
+        const LYDVirtualIconGrid = (() => {
+            const ROW_HEIGHT = 112;
+            const MIN_CELL_WIDTH = 100;
+            const GAP = 16;
+            const OVERSCAN_ROWS = 3;
+            const grids = [];
+            let scheduled = false;
+
+            class VirtualIconGrid {
+                constructor(container, library, ids) {
+                    this.container = container;
+                    this.library = library;
+                    this.nodes = new Map();
+                    this.spare = [];
+                    container.classList.add('virtual-icon-grid');
+                    container.addEventListener('click', (event) => {
+                        const card = event.target.closest('.icon-card');
+                        if (card) copyIconName(card.dataset.icon);
+                    });
+                    grids.push(this);
+                    this.setItems(ids);
+                }
+
+                setItems(ids) {
+                    this.ids = ids;
+                    this.render();
+                }
+
+                release(node) {
+                    node.hidden = true;
+                    this.spare.push(node);
+                }
+
+                acquire(id) {
+                    const node = this.spare.pop() || this.container.appendChild(document.createElement('div'));
+                    const name = this.library.names[id];
+                    node.className = 'icon-card';
+                    node.dataset.icon = name;
+                    node.innerHTML = `<div class="icon-display">${this.library.svgs[id]}</div>` +
+                                     `<span class="icon-name">${name}</span>`;
+                    node.hidden = false;
+                    return node;
+                }
+
+                render() {
+                    const width = this.container.clientWidth;
+                    if (!width) return;  // versteckter Tab: beim Einblenden neu rendern
+                    const columns = Math.max(1, Math.floor((width + GAP) / (MIN_CELL_WIDTH + GAP)));
+                    const cellWidth = (width - GAP * (columns - 1)) / columns;
+                    const rows = Math.ceil(this.ids.length / columns);
+                    this.container.style.height = `${Math.max(0, rows * (ROW_HEIGHT + GAP) - GAP)}px`;
+
+                    const top = this.container.getBoundingClientRect().top;
+                    const firstRow = Math.max(0, Math.floor(-top / (ROW_HEIGHT + GAP)) - OVERSCAN_ROWS);
+                    const lastRow = Math.min(rows - 1,
+                        Math.ceil((window.innerHeight - top) / (ROW_HEIGHT + GAP)) + OVERSCAN_ROWS);
+                    const start = firstRow * columns;
+                    const end = Math.min(this.ids.length, (lastRow + 1) * columns);
+
+                    const wanted = new Set(this.ids.slice(start, end));
+                    this.nodes.forEach((node, id) => {
+                        if (!wanted.has(id)) {
+                            this.release(node);
+                            this.nodes.delete(id);
+                        }
+                    });
+                    for (let position = start; position < end; position++) {
+                        const id = this.ids[position];
+                        let node = this.nodes.get(id);
+                        if (!node) {
+                            node = this.acquire(id);
+                            this.nodes.set(id, node);
+                        }
+                        const row = Math.floor(position / columns);
+                        const column = position % columns;
+                        node.style.width = `${cellWidth}px`;
+                        node.style.height = `${ROW_HEIGHT}px`;
+                        node.style.transform =
+                            `translate(${column * (cellWidth + GAP)}px, ${row * (ROW_HEIGHT + GAP)}px)`;
+                    }
+                }
+            }
+
+            function copyIconName(name) {
+                if (typeof window.copyToClipboard === 'function') {
+                    window.copyToClipboard(name);
+                } else if (navigator.clipboard) {
+                    navigator.clipboard.writeText(name);
+                }
+            }
+
+            function schedule() {
+                if (scheduled) return;
+                scheduled = true;
+                requestAnimationFrame(() => {
+                    scheduled = false;
+                    grids.forEach(grid => grid.render());
+                });
+            }
+
+            window.addEventListener('scroll', schedule, { passive: true });
+            window.addEventListener('resize', schedule);
+            document.addEventListener('click', (event) => {
+                if (event.target.closest('.tab')) schedule();
+            });
+
+            function loadLibrary(id = '{data_id}') {
+                const node = document.getElementById(id);
+                return node ? JSON.parse(node.textContent)
+                            : { names: [], categories: [], cats: [], svgs: [] };
+            }
+
+            return { VirtualIconGrid, loadLibrary, schedule };
+        })();
+'''.replace('{data_id}', DATA_ELEMENT_ID)
+
+
+def render_icon_page_script(search_runtime_js: str) -> str:
+    """Script-Block: Virtual Grids für 'All Icons' (mit Suche) und die Kategorien"""
+    return f'''
+    <script>{search_runtime_js}{VIRTUAL_GRID_JS}
+        document.addEventListener('DOMContentLoaded', () => {{
+            const library = LYDVirtualIconGrid.loadLibrary();
+            const allIds = library.names.map((_, i) => i);
+
+            document.querySelectorAll('[data-icon-category]').forEach(container => {{
+                const category = Number(container.dataset.iconCategory);
+                new LYDVirtualIconGrid.VirtualIconGrid(
+                    container, library, allIds.filter(i => library.cats[i] === category));
+            }});
+
+            const allGrid = document.getElementById('all-icons-grid');
+            if (!allGrid) return;
+            const grid = new LYDVirtualIconGrid.VirtualIconGrid(allGrid, library, allIds);
+
+            const iconSearch = document.getElementById('icon-search');
+            if (iconSearch && typeof LYDIconSearch !== 'undefined') {{
+                const search = LYDIconSearch.createSearcher(LYDIconSearch.load());
+                let pending = 0;
+                iconSearch.addEventListener('input', (e) => {{
+                    cancelAnimationFrame(pending);
+                    pending = requestAnimationFrame(() => grid.setItems(search(e.target.value)));
+                }});
+            }}
+        }});
+    </script>
+'''
@@ -0,0 +1,206 @@
+"""
+LYD Design System - Icon Search Index
+Baut zur Build-Zeit einen Präfix-Index (Namen, Tags, Kategorien) für die Icon-Suche.
+Gesucht wird nach Wortanfängen, nicht mehr nach beliebigen Teilstrings: Bindestrich-Namen
+werden in ihre Teile zerlegt ("chevron-down" findet "down" und "chev"), ein Wortinneres
+wie "arch" in "search" dagegen nicht.
+"""
+
+import html as html_lib
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+CATEGORY_PATTERN = re.compile(r'<h3>(.*?)</h3>', re.DOTALL)
+ICON_CARD_PATTERN = re.compile(
+    r'<div class="icon-card"[^>]*?onclick="copyToClipboard\(\'([^\']+)\'\)"[^>]*>'
+    r'\s*<div class="icon-display">\s*(<svg\b.*?</svg>)',
+    re.DOTALL
+)
+DATA_BLOCK_PATTERN = re.compile(
+    r'<script type="application/json" id="icon-library-data">(.*?)</script>', re.DOTALL
+)
+TOKEN_PATTERN = re.compile(r'[a-z0-9äöüß]+')
+INDEX_ELEMENT_ID = 'icon-search-index'
+
+# Zusätzliche Suchbegriffe (DE/EN) für Icons, deren Name allein nicht reicht
+ICON_TAGS = {
+    'home': ['house', 'haus', 'start'],
+    'building': ['property', 'immobilie', 'office'],
+    'key': ['keys', 'schluessel', 'access'],
+    'location': ['map', 'pin', 'ort', 'address'],
+    'area': ['size', 'sqm', 'flaeche'],
+    'euro': ['price', 'money', 'preis', 'currency'],
+    'edit': ['pencil', 'bearbeiten', 'write'],
+    'delete': ['trash', 'remove', 'loeschen'],
+    'share': ['send', 'teilen'],
+    'download': ['save', 'export'],
+    'upload': ['import', 'attach'],
+    'search': ['find', 'suche', 'magnifier'],
+    'calendar': ['date', 'termin', 'schedule'],
+    'heart': ['favorite', 'like', 'merken'],
+    'settings': ['gear', 'einstellungen', 'preferences'],
+    'user': ['person', 'profile', 'account'],
+    'mail': ['email', 'envelope', 'message'],
+    'phone': ['call', 'telefon', 'contact'],
+    'close': ['x', 'dismiss', 'schliessen'],
+    'check': ['done', 'ok', 'success'],
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Zerlegt Namen/Begriffe in normalisierte Such-Tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def parse_icon_library(page_html: str) -> List[Dict[str, str]]:
+    """Liest Icon-Einträge (Name, Kategorie, SVG) aus der generierten Icons-Seite"""
+    data_block = DATA_BLOCK_PATTERN.search(page_html)
+    if data_block:
+        # Virtualisierte Icons-Seite: Einträge stehen im JSON-Datenblock
+        data = json.loads(data_block.group(1))
+        return [{'name': name, 'category': data['categories'][category], 'svg': svg}
+                for name, category, svg in zip(data['names'], data['cats'], data['svgs'])]
+
+    entries = []
+    seen = set()
+    categories = [(match.start(), html_lib.unescape(match.group(1)).strip())
+                  for match in CATEGORY_PATTERN.finditer(page_html)]
+    for match in ICON_CARD_PATTERN.finditer(page_html):
+        name = match.group(1)
+        if name in seen:
+            continue
+        seen.add(name)
+        category = ''
+        for position, title in categories:
+            if position > match.start():
+                break
+            category = title
+        entries.append({'name': name, 'category': category, 'svg': match.group(2)})
+    return entries
+
+
+def load_icon_library(page_path: Path) -> List[Dict[str, str]]:
+    """Lädt die Icon-Einträge einer Icons-Seite, leere Liste wenn sie noch nicht existiert"""
+    page_path = Path(page_path)
+    if not page_path.exists():
+        return []
+    return parse_icon_library(page_path.read_text(encoding='utf-8'))
+
+
+def icon_terms(entry: Dict[str, str], tags: Optional[Dict[str, List[str]]] = None) -> List[str]:
+    """Alle Tokens eines Icons: Name, Tags und Kategorie"""
+    tags = ICON_TAGS if tags is None else tags
+    terms = tokenize(entry['name'])
+    for tag in tags.get(entry['name'], []):
+        terms.extend(tokenize(tag))
+    terms.extend(tokenize(entry.get('category', '')))
+    return list(dict.fromkeys(terms))
+
+
+def build_search_index(entries: List[Dict[str, str]],
+                       tags: Optional[Dict[str, List[str]]] = None) -> Dict:
+    """Erzeugt den kompakten Präfix-Index.
+
+    Format: names/cats sind parallele Listen (cats = Index in categories),
+    prefixes bildet jedes Token-Präfix auf die aufsteigende Liste der Icon-Indizes ab.
+    Eine Suche ist damit pro Suchbegriff ein Dictionary-Lookup plus Schnittmenge;
+    jeder Suchbegriff muss Präfix eines Tokens sein (kein Infix-Treffer).
+    """
+    categories = []
+    category_ids = {}
+    names = []
+    cats = []
+    prefixes = {}
+
+    for position, entry in enumerate(entries):
+        category = entry.get('category', '')
+        if category not in category_ids:
+            category_ids[category] = len(categories)
+            categories.append(category)
+        names.append(entry['name'])
+        cats.append(category_ids[category])
+
+        for term in icon_terms(entry, tags):
+            for end in range(1, len(term) + 1):
+                postings = prefixes.setdefault(term[:end], [])
+                if not postings or postings[-1] != position:
+                    postings.append(position)
+
+    return {
+        'v': 1,
+        'names': names,
+        'categories': categories,
+        'cats': cats,
+        'prefixes': dict(sorted(prefixes.items())),
+    }
+
+
+def render_index_script(index: Dict) -> str:
+    """Bettet den Index als JSON-Datenblock ein (wird nicht ausgeführt, nur geparst)"""
+    payload = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+    payload = payload.replace('</', '<\\/')
+    return f'<script type="application/json" id="{INDEX_ELEMENT_ID}">{payload}</script>'
+
+
+# Browser-Gegenstück: Index laden/ergänzen, Suchbegriffe auflösen (memoisiert)
+SEARCH_RUNTIME_JS = r'''
+        const LYDIconSearch = (() => {
+            const TOKEN = /[a-z0-9äöüß]+/g;
+            const tokenize = text => (text.toLowerCase().match(TOKEN) || []);
+
+            function load(id = '%(index_id)s') {
+                const node = document.getElementById(id);
+                const index = node ? JSON.parse(node.textContent)
+                                   : { v: 1, names: [], categories: [], cats: [], prefixes: {} };
+                index.lookup = new Map(index.names.map((name, i) => [name, i]));
+                // Map statt Objekt: "constructor", "toString" usw. sind gewöhnliche Präfixe
+                index.prefixes = new Map(Object.entries(index.prefixes));
+                return index;
+            }
+
+            // Icons, die erst zur Laufzeit bekannt sind (z.B. aus LYD_ICONS), nachtragen
+            function extend(index, names) {
+                names.forEach(name => {
+                    if (index.lookup.has(name)) return;
+                    const position = index.names.length;
+                    index.names.push(name);
+                    index.cats.push(-1);
+                    index.lookup.set(name, position);
+                    tokenize(name).forEach(term => {
+                        for (let end = 1; end <= term.length; end++) {
+                            const prefix = term.slice(0, end);
+                            if (!index.prefixes.has(prefix)) index.prefixes.set(prefix, []);
+                            const postings = index.prefixes.get(prefix);
+                            if (postings[postings.length - 1] !== position) postings.push(position);
+                        }
+                    });
+                });
+                return index;
+            }
+
+            function createSearcher(index) {
+                const cache = new Map();
+                return query => {
+                    const terms = [...new Set(tokenize(query))];
+                    const key = terms.sort().join(' ');
+                    if (cache.has(key)) return cache.get(key);
+
+                    let result;
+                    if (!terms.length) {
+                        result = index.names.map((_, i) => i);
+                    } else {
+                        const lists = terms.map(term => index.prefixes.get(term) || []);
+                        lists.sort((a, b) => a.length - b.length);
+                        const others = lists.slice(1).map(list => new Set(list));
+                        result = lists[0].filter(i => others.every(set => set.has(i)));
+                    }
+                    cache.set(key, result);
+                    return result;
+                };
+            }
+
+            return { tokenize, load, extend, createSearcher };
+        })();
+''' % {'index_id': INDEX_ELEMENT_ID}
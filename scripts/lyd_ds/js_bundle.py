@@ -0,0 +1,547 @@
+"""
+LYD Design System - JS Bundles
+Die shared/*.js-Skripte einer Seite zu einem minifizierten, per Inhalt gehashten
+defer-Bundle zusammenfassen (ein Bundle pro Skript-Kombination) und melden, welche
+Selektoren von mehreren Skripten mit Event-Handlern belegt werden
+"""
+
+import hashlib
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from lyd_ds.dry_run import TrackedText
+
+# Reihenfolge im Bundle (globale Objekte vor den Skripten, die sie benutzen)
+SCRIPT_ORDER = [
+    'navigation.js',
+    'interactions.js',
+    'dropdown-manager.js',
+    'heroui-inspired-dropdowns.js',
+    'simple-dropdown-fix.js',
+    'force-consistency.js',
+]
+BUNDLE_DIR = 'bundles'
+MANIFEST_NAME = 'manifest.json'
+BUNDLE_URL = '/shared/bundles/'
+
+SHARED_SCRIPT_TAG = re.compile(
+    r'[ \t]*<script\b[^>]*\bsrc="(?:\.\./|/)*shared/(?:bundles/)?([\w.-]+\.js)"[^>]*>\s*</script>[ \t]*\n?')
+INLINE_SCRIPT = re.compile(r'<script\b(?![^>]*\bsrc=)[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+
+# Beispiel-Markup in Codeblöcken ist Doku-Inhalt und wird nicht umgeschrieben
+CODE_BLOCK_START = re.compile(r'<div\b[^>]*\bclass="[^"]*\bcode-block\b[^"]*"[^>]*>|<pre\b[^>]*>', re.IGNORECASE)
+_DIV_TAG = re.compile(r'<(/?)div\b[^>]*>', re.IGNORECASE)
+
+SELECTOR_APIS = {'querySelector', 'querySelectorAll', 'closest', 'matches'}
+
+# Empfänger delegierter Listener; Lifecycle-Events umschließen nur Initialisierungscode
+DELEGATION_TARGETS = {'document', 'window', 'body', 'documentElement'}
+LIFECYCLE_EVENTS = {'DOMContentLoaded', 'load', 'readystatechange'}
+
+_KEYWORDS_BEFORE_REGEX = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete',
+                          'void', 'throw', 'instanceof', 'yield', 'await'}
+_WORD = re.compile(r'[\w$\\\u0080-\uffff]+')
+_WHITESPACE = ' \t\r\f\v\n\u00a0\ufeff'
+
+
+class JSSyntaxError(ValueError):
+    """Nicht abgeschlossener String, Kommentar, Template oder Regex"""
+
+
+# --- Lexer ---------------------------------------------------------------
+
+def _skip_string(source: str, i: int) -> int:
+    quote = source[i]
+    i += 1
+    while i < len(source):
+        c = source[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == quote:
+            return i + 1
+        if c == '\n':
+            break
+        i += 1
+    raise JSSyntaxError(f'unterminated string at offset {i}')
+
+
+def _skip_regex(source: str, i: int) -> int:
+    i += 1
+    in_class = False
+    while i < len(source):
+        c = source[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '\n':
+            break
+        if c == '[':
+            in_class = True
+        elif c == ']':
+            in_class = False
+        elif c == '/' and not in_class:
+            i += 1
+            while i < len(source) and (source[i].isalnum() or source[i] == '_'):
+                i += 1
+            return i
+        i += 1
+    raise JSSyntaxError(f'unterminated regex at offset {i}')
+
+
+def _skip_template(source: str, i: int) -> int:
+    i += 1
+    while i < len(source):
+        c = source[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '`':
+            return i + 1
+        if c == '$' and source.startswith('${', i):
+            i = _tokenize(source, i + 2, [], stop_at_brace=True)
+            continue
+        i += 1
+    raise JSSyntaxError(f'unterminated template literal at offset {i}')
+
+
+def _tokenize(source: str, i: int, tokens: List[Tuple[str, str, int]],
+              stop_at_brace: bool = False) -> int:
+    """Zerlegt source ab i in (art, text, tiefe); mit stop_at_brace bis zur schließenden
+    Klammer eines ${...} (Rückgabe: Position danach)"""
+    depth = 0
+    last = ''   # letztes signifikantes Token (für Regex vs. Division)
+    length = len(source)
+    while i < length:
+        c = source[i]
+        if c in _WHITESPACE:
+            start = i
+            while i < length and source[i] in _WHITESPACE:
+                i += 1
+            tokens.append(('newline' if '\n' in source[start:i] else 'space', source[start:i], depth))
+        elif c == '/' and source.startswith('//', i):
+            end = source.find('\n', i)
+            end = length if end < 0 else end
+            tokens.append(('comment', source[i:end], depth))
+            i = end
+        elif c == '/' and source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            if end < 0:
+                raise JSSyntaxError(f'unterminated comment at offset {i}')
+            tokens.append(('comment', source[i:end + 2], depth))
+            i = end + 2
+        elif c in '"\'':
+            end = _skip_string(source, i)
+            tokens.append(('string', source[i:end], depth))
+            last, i = 'string', end
+        elif c == '`':
+            end = _skip_template(source, i)
+            tokens.append(('template', source[i:end], depth))
+            last, i = 'string', end
+        elif c == '/' and (not last or last in _KEYWORDS_BEFORE_REGEX or
+                           (len(last) == 1 and last in '(,=:[!&|?{};+-*%<>~^')):
+            end = _skip_regex(source, i)
+            tokens.append(('regex', source[i:end], depth))
+            last, i = 'regex', end
+        else:
+            match = _WORD.match(source, i)
+            if match:
+                tokens.append(('word', match.group(0), depth))
+                last, i = match.group(0), match.end()
+                continue
+            if c in '([{':
+                depth += 1
+            elif c in ')]}':
+                if c == '}' and stop_at_brace and depth == 0:
+                    return i + 1
+                depth -= 1
+            tokens.append(('punct', c, depth))
+            last = c
+            i += 1
+    if stop_at_brace:
+        raise JSSyntaxError('unterminated ${ in template literal')
+    return i
+
+
+def tokenize(source: str) -> List[Tuple[str, str, int]]:
+    tokens: List[Tuple[str, str, int]] = []
+    _tokenize(source, 0, tokens)
+    return tokens
+
+
+# --- Minifier ------------------------------------------------------------
+
+def _needs_space(before: str, after: str) -> bool:
+    a, b = before[-1], after[0]
+    if _WORD.match(a) and _WORD.match(b):
+        return True
+    return (a == b and a in '+-/') or (a in '+-' and b in '+-')
+
+
+def minify(source: str) -> str:
+    """Kommentare entfernen und Whitespace reduzieren. Zeilenumbrüche bleiben dort,
+    wo ASI davon abhängen könnte; Strings, Templates und Regexe bleiben unverändert."""
+    out: List[str] = []
+    pending = ''   # '', ' ' oder '\n' zwischen zwei Tokens
+    for kind, text, _ in tokenize(source):
+        if kind in ('comment', 'space', 'newline'):
+            breaks = kind == 'newline' or text.startswith('//') or (kind == 'comment' and '\n' in text)
+            pending = '\n' if breaks or pending == '\n' else ' '
+            continue
+        if out:
+            previous = out[-1]
+            if pending == '\n' and previous[-1] not in '{[(,;' and text[0] not in '}])':
+                out.append('\n')
+            elif pending and _needs_space(previous, text):
+                out.append(' ')
+        out.append(text)
+        pending = ''
+    return ''.join(out) + '\n'
+
+
+# --- Analyse -------------------------------------------------------------
+
+def _split_selector_list(selector: str) -> List[str]:
+    parts, depth, current = [], 0, []
+    for c in selector:
+        if c in '([':
+            depth += 1
+        elif c in ')]':
+            depth -= 1
+        if c == ',' and depth == 0:
+            parts.append(''.join(current))
+            current = []
+        else:
+            current.append(c)
+    parts.append(''.join(current))
+    return [' '.join(part.split()) for part in parts if part.strip()]
+
+
+def _assigned_name(tokens: List[Tuple[str, str, int]], index: int) -> Optional[str]:
+    """NAME aus 'NAME = a.b?.querySelector(' (index zeigt auf querySelector)"""
+    i = index - 1
+    while i > 0 and (tokens[i][1] in ('.', '?') or tokens[i][0] == 'word'):
+        i -= 1
+    if i > 0 and tokens[i][1] == '=' and tokens[i - 1][0] == 'word':
+        return tokens[i - 1][1]
+    return None
+
+
+def _callback_param(tokens: List[Tuple[str, str, int]], index: int) -> Optional[str]:
+    """NAME aus 'forEach(NAME =>', 'forEach((NAME' oder 'forEach(function(NAME' (index: forEach)"""
+    following = [text for _, text, _ in tokens[index + 1:index + 5]]
+    if following[:1] != ['(']:
+        return None
+    if following[1:3] == ['function', '(']:
+        return following[3] if len(following) > 3 else None
+    if following[1:2] == ['(']:
+        return following[2] if len(following) > 2 else None
+    return following[1] if len(following) > 1 and _WORD.match(following[1]) else None
+
+
+def _call_end(tokens: List[Tuple[str, str, int]], index: int) -> int:
+    """Index der schließenden Klammer des Aufrufs, dessen '(' auf index folgt"""
+    depth = 0
+    for position in range(index + 1, len(tokens)):
+        text = tokens[position][1]
+        if text == '(':
+            depth += 1
+        elif text == ')':
+            depth -= 1
+            if depth == 0:
+                return position
+    return len(tokens)
+
+
+def code_block_spans(text: str) -> List[Tuple[int, int]]:
+    """(Start, Ende) von <div class="code-block">…</div> (verschachtelte divs gezählt) und <pre>…</pre>"""
+    spans: List[Tuple[int, int]] = []
+    position = 0
+    while True:
+        start = CODE_BLOCK_START.search(text, position)
+        if start is None:
+            return spans
+        if start.group(0).lower().startswith('<pre'):
+            close = text.lower().find('</pre>', start.end())
+            end = len(text) if close < 0 else close + len('</pre>')
+        else:
+            depth, end = 1, len(text)
+            for tag in _DIV_TAG.finditer(text, start.end()):
+                depth += -1 if tag.group(1) else 1
+                if depth == 0:
+                    end = tag.end()
+                    break
+        spans.append((start.start(), end))
+        position = end
+
+
+def bound_selectors(source: str) -> Set[str]:
+    """Selektoren, auf deren Elementen addEventListener aufgerufen wird.
+
+    Verfolgt Variablen aus 'const x = el.querySelector(sel)', 'xs.forEach(x => ...)'
+    und 'querySelectorAll(sel).forEach(x => ...)' bis zu 'x.addEventListener'.
+    Bei Delegation (Listener auf document/window/body) zählen die Selektoren aus
+    closest(sel)/matches(sel) im Handler.
+    """
+    tokens = [token for token in tokenize(source) if token[0] not in ('space', 'newline', 'comment')]
+    variables: Dict[str, str] = {}
+    bound: Set[str] = set()
+    listeners: List[Tuple[int, bool]] = []   # (Ende des addEventListener-Aufrufs, delegiert?)
+    for index, (kind, text, _) in enumerate(tokens):
+        while listeners and listeners[-1][0] < index:
+            listeners.pop()
+        if kind in ('string', 'template') and index >= 2 and tokens[index - 1][1] == '(' \
+                and tokens[index - 2][1] in ('closest', 'matches') and listeners and listeners[-1][1]:
+            if '${' not in text:
+                bound.update(_split_selector_list(text[1:-1]))
+            continue
+        if kind in ('string', 'template') and index >= 2 and tokens[index - 1][1] == '(' \
+                and tokens[index - 2][1] in ('querySelector', 'querySelectorAll'):
+            if '${' in text:
+                continue
+            selector = text[1:-1]
+            name = _assigned_name(tokens, index - 2)
+            if name:
+                variables[name] = selector
+            # querySelectorAll(sel).forEach(x => ...)
+            if [token[1] for token in tokens[index + 1:index + 4]] == [')', '.', 'forEach']:
+                name = _callback_param(tokens, index + 3)
+                if name:
+                    variables[name] = selector
+        elif kind == 'word' and text == 'forEach' and index >= 2 and tokens[index - 1][1] == '.' \
+                and tokens[index - 2][1] in variables:
+            # const xs = querySelectorAll(sel); xs.forEach(x => ...)
+            name = _callback_param(tokens, index)
+            if name:
+                variables[name] = variables[tokens[index - 2][1]]
+        elif kind == 'word' and text == 'addEventListener' and index >= 2:
+            receiver = tokens[index - 2][1]
+            if receiver in variables:
+                bound.update(_split_selector_list(variables[receiver]))
+            event = tokens[index + 2][1][1:-1] if index + 2 < len(tokens) else ''
+            delegated = receiver in DELEGATION_TARGETS and event not in LIFECYCLE_EVENTS
+            listeners.append((_call_end(tokens, index), delegated))
+    return bound
+
+
+def queried_selectors(source: str) -> Set[str]:
+    """Selektoren aus querySelector(All)/closest/matches-Aufrufen mit String-Literal"""
+    tokens = [token for token in tokenize(source) if token[0] not in ('space', 'newline', 'comment')]
+    selectors: Set[str] = set()
+    for index, (kind, text, _) in enumerate(tokens[2:], 2):
+        if kind in ('string', 'template') and '${' not in text and tokens[index - 1][1] == '(' \
+                and tokens[index - 2][1] in SELECTOR_APIS:
+            selectors.update(_split_selector_list(text[1:-1]))
+    return selectors
+
+
+def top_level_declarations(source: str) -> Set[str]:
+    """Namen aus class/let/const auf oberster Ebene (kollidieren beim Zusammenfügen)"""
+    tokens = [token for token in tokenize(source) if token[0] not in ('space', 'newline', 'comment')]
+    names = set()
+    for index, (kind, text, depth) in enumerate(tokens[:-1]):
+        if depth == 0 and kind == 'word' and text in ('class', 'let', 'const'):
+            following = tokens[index + 1]
+            if following[0] == 'word':
+                names.add(following[1])
+    return names
+
+
+def uses_at_top_level(source: str, names: Set[str]) -> Set[str]:
+    """Welche der Namen ein Inline-Skript außerhalb von Funktionen/Blöcken benutzt oder
+    neu deklariert (ein späteres defer-Bundle würde die Seitenversion überschreiben)"""
+    return {text for kind, text, depth in tokenize(source)
+            if kind == 'word' and depth == 0 and text in names}
+
+
+def exported_names(source: str) -> Set[str]:
+    """Globale Namen eines Skripts: window.X = ..., function X auf oberster Ebene"""
+    tokens = [token for token in tokenize(source) if token[0] not in ('space', 'newline', 'comment')]
+    names = set()
+    for index, (kind, text, depth) in enumerate(tokens[:-2]):
+        if depth != 0 or kind != 'word':
+            continue
+        if text == 'window' and tokens[index + 1][1] == '.' and tokens[index + 2][0] == 'word':
+            names.add(tokens[index + 2][1])
+        elif text in ('function', 'class') and tokens[index + 1][0] == 'word':
+            names.add(tokens[index + 1][1])
+    return names
+
+
+# --- Bundles -------------------------------------------------------------
+
+def _ordered(scripts: Iterable[str]) -> Tuple[str, ...]:
+    rank = {name: position for position, name in enumerate(SCRIPT_ORDER)}
+    return tuple(sorted(set(scripts), key=lambda name: (rank.get(name, len(rank)), name)))
+
+
+class BundleBuilder:
+    """Baut pro Skript-Kombination (Profil) ein Bundle unter shared/bundles/ und
+    ersetzt die <script src="/shared/...">-Tags der Seiten durch ein defer-Tag."""
+
+    def __init__(self, v2_root, writer):
+        self.v2_root = Path(v2_root)
+        self.shared = self.v2_root / 'shared'
+        self.bundle_dir = self.shared / BUNDLE_DIR
+        self.writer = writer
+        self.track = getattr(writer, 'tracks_edits', False)
+        self._sources: Dict[str, str] = {}
+        self._bundles: Dict[Tuple[str, ...], Dict] = {}
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        try:
+            with open(self.bundle_dir / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def source(self, name: str) -> str:
+        if name not in self._sources:
+            self._sources[name] = (self.shared / name).read_text(encoding='utf-8')
+        return self._sources[name]
+
+    def scripts_for(self, names: Iterable[str]) -> Tuple[str, ...]:
+        """Skriptnamen eines Seiten-Tags; bereits gebündelte Seiten über das Manifest"""
+        scripts = []
+        for name in names:
+            if name in self.manifest:
+                scripts.extend(self.manifest[name]['scripts'])
+            else:
+                scripts.append(name)
+        return _ordered(scripts)
+
+    def bundle(self, scripts: Tuple[str, ...]) -> Dict:
+        if scripts in self._bundles:
+            return self._bundles[scripts]
+
+        declared: Dict[str, str] = {}
+        parts = []
+        for name in scripts:
+            source = self.source(name)
+            for declaration in top_level_declarations(source):
+                if declaration in declared:
+                    raise JSSyntaxError(f'{name} and {declared[declaration]} both declare '
+                                        f'{declaration!r} at top level')
+                declared[declaration] = name
+            # ; gegen ASI-Überraschungen an der Dateigrenze
+            parts.append(minify(source).rstrip('\n') + '\n;')
+        content = '\n'.join(parts) + '\n'
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:10]
+        file_name = f'lyd.{digest}.js'
+        exports = set()
+        for name in scripts:
+            exports |= exported_names(self.source(name))
+        info = {
+            'file': file_name,
+            'scripts': list(scripts),
+            'bytes': len(content.encode('utf-8')),
+            'source_bytes': sum(len(self.source(name).encode('utf-8')) for name in scripts),
+            'exports': sorted(exports),
+        }
+        if not (self.bundle_dir / file_name).exists():  # Name = Inhalt
+            self.writer.write(self.bundle_dir / file_name, content)
+        self._bundles[scripts] = info
+        return info
+
+    def rewrite_page(self, path: Path) -> Optional[Dict]:
+        doc = TrackedText(path.read_text(encoding='utf-8'), track=self.track)
+        code = code_block_spans(doc.text)
+        matches = [match for match in SHARED_SCRIPT_TAG.finditer(doc.text)
+                   if not any(start <= match.start() < end for start, end in code)]
+        names = [match.group(1) for match in matches
+                 if match.group(1) in self.manifest or (self.shared / match.group(1)).exists()]
+        if not names:
+            return None
+        scripts = self.scripts_for(names)
+        info = self.bundle(scripts)
+
+        # Inline-Skripte, die Bundle-Globals sofort (nicht erst in Handlern) benutzen,
+        # brauchen ein synchrones Bundle
+        exports = set(info['exports'])
+        blocking = set()
+        for inline in INLINE_SCRIPT.finditer(doc.text):
+            blocking |= uses_at_top_level(inline.group(1), exports)
+        attributes = '' if blocking else ' defer'
+        tag = f'<script{attributes} src="{BUNDLE_URL}{info["file"]}"></script>'
+
+        first = matches[0]
+        indent = re.match(r'[ \t]*', first.group(0)).group(0)
+        edits = [(first.start(), first.end(), f'{indent}{tag}\n')]
+        edits += [(match.start(), match.end(), '') for match in matches[1:]
+                  if match.group(1) in names]
+        doc.splice(edits)
+        if doc.changed:
+            self.writer.write(path, doc)
+        return {'page': path, 'scripts': scripts, 'file': info['file'], 'defer': not blocking,
+                'blocking': sorted(blocking)}
+
+    def write_manifest(self):
+        manifest = {info['file']: info for info in self._bundles.values()}
+        if manifest != self.manifest:
+            self.writer.write(self.bundle_dir / MANIFEST_NAME,
+                              json.dumps(manifest, indent=2, sort_keys=True) + '\n')
+        return manifest
+
+    def stale_bundles(self) -> List[Path]:
+        """Alte Bundles, die keine Seite mehr referenziert"""
+        current = {info['file'] for info in self._bundles.values()}
+        if not self.bundle_dir.exists():
+            return []
+        return [path for path in sorted(self.bundle_dir.glob('lyd.*.js')) if path.name not in current]
+
+    def conflicts(self) -> Dict[Tuple[str, ...], Dict[str, List[str]]]:
+        """Pro Profil: Selektor -> Skripte, die darauf Handler binden (mehr als eines)"""
+        bound = {name: bound_selectors(self.source(name))
+                 for scripts in self._bundles for name in scripts}
+        report = {}
+        for scripts in self._bundles:
+            owners: Dict[str, List[str]] = defaultdict(list)
+            for name in scripts:
+                for selector in bound[name]:
+                    owners[selector].append(name)
+            shared = {selector: names for selector, names in sorted(owners.items()) if len(names) > 1}
+            if shared:
+                report[scripts] = shared
+        return report
+
+
+def build_bundles(v2_root, writer, pages: Optional[Sequence[Path]] = None,
+                  skip: Iterable[str] = ('backups', 'node_modules', 'templates')) -> Dict:
+    """Alle Seiten unter v2_root bündeln; liefert Seiten, Bundles und Selektor-Konflikte"""
+    from lyd_ds.baked_styles import iter_pages
+
+    builder = BundleBuilder(v2_root, writer)
+    results = []
+    for path in (pages if pages is not None else iter_pages(v2_root, skip)):
+        result = builder.rewrite_page(path)
+        if result:
+            results.append(result)
+    manifest = builder.write_manifest()
+    return {
+        'pages': results,
+        'bundles': manifest,
+        'conflicts': builder.conflicts(),
+        'stale': builder.stale_bundles(),
+    }
+
+
+def print_report(report: Dict, root: Optional[Path] = None):
+    for info in report['bundles'].values():
+        saved = 100 - info['bytes'] * 100 / info['source_bytes'] if info['source_bytes'] else 0
+        print(f"📦 {info['file']}: {' + '.join(info['scripts'])} "
+              f"({info['source_bytes'] / 1024:.1f} KB → {info['bytes'] / 1024:.1f} KB, -{saved:.0f}%)")
+    for result in report['pages']:
+        if not result['defer']:
+            page = result['page'].relative_to(root) if root else result['page']
+            print(f"⚠️  {page}: inline script uses {', '.join(result['blocking'])} "
+                  f"at load time or redefines them - bundle not deferred")
+    for scripts, selectors in report['conflicts'].items():
+        print(f"\n⚠️  Selectors bound by more than one script in {' + '.join(scripts)}:")
+        for selector, names in selectors.items():
+            print(f"  • {selector}: {', '.join(names)}")
+    for path in report['stale']:
+        print(f"🗑️  Unreferenced bundle: {path.name}")
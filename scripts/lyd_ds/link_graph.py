@@ -0,0 +1,223 @@
+"""
+LYD Design System - Link Graph
+Parst jede generierte Seite einmal (parallel, mit Cache pro Datei) und baut einen
+Link-Graphen aus hrefs, Anker-Zielen und Asset-Referenzen. Aufgelöst wird gegen den
+Ausgabebaum wie beim Host (lyd_ds.static_server.StaticSite) - ohne Netzwerk.
+"""
+
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from http import HTTPStatus
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote, urljoin, urlsplit
+
+from lyd_ds.atomic import write_atomic
+from lyd_ds.service_worker import page_url
+from lyd_ds.static_server import StaticSite
+
+CACHE_PATH = Path('.lyd-ds') / 'links.json'
+CACHE_VERSION = 1
+PARALLEL_THRESHOLD = 16   # darunter lohnt der Prozess-Pool nicht
+
+LINK_ATTRIBUTES = {
+    'a': 'href', 'area': 'href', 'link': 'href', 'script': 'src', 'img': 'src',
+    'iframe': 'src', 'source': 'src', 'video': 'src', 'audio': 'src', 'use': 'href',
+}
+# templates/: Platzhalter-Links, shared/: Fragmente (navigation.html) - nur als Ziele geprüft
+SKIP_DIRS = ('backups', 'node_modules', 'templates', 'shared')
+SKIP_SCHEMES = ('http', 'https', 'mailto', 'tel', 'javascript', 'data', 'blob')
+
+
+class _LinkParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.ids: Set[str] = set()
+        self.links: List[Tuple[str, str, int]] = []   # (tag, url, zeile)
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        for name in ('id', 'name' if tag == 'a' else None):
+            if name and attributes.get(name):
+                self.ids.add(attributes[name])
+        attribute = LINK_ATTRIBUTES.get(tag)
+        value = attributes.get(attribute) if attribute else None
+        if value is None and tag == 'use':
+            value = attributes.get('xlink:href')
+        if value:
+            self.links.append((tag, value.strip(), self.getpos()[0]))
+
+    handle_startendtag = handle_starttag
+
+
+def parse_page(path: str) -> Dict:
+    """ids und Links einer Datei (läuft auch in Worker-Prozessen)"""
+    parser = _LinkParser()
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        parser.feed(f.read())
+    parser.close()
+    return {'ids': sorted(parser.ids), 'links': parser.links}
+
+
+class Link:
+    __slots__ = ('source', 'tag', 'href', 'line', 'target', 'fragment', 'problem')
+
+    def __init__(self, source: str, tag: str, href: str, line: int):
+        self.source = source
+        self.tag = tag
+        self.href = href
+        self.line = line
+        self.target: Optional[str] = None     # aufgelöste URL (nach Weiterleitung)
+        self.fragment = ''
+        self.problem: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return {'source': self.source, 'href': self.href, 'line': self.line,
+                'target': self.target, 'problem': self.problem}
+
+
+class LinkGraph:
+    """Seiten-URL -> ausgehende Links; Ziele und Anker gegen den Baum aufgelöst"""
+
+    def __init__(self, site_root, cache_path: Optional[Path] = None, skip: Iterable[str] = SKIP_DIRS):
+        self.site = StaticSite(site_root)
+        self.root = self.site.root
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.skip = set(skip)
+        self.pages: Dict[str, Dict] = {}          # url -> {'path', 'ids', 'links'}
+        self.links: List[Link] = []
+        self.parsed = 0
+        self.cached = 0
+
+    # --- Einlesen ---------------------------------------------------------
+
+    def _files(self) -> List[Path]:
+        files = []
+        for directory, names, filenames in os.walk(self.root):
+            names[:] = sorted(name for name in names if name not in self.skip and not name.startswith('.'))
+            files.extend(Path(directory) / name for name in sorted(filenames) if name.endswith('.html'))
+        return files
+
+    def _load_cache(self) -> Dict:
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data['files'] if data.get('version') == CACHE_VERSION else {}
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def scan(self, jobs: Optional[int] = None) -> 'LinkGraph':
+        """Alle Seiten einlesen; unveränderte (mtime + Größe) kommen aus dem Cache"""
+        cache = self._load_cache()
+        entries, todo = {}, []
+        for path in self._files():
+            key = path.relative_to(self.root).as_posix()
+            stat = path.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            cached = cache.get(key)
+            if cached and cached['stamp'] == stamp:
+                entries[key] = cached
+                self.cached += 1
+            else:
+                entries[key] = {'stamp': stamp}
+                todo.append(key)
+
+        paths = [str(self.root / key) for key in todo]
+        if len(paths) >= PARALLEL_THRESHOLD and jobs != 1:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(parse_page, paths, chunksize=8))
+        else:
+            results = [parse_page(path) for path in paths]
+        for key, result in zip(todo, results):
+            entries[key].update(result)
+        self.parsed = len(todo)
+
+        if self.cache_path and (todo or set(cache) != set(entries)):
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.cache_path, json.dumps({'version': CACHE_VERSION, 'files': entries},
+                                                     separators=(',', ':'), sort_keys=True) + '\n')
+
+        for key, entry in entries.items():
+            url = page_url(self.root, self.root / key)
+            self.pages[url] = {'path': key, 'ids': set(entry['ids']), 'links': entry['links']}
+        self._resolve()
+        return self
+
+    # --- Auflösen ---------------------------------------------------------
+
+    def _resolve(self):
+        self.links = []
+        for url, page in self.pages.items():
+            for tag, href, line in page['links']:
+                link = Link(url, tag, href, line)
+                self._resolve_link(link)
+                if link.target is not None or link.problem:
+                    self.links.append(link)
+
+    def _resolve_link(self, link: Link):
+        href = link.href
+        parts = urlsplit(href)
+        if parts.scheme in SKIP_SCHEMES or href.startswith('//') or href.startswith('{{'):
+            return
+        absolute = urlsplit(urljoin(link.source, href))
+        link.fragment = unquote(absolute.fragment)
+        path = absolute.path or link.source
+
+        status, file_path, location = self.site.resolve(path)
+        if location:
+            status, file_path, _ = self.site.resolve(location)
+            path = location
+        if file_path is None:
+            link.problem = 'not found' if status == HTTPStatus.NOT_FOUND else f'{status.value} {status.phrase}'
+            link.target = path
+            return
+        link.target = page_url(self.root, file_path) if file_path.suffix == '.html' else path
+
+        if link.fragment and file_path.suffix == '.html':
+            page = self.pages.get(link.target)
+            if page is not None and link.fragment not in page['ids']:
+                link.problem = f'missing anchor #{link.fragment}'
+
+    # --- Auswertung -------------------------------------------------------
+
+    @property
+    def broken(self) -> List[Link]:
+        return [link for link in self.links if link.problem]
+
+    def inbound(self) -> Dict[str, Set[str]]:
+        """Ziel-URL -> Seiten, die darauf verlinken"""
+        inbound: Dict[str, Set[str]] = defaultdict(set)
+        for link in self.links:
+            if link.target and not link.problem and link.target != link.source:
+                inbound[link.target].add(link.source)
+        return inbound
+
+    def orphans(self) -> List[str]:
+        """Seiten, auf die keine andere Seite verlinkt (außer der Startseite)"""
+        inbound = self.inbound()
+        return sorted(url for url in self.pages if url != '/' and not inbound.get(url))
+
+
+def print_report(graph: LinkGraph, limit: int = 50):
+    links = len(graph.links)
+    print(f"🔗 {len(graph.pages)} page(s), {links} internal link(s) "
+          f"({graph.parsed} parsed, {graph.cached} from cache)")
+    broken = graph.broken
+    by_target: Dict[Tuple[str, str], List[Link]] = defaultdict(list)
+    for link in broken:
+        by_target[(link.target or link.href, link.problem)].append(link)
+    for (target, problem), items in sorted(by_target.items(), key=lambda item: -len(item[1]))[:limit]:
+        sources = ', '.join(f"{graph.pages[link.source]['path']}:{link.line}" for link in items[:3])
+        more = f' (+{len(items) - 3} more)' if len(items) > 3 else ''
+        print(f"  ❌ {target} - {problem}: {sources}{more}")
+    orphans = graph.orphans()
+    if orphans:
+        print(f"  ⚠️  {len(orphans)} page(s) without inbound links: {', '.join(orphans[:10])}"
+              + (' …' if len(orphans) > 10 else ''))
+    if not broken:
+        print("  ✅ No broken links")
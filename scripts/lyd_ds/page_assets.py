@@ -0,0 +1,279 @@
+"""
+LYD Design System - Page Assets
+Welche Stylesheets und Skripte eine Seite braucht, aus dem gerenderten Markup
+bestimmt (Klassen, <lyd-*>-Tags, Attribute, benutzte Globals) - statt jede Seite
+mit dem kompletten Satz an Shared-Dateien auszuliefern
+"""
+
+import json
+import re
+from html.parser import HTMLParser
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from lyd_ds.js_bundle import (BUNDLE_DIR, MANIFEST_NAME, _split_selector_list, bound_selectors,
+                              code_block_spans, exported_names)
+
+ASSETS_PLACEHOLDER = '{{PAGE_ASSETS}}'
+
+_WORD = re.compile(r'[\w$]+')
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_PRELUDE = re.compile(r'([^{};]+)\{')
+_PSEUDO_ARGUMENT = re.compile(r'::?[\w-]+\([^)]*\)')
+_TRIGGER = re.compile(r'([.\[])(-?[_a-zA-Z][\w-]*)')
+_COMBINATOR = re.compile(r'\s*[>+~]\s*|\s+')
+
+# <link>/<script> auf eine Datei unter shared/ (auch bundles/lyd.*.js)
+SHARED_ASSET_TAG = re.compile(
+    r'[ \t]*<(?:link|script)\b[^>]*\b(?:href|src)="(?:\.\./|/)*shared/((?:bundles/)?[\w.-]+\.(?:css|js))"'
+    r'[^>]*>(?:\s*</script>)?[ \t]*\n?')
+
+
+class Asset:
+    """Eine einzubindende Datei (kind: style, script, module oder modulepreload -
+    nur der Hinweis, z.B. für dynamisch importierte Module) und woran man erkennt,
+    dass die Seite sie braucht. always=True: ohne Bedingung."""
+
+    __slots__ = ('url', 'kind', 'classes', 'tags', 'attributes', 'globals', 'always')
+
+    def __init__(self, url: str, kind: str, classes: Iterable[str] = (), tags: Iterable[str] = (),
+                 attributes: Iterable[str] = (), globals: Iterable[str] = (), always: bool = False):
+        if kind not in ('style', 'script', 'module', 'modulepreload'):
+            raise ValueError(f'unknown asset kind: {kind}')
+        self.url = url
+        self.kind = kind
+        self.classes = frozenset(classes)
+        self.tags = frozenset(tags)
+        self.attributes = frozenset(attributes)
+        self.globals = frozenset(globals)
+        self.always = always
+
+    def needed_by(self, usage: 'PageUsage') -> bool:
+        return (self.always
+                or bool(self.classes & usage.classes)
+                or bool(self.tags & usage.tags)
+                or bool(self.attributes & usage.attributes)
+                or bool(self.globals & usage.words))
+
+    def __repr__(self):
+        return f'Asset({self.url!r}, {self.kind!r})'
+
+
+# Shared-Dateien der v2-Seiten: (Datei, Art, zusätzliche Auslöser-Attribute). Klassen
+# und Attribute stammen aus den Selektoren des Stylesheets bzw. den Elementen, an die
+# das Skript Handler bindet (js_bundle.bound_selectors), Globals aus exported_names -
+# siehe v2_assets(). site-search.js bindet über eine benannte Funktion, daher explizit.
+V2_SHARED = (
+    ('modal.css', 'style', ()),
+    ('interactions.js', 'script', ()),
+    ('heroui-inspired-dropdowns.js', 'script', ()),
+    ('site-search.js', 'script', ('data-site-search',)),
+)
+
+
+def selector_triggers(selectors: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+    """Klassen und Attribute, an denen Selektoren hängen: je Selektor das erste Klassen-
+    oder Attribut-Glied des linken Compound (.a .b -> a, .a.b -> a, [x] -> x)"""
+    classes: Set[str] = set()
+    attributes: Set[str] = set()
+    for selector in selectors:
+        compound = _COMBINATOR.split(_PSEUDO_ARGUMENT.sub('', selector.strip()), 1)[0]
+        trigger = _TRIGGER.search(compound)
+        if trigger:
+            (classes if trigger.group(1) == '.' else attributes).add(trigger.group(2))
+    return classes, attributes
+
+
+def stylesheet_selectors(css: str) -> Set[str]:
+    selectors: Set[str] = set()
+    for prelude in _CSS_PRELUDE.findall(_CSS_COMMENT.sub('', css)):
+        if not prelude.strip().startswith('@'):
+            selectors.update(_split_selector_list(prelude))
+    return selectors
+
+
+def shared_asset(url: str, kind: str, source: str, attributes: Iterable[str] = ()) -> Asset:
+    """Asset mit Auslösern aus dem Dateiinhalt"""
+    if kind == 'style':
+        classes, found = selector_triggers(stylesheet_selectors(source))
+        return Asset(url, kind, classes=classes, attributes={*found, *attributes})
+    classes, found = selector_triggers(bound_selectors(source))
+    return Asset(url, kind, classes=classes, attributes={*found, *attributes},
+                 globals=exported_names(source))
+
+
+def v2_assets(v2_root) -> Tuple[Asset, ...]:
+    """V2_SHARED aus v2_root/shared/ gelesen; site-search.js entsteht erst beim Build
+    (lyd_ds.site_search) und wird sonst aus dessen Laufzeit-Quelltext bestimmt"""
+    from lyd_ds.site_search import RUNTIME_NAME, SEARCH_RUNTIME_JS
+
+    shared = Path(v2_root) / 'shared'
+    assets = []
+    for name, kind, attributes in V2_SHARED:
+        path = shared / name
+        if path.exists():
+            source = path.read_text(encoding='utf-8')
+        elif name == RUNTIME_NAME:
+            source = SEARCH_RUNTIME_JS
+        else:
+            continue
+        assets.append(shared_asset(f'/shared/{name}', kind, source, attributes))
+    return tuple(assets)
+
+
+class PageUsage(HTMLParser):
+    """Sammelt Tags, Klassen, Attributnamen und die Wörter aus Inline-Skripten
+    und on*-Handlern einer Seite"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tags: Set[str] = set()
+        self.classes: Set[str] = set()
+        self.attributes: Set[str] = set()
+        self.words: Set[str] = set()
+        self._in_script = False
+
+    @classmethod
+    def scan(cls, html: str) -> 'PageUsage':
+        usage = cls()
+        usage.feed(html)
+        usage.close()
+        return usage
+
+    def handle_starttag(self, tag, attrs):
+        self.tags.add(tag)
+        for name, value in attrs:
+            self.attributes.add(name)
+            if name == 'class' and value:
+                self.classes.update(value.split())
+            elif name.startswith('on') and value:
+                self.words.update(_WORD.findall(value))
+        # Nur Inline-Skripte; <script src> zählt nicht als Benutzung
+        self._in_script = tag == 'script' and not dict(attrs).get('src')
+
+    def handle_endtag(self, tag):
+        if tag == 'script':
+            self._in_script = False
+
+    def handle_data(self, data):
+        if self._in_script:
+            self.words.update(_WORD.findall(data))
+            # import('../../src/icons/icon-library.js') -> 'icon-library.js'
+            self.words.update(re.findall(r'[\w.-]+\.js\b', data))
+
+
+def module_assets(imports: Sequence[str]) -> List[Asset]:
+    """ES-Module aus einer Import-Liste: lyd-foo.js wird gebraucht, wenn <lyd-foo>
+    vorkommt; andere Module (index.js, icon-library.js), wenn die Seite überhaupt
+    lyd-Elemente enthält. Nennt ein Inline-Skript den Dateinamen (import()), gibt
+    es zusätzlich den modulepreload-Hinweis."""
+    assets = []
+    for url in imports:
+        url = url.strip()
+        if not url:
+            continue
+        name = PurePosixPath(url).name
+        stem = name[:-len('.js')] if name.endswith('.js') else name
+        if stem.startswith('lyd-'):
+            assets.append(Asset(url, 'module', tags=(stem,)))
+        else:
+            assets.append(Asset(url, 'module', tags=('lyd-*',)))
+            assets.append(Asset(url, 'modulepreload', globals=(name,)))
+    return assets
+
+
+def required_assets(html: str, assets: Sequence[Asset]) -> List[Asset]:
+    usage = PageUsage.scan(html)
+    if any(tag.startswith('lyd-') for tag in usage.tags):
+        usage.tags.add('lyd-*')
+    return [asset for asset in assets if asset.needed_by(usage)]
+
+
+def render_assets(assets: Sequence[Asset], indent: str = '    ') -> str:
+    """modulepreload-Hinweise, dann Stylesheets, klassische Skripte und Module.
+    Klassische Skripte fasst lyd_ds.js_bundle danach zu einem defer-Bundle zusammen."""
+    preload = dict.fromkeys(asset.url for asset in assets if asset.kind in ('module', 'modulepreload'))
+    lines = [f'<link rel="modulepreload" href="{url}">' for url in preload]
+    lines += [f'<link rel="stylesheet" href="{asset.url}">' for asset in assets if asset.kind == 'style']
+    lines += [f'<script src="{asset.url}"></script>' for asset in assets if asset.kind == 'script']
+    lines += [f'<script type="module" src="{asset.url}"></script>' for asset in assets if asset.kind == 'module']
+    return f'\n{indent}'.join(lines)
+
+
+def include_assets(html: str, assets: Sequence[Asset]) -> str:
+    """Setzt die benötigten Tags an {{PAGE_ASSETS}} (oder vor </head>) ein"""
+    needed = required_assets(html, assets)
+    match = re.search(r'^([ \t]*)' + re.escape(ASSETS_PLACEHOLDER) + r'[ \t]*\n?', html, re.MULTILINE)
+    if match:
+        block = render_assets(needed, match.group(1))
+        replacement = f'{match.group(1)}{block}\n' if block else ''
+        return html[:match.start()] + replacement + html[match.end():]
+    if ASSETS_PLACEHOLDER in html:  # mitten in einer Zeile
+        return html.replace(ASSETS_PLACEHOLDER, render_assets(needed), 1)
+    head_end = html.find('</head>')
+    if head_end < 0 or not needed:
+        return html
+    return html[:head_end] + '    ' + render_assets(needed) + '\n' + html[head_end:]
+
+
+def load_bundle_scripts(v2_root) -> Dict[str, List[str]]:
+    """bundles/lyd.*.js -> enthaltene Skripte (aus dem Manifest von lyd_ds.js_bundle)"""
+    try:
+        with open(Path(v2_root) / 'shared' / BUNDLE_DIR / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {f'{BUNDLE_DIR}/{name}': info['scripts'] for name, info in manifest.items()}
+
+
+def prune_assets(html: str, assets: Sequence[Asset],
+                 bundles: Optional[Mapping[str, Sequence[str]]] = None) -> Tuple[str, List[str]]:
+    """Auf einer fertigen Seite die Shared-Dateien aus assets entfernen, die sie nicht
+    braucht; Bundle-Tags werden in die benötigten Einzelskripte aufgelöst (das
+    Bundle-Skript fasst sie danach neu zusammen). Fügt nichts hinzu, Beispiel-Markup
+    in Codeblöcken bleibt unberührt. Liefert (Seite, entfernte URLs)."""
+    managed = {asset.url: asset for asset in assets}
+    bundles = bundles or {}
+    usage = None
+    code = code_block_spans(html)
+    edits = []
+    removed: List[str] = []
+    for match in SHARED_ASSET_TAG.finditer(html):
+        if any(start <= match.start() < end for start, end in code):
+            continue
+        name = match.group(1)
+        urls = [f'/shared/{script}' for script in bundles.get(name, (name,))]
+        if not all(url in managed for url in urls):
+            continue
+        if usage is None:
+            usage = PageUsage.scan(html)
+        kept = [url for url in urls if managed[url].needed_by(usage)]
+        removed += [url for url in urls if url not in kept]
+        if kept == urls and name not in bundles:
+            continue
+        indent = re.match(r'[ \t]*', match.group(0)).group(0)
+        replacement = ''.join(f'{indent}{line}\n' for line in render_assets([managed[url] for url in kept]).split('\n')
+                              if line)
+        edits.append((match.start(), match.end(), replacement))
+    if not removed:
+        return html, []
+    for start, end, replacement in reversed(edits):
+        html = html[:start] + replacement + html[end:]
+    return html, removed
+
+
+def prune_site_assets(v2_root, writer, assets: Optional[Sequence[Asset]] = None,
+                      skip: Iterable[str] = ('backups', 'node_modules', 'templates')) -> List[Dict]:
+    """prune_assets für alle Seiten unter v2_root; danach js_bundle.build_bundles laufen lassen"""
+    from lyd_ds.baked_styles import iter_pages
+
+    assets = v2_assets(v2_root) if assets is None else assets
+    bundles = load_bundle_scripts(v2_root)
+    results = []
+    for path in iter_pages(Path(v2_root), skip):
+        html = path.read_text(encoding='utf-8')
+        pruned, removed = prune_assets(html, assets, bundles)
+        if removed:
+            writer.write(path, pruned)
+            results.append({'page': path, 'removed': removed})
+    return results
@@ -0,0 +1,210 @@
+"""
+LYD Design System - Page Budgets
+Misst pro generierter Seite Gesamtgröße, Inline-CSS/JS, DOM-Knoten, maximale
+Verschachtelung und Inline-SVGs und vergleicht sie mit den Budgets aus der
+Komponenten-Config ("budget" in component-data/<katalog>/<komponente>.json)
+"""
+
+from html.parser import HTMLParser
+from typing import Dict, List, Mapping, Optional
+
+# Standard-Budgets, pro Komponente einzeln überschreibbar
+# (größte v2-Seite bei Einführung: 42 KB, 14 KB CSS, 4,5 KB JS, 341 Knoten, Tiefe 14, 27 SVGs)
+DEFAULT_BUDGET = {
+    'bytes': 64_000,
+    'inline_css_bytes': 20_000,
+    'inline_js_bytes': 12_000,
+    'dom_nodes': 600,
+    'max_depth': 20,
+    'inline_svgs': 40,
+}
+WARN_RATIO = 0.9   # ab 90 % des Budgets warnen
+
+# v2-Seite (relativ zur Site) -> (Katalog, Komponente), deren "budget" für lyd-ds budget gilt
+SITE_PAGES = {
+    'components/accordion': ('generator', 'accordion'),
+    'components/buttons': ('generator', 'button'),
+    'components/cards': ('generator', 'card'),
+    'components/checkbox': ('generator', 'checkbox'),
+    'components/inputs': ('generator', 'input'),
+    'components/modal': ('generator', 'modal'),
+    'components/pagination': ('generator', 'pagination'),
+    'components/progress': ('generator', 'progress'),
+    'components/radio': ('generator', 'radio'),
+    'components/select': ('generator', 'select'),
+    'components/spinner': ('generator', 'spinner'),
+    'components/switch': ('generator', 'switch'),
+    'components/table': ('generator', 'table'),
+    'components/tabs': ('generator', 'tabs'),
+    'components/textarea': ('generator', 'textarea'),
+    'components/toast': ('generator', 'toast'),
+}
+
+METRIC_LABELS = {
+    'bytes': 'page size',
+    'inline_css_bytes': 'inline CSS',
+    'inline_js_bytes': 'inline JS',
+    'dom_nodes': 'DOM nodes',
+    'max_depth': 'DOM depth',
+    'inline_svgs': 'inline SVGs',
+}
+
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+             'param', 'source', 'track', 'wbr'}
+
+
+class BudgetError(RuntimeError):
+    """Seite(n) über Budget - der Build wird nicht veröffentlicht"""
+
+
+class _MetricsParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.inline_css = 0
+        self.inline_js = 0
+        self.nodes = 0
+        self.max_depth = 0
+        self.svgs = 0
+        self._stack: List[str] = []
+        self._raw: Optional[str] = None   # 'style' oder 'script' (nur inline)
+
+    def handle_starttag(self, tag, attrs):
+        self._element(tag, attrs)
+        if tag not in VOID_TAGS:
+            self._stack.append(tag)
+            self.max_depth = max(self.max_depth, len(self._stack))
+        if tag == 'style':
+            self._raw = 'style'
+        elif tag == 'script' and not dict(attrs).get('src'):
+            self._raw = 'script'
+
+    def handle_startendtag(self, tag, attrs):
+        self._element(tag, attrs)
+        self.max_depth = max(self.max_depth, len(self._stack) + 1)
+
+    def _element(self, tag, attrs):
+        self.nodes += 1
+        # Nur äußere <svg> zählen (verschachtelte gehören zum selben Icon)
+        if tag == 'svg' and 'svg' not in self._stack:
+            self.svgs += 1
+        for name, value in attrs:
+            if not value:
+                continue
+            if name == 'style':
+                self.inline_css += len(value.encode('utf-8'))
+            elif name.startswith('on'):
+                self.inline_js += len(value.encode('utf-8'))
+
+    def handle_endtag(self, tag):
+        if tag in ('style', 'script'):
+            self._raw = None
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index] == tag:
+                del self._stack[index:]
+                break
+
+    def handle_data(self, data):
+        if self._raw == 'style':
+            self.inline_css += len(data.encode('utf-8'))
+        elif self._raw == 'script':
+            self.inline_js += len(data.encode('utf-8'))
+
+
+def page_metrics(html: str) -> Dict[str, int]:
+    parser = _MetricsParser()
+    parser.feed(html)
+    parser.close()
+    return {
+        'bytes': len(html.encode('utf-8')),
+        'inline_css_bytes': parser.inline_css,
+        'inline_js_bytes': parser.inline_js,
+        'dom_nodes': parser.nodes,
+        'max_depth': parser.max_depth,
+        'inline_svgs': parser.svgs,
+    }
+
+
+def budget_for(config: Optional[Mapping] = None, defaults: Mapping = DEFAULT_BUDGET) -> Dict[str, int]:
+    """Standard-Budgets, überschrieben durch config['budget'] (None/0 = ohne Grenze)"""
+    budget = dict(defaults)
+    budget.update((config or {}).get('budget') or {})
+    unknown = set(budget) - set(DEFAULT_BUDGET)
+    if unknown:
+        raise ValueError(f"unknown budget metric(s): {', '.join(sorted(unknown))}")
+    return budget
+
+
+class BudgetReport:
+    """Messwerte einer Seite gegen ihr Budget"""
+
+    def __init__(self, page: str, metrics: Dict[str, int], budget: Dict[str, int]):
+        self.page = page
+        self.metrics = metrics
+        self.budget = budget
+        self.violations: List[str] = []
+        self.warnings: List[str] = []
+        for metric, limit in budget.items():
+            if not limit:
+                continue
+            value = metrics[metric]
+            text = f"{METRIC_LABELS[metric]} {_format(metric, value)} / {_format(metric, limit)}"
+            if value > limit:
+                self.violations.append(text)
+            elif value >= limit * WARN_RATIO:
+                self.warnings.append(text)
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+
+def _format(metric: str, value: int) -> str:
+    return f'{value / 1024:.1f} KB' if metric.endswith('bytes') else str(value)
+
+
+def check_page(page: str, html: str, config: Optional[Mapping] = None) -> BudgetReport:
+    return BudgetReport(page, page_metrics(html), budget_for(config))
+
+
+class BudgetGate:
+    """Sammelt Berichte während eines Builds; finish() wirft BudgetError bei
+    Überschreitungen (warn_only: nur ausgeben)"""
+
+    def __init__(self, warn_only: bool = False):
+        self.warn_only = warn_only
+        self.reports: List[BudgetReport] = []
+
+    def check(self, page: str, html: str, config: Optional[Mapping] = None) -> BudgetReport:
+        report = check_page(page, html, config)
+        self.reports.append(report)
+        return report
+
+    @property
+    def failed(self) -> List[BudgetReport]:
+        return [report for report in self.reports if not report.ok]
+
+    def print_report(self):
+        for report in self.reports:
+            for text in report.violations:
+                print(f"  ❌ {report.page}: {text}")
+            for text in report.warnings:
+                print(f"  ⚠️  {report.page}: {text} (≥ {WARN_RATIO:.0%})")
+        if self.reports and not self.failed:
+            print(f"  ✅ {len(self.reports)} page(s) within budget")
+
+    def finish(self):
+        self.print_report()
+        failed = self.failed
+        if failed and not self.warn_only:
+            raise BudgetError(f"{len(failed)} page(s) over budget: "
+                              f"{', '.join(report.page for report in failed)}")
+
+
+def gate_page(page: str, html: str, config: Optional[Mapping] = None, warn_only: bool = False) -> BudgetReport:
+    """Gate für Builder, die eine einzelne Seite schreiben - vor dem Schreiben aufrufen;
+    BudgetError bei Überschreitung (außer warn_only)"""
+    gate = BudgetGate(warn_only=warn_only)
+    report = gate.check(page, html, config)
+    print("📏 Page budget:")
+    gate.finish()
+    return report
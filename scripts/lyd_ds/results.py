@@ -0,0 +1,193 @@
+"""
+LYD Design System - Validation Results
+Kompakte Ergebnis-Records, laufend als NDJSON geschrieben (eine Zeile pro Komponente)
+und online zusammengefasst - Speicherbedarf unabhängig von der Anzahl der Seiten
+"""
+
+import json
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+EXAMPLES_PER_ISSUE = 3   # betroffene Komponenten, die pro Problem gemerkt werden
+FIX_EXAMPLES = 5
+
+
+class ValidationRecord:
+    """Ergebnis einer Komponente (status: pass, fail oder missing)"""
+
+    __slots__ = ('component', 'status', 'score', 'errors', 'warnings', 'checks', 'fixes', 'timestamp')
+
+    def __init__(self, component: str, status: str, score: float = 0, errors: Optional[List[str]] = None,
+                 warnings: Optional[List[str]] = None, checks: Optional[Dict[str, bool]] = None,
+                 fixes: Optional[List[str]] = None, timestamp: Optional[str] = None):
+        self.component = component
+        self.status = status
+        self.score = score
+        self.errors = errors or []
+        self.warnings = warnings or []
+        self.checks = checks
+        self.fixes = fixes or []
+        self.timestamp = timestamp
+
+    @property
+    def failed_checks(self) -> List[str]:
+        return [name for name, passed in (self.checks or {}).items() if not passed]
+
+    def to_dict(self) -> Dict:
+        data = {'component': self.component, 'status': self.status}
+        if self.status != 'missing':
+            data['score'] = self.score
+        data['errors'] = self.errors
+        if self.status != 'missing':
+            data['warnings'] = self.warnings
+        if self.checks is not None:
+            data['checks'] = self.checks
+            data['passed'] = len(self.checks) - len(self.failed_checks)
+            data['total'] = len(self.checks)
+        if self.fixes:
+            data['fixes'] = self.fixes
+        if self.timestamp:
+            data['timestamp'] = self.timestamp
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ValidationRecord':
+        return cls(data['component'], data['status'], data.get('score', 0), data.get('errors'),
+                   data.get('warnings'), data.get('checks'), data.get('fixes'), data.get('timestamp'))
+
+
+class RunSummary:
+    """Laufende Zusammenfassung (Zähler statt Ergebnisliste)"""
+
+    def __init__(self):
+        self.total = 0
+        self.passed = 0
+        self.failed = 0
+        self.missing = 0
+        self.score_total = 0.0
+        self.min_score: Optional[float] = None
+        self.max_score: Optional[float] = None
+        self.issues: Counter = Counter()
+        self.examples: Dict[str, List[str]] = {}
+        self.fix_count = 0
+        self.fix_examples: List[str] = []
+
+    def add(self, record: ValidationRecord):
+        self.total += 1
+        if record.status == 'missing':
+            self.missing += 1
+            return
+        if record.status == 'pass':
+            self.passed += 1
+        else:
+            self.failed += 1
+
+        self.score_total += record.score
+        self.min_score = record.score if self.min_score is None else min(self.min_score, record.score)
+        self.max_score = record.score if self.max_score is None else max(self.max_score, record.score)
+
+        for issue in record.failed_checks:
+            self.issues[issue] += 1
+            examples = self.examples.setdefault(issue, [])
+            if len(examples) <= EXAMPLES_PER_ISSUE:  # eins mehr: "höchstens 3 betroffen" erkennbar
+                examples.append(record.component)
+
+        self.fix_count += len(record.fixes)
+        room = FIX_EXAMPLES - len(self.fix_examples)
+        if room > 0:
+            self.fix_examples.extend(record.fixes[:room])
+
+    @property
+    def scored(self) -> int:
+        return self.passed + self.failed
+
+    @property
+    def average_score(self) -> float:
+        return self.score_total / self.scored if self.scored else 0
+
+    def top_issues(self, limit: int = 5):
+        return self.issues.most_common(limit)
+
+    def to_dict(self) -> Dict:
+        return {
+            'total': self.total,
+            'passed': self.passed,
+            'failed': self.failed,
+            'missing': self.missing,
+            'average_score': self.average_score,
+            'min_score': self.min_score,
+            'max_score': self.max_score,
+            'issues': dict(self.issues),
+            'auto_fixes': self.fix_count,
+        }
+
+
+class ResultStream:
+    """NDJSON-Ausgabe: Kopfzeile (run), eine Zeile pro Ergebnis, am Ende die
+    Zusammenfassung. Jede Zeile wird sofort geflusht; bricht der Lauf ab, bleiben
+    alle bisherigen Ergebnisse lesbar und die letzte Zeile ist "complete": false.
+    Mit history (lyd_ds.history.ValidationHistory) wird der Lauf zusätzlich im
+    Verlauf gespeichert (nur Änderungen gegenüber dem letzten Lauf)."""
+
+    def __init__(self, path, history=None, **run_info):
+        self.path = Path(path)
+        self.history = history
+        self.run_info = run_info
+        self.summary = RunSummary()
+        self._file = None
+
+    def open(self) -> 'ResultStream':
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        timestamp = datetime.now().isoformat()
+        if self.history:
+            self.history.start_run(self.run_info.get('validator', ''), timestamp)
+        self._write({'type': 'run', 'timestamp': timestamp, **self.run_info})
+        return self
+
+    def _write(self, data: Dict):
+        self._file.write(json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._file.flush()
+
+    def write(self, record: ValidationRecord):
+        self.summary.add(record)
+        if self.history:
+            self.history.add(record)
+        self._write({'type': 'result', **record.to_dict()})
+
+    def close(self, complete: bool = True):
+        if self._file is None:
+            return
+        self._write({'type': 'summary', 'complete': complete,
+                     'timestamp': datetime.now().isoformat(), **self.summary.to_dict()})
+        self._file.close()
+        self._file = None
+        if self.history:
+            self.history.finish_run(self.summary, complete)
+            self.history.close()
+
+    def __enter__(self) -> 'ResultStream':
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(complete=exc_type is None)
+
+
+def read_results(path) -> Iterator[Dict]:
+    """Zeilen einer NDJSON-Ergebnisdatei; eine abgeschnittene letzte Zeile wird übersprungen"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                if line.endswith('\n'):
+                    raise
+                return
+
+
+def iter_records(lines: Iterable[Dict]) -> Iterator[ValidationRecord]:
+    for line in lines:
+        if line.get('type') == 'result':
+            yield ValidationRecord.from_dict(line)
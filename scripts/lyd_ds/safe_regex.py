@@ -0,0 +1,353 @@
+"""
+LYD Design System - Guarded Regex
+Gemeinsamer Regex-Executor: Patterns werden einmal kompiliert, große oder riskante
+Eingaben laufen mit hartem Zeitbudget in einem Worker-Prozess, langsame Aufrufe
+werden mit Eingabegröße geloggt. Dazu ein statischer Check auf verschachtelte Quantoren.
+"""
+
+import ast
+import logging
+import multiprocessing
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+    from re import _constants as sre_constants
+except ImportError:  # pragma: no cover - ältere Interpreter
+    import sre_parse
+    import sre_constants
+
+logger = logging.getLogger('lyd_ds.regex')
+
+BUDGET_ENV = 'LYD_REGEX_BUDGET'
+ISOLATE_ENV = 'LYD_REGEX_ISOLATE'
+DEFAULT_BUDGET = 5.0                # Sekunden pro Aufruf
+DEFAULT_ISOLATE_ABOVE = 1024 * 1024  # ab dieser Eingabegröße im Worker-Prozess
+DEFAULT_SLOW_MS = 50.0
+MIN_LITERAL = 3
+
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+_POSSESSIVE = getattr(sre_constants, 'POSSESSIVE_REPEAT', None)
+_MAXREPEAT = sre_constants.MAXREPEAT
+
+
+class RegexTimeout(RuntimeError):
+    """Regex hat das Zeitbudget überschritten (vermutlich katastrophales Backtracking)"""
+
+    def __init__(self, label: str, input_size: int, budget: float):
+        super().__init__(f'regex {label!r} exceeded {budget:g}s on {input_size} bytes')
+        self.label = label
+        self.input_size = input_size
+        self.budget = budget
+
+
+# --- Statische Analyse -------------------------------------------------------
+
+def _subpatterns(op, av) -> Iterable:
+    """Kind-Sequenzen eines sre_parse-Knotens"""
+    if op in _REPEATS or (_POSSESSIVE is not None and op == _POSSESSIVE):
+        yield av[2]
+    elif op == sre_constants.SUBPATTERN:
+        yield av[-1]
+    elif op == sre_constants.BRANCH:
+        yield from av[1]
+    elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+        yield av[1]
+    elif op == sre_constants.GROUPREF_EXISTS:
+        yield av[1]
+        if av[2] is not None:
+            yield av[2]
+    elif hasattr(sre_constants, 'ATOMIC_GROUP') and op == sre_constants.ATOMIC_GROUP:
+        yield av
+
+
+def _is_unbounded(op, av) -> bool:
+    return op in _REPEATS and av[1] == _MAXREPEAT
+
+
+def _walk_nested(items, inside_repeat: bool, findings: List[str]):
+    for op, av in items:
+        unbounded = _is_unbounded(op, av)
+        if unbounded and inside_repeat:
+            findings.append('nested unbounded quantifier')
+        for child in _subpatterns(op, av):
+            _walk_nested(child, inside_repeat or unbounded, findings)
+
+
+def find_nested_quantifiers(pattern: str, flags: int = 0) -> List[str]:
+    """Meldet unbeschränkte Quantoren innerhalb unbeschränkter Quantoren, z.B. (a+)* oder (.*?x)+"""
+    findings: List[str] = []
+    _walk_nested(sre_parse.parse(pattern, flags), False, findings)
+    return sorted(set(findings))
+
+
+def required_literals(pattern: str, flags: int = 0) -> List[str]:
+    """Literale, die in jedem Treffer vorkommen müssen (Top-Level-Sequenzen ohne Alternativen)"""
+    if flags & re.IGNORECASE:
+        return []
+    parsed = sre_parse.parse(pattern, flags)
+    if parsed.state.flags & re.IGNORECASE:
+        return []
+    literals, current = [], []
+    for op, av in parsed:
+        if op == sre_constants.LITERAL:
+            current.append(chr(av))
+            continue
+        if len(current) >= MIN_LITERAL:
+            literals.append(''.join(current))
+        current = []
+    if len(current) >= MIN_LITERAL:
+        literals.append(''.join(current))
+    return literals
+
+
+# --- Worker-Prozess ----------------------------------------------------------
+
+def _execute(compiled, op: str, args: Tuple):
+    if op == 'subn':
+        repl, string, count = args
+        return compiled.subn(repl, string, count=count)
+    if op == 'search':
+        match = compiled.search(args[0])
+        return None if match is None else (match.span(), match.groups(), match.group(0))
+    if op == 'findall':
+        return compiled.findall(args[0])
+    raise ValueError(op)
+
+
+def _worker_main(conn):
+    cache = {}
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        pattern, flags, op, args = request
+        try:
+            key = (pattern, flags)
+            if key not in cache:
+                cache[key] = re.compile(pattern, flags)
+            conn.send(('ok', _execute(cache[key], op, args)))
+        except Exception as e:  # an den Aufrufer weiterreichen
+            conn.send(('error', e))
+
+
+class _Worker:
+    def __init__(self):
+        # fork startet schnell; macOS/Windows nutzen spawn (Skripte haben __main__-Guards)
+        context = multiprocessing.get_context('fork' if sys.platform.startswith('linux') else 'spawn')
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def call(self, pattern: str, flags: int, op: str, args: Tuple, budget: float):
+        self.conn.send((pattern, flags, op, args))
+        if not self.conn.poll(budget):
+            raise TimeoutError
+        status, value = self.conn.recv()
+        if status == 'error':
+            raise value
+        return value
+
+    def kill(self):
+        self.process.terminate()
+        self.process.join(1)
+        self.conn.close()
+
+
+# --- Executor ----------------------------------------------------------------
+
+class _MatchResult:
+    """Minimaler Match-Ersatz für Ergebnisse aus dem Worker"""
+
+    def __init__(self, span, groups, text):
+        self._span = span
+        self._groups = groups
+        self._text = text
+
+    def span(self):
+        return self._span
+
+    def start(self):
+        return self._span[0]
+
+    def end(self):
+        return self._span[1]
+
+    def group(self, index=0):
+        return self._text if index == 0 else self._groups[index - 1]
+
+    def groups(self):
+        return self._groups
+
+
+class GuardedRegex:
+    def __init__(self, budget: Optional[float] = None, isolate_above: Optional[int] = None,
+                 slow_ms: float = DEFAULT_SLOW_MS):
+        self.budget = budget if budget is not None else float(os.environ.get(BUDGET_ENV, DEFAULT_BUDGET))
+        self.isolate_above = (isolate_above if isolate_above is not None
+                              else int(os.environ.get(ISOLATE_ENV, DEFAULT_ISOLATE_ABOVE)))
+        self.slow_ms = slow_ms
+        self.slow_calls: List[Dict] = []
+        self._compiled: Dict[Tuple[str, int], re.Pattern] = {}
+        self._info: Dict[Tuple[str, int], Tuple[List[str], bool]] = {}
+        self._worker: Optional[_Worker] = None
+
+    def compile(self, pattern, flags: int = 0) -> re.Pattern:
+        if isinstance(pattern, re.Pattern):
+            return pattern
+        key = (pattern, flags)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compiled[key] = re.compile(pattern, flags)
+        return compiled
+
+    def _analysis(self, compiled: re.Pattern) -> Tuple[List[str], bool]:
+        """(Pflicht-Literale, riskant?) - mit den Flags des kompilierten Patterns"""
+        key = (compiled.pattern, compiled.flags)
+        info = self._info.get(key)
+        if info is None:
+            info = self._info[key] = (required_literals(compiled.pattern, compiled.flags),
+                                      bool(find_nested_quantifiers(compiled.pattern, compiled.flags)))
+        return info
+
+    def _run(self, compiled: re.Pattern, op: str, args: Tuple, string: str, label: Optional[str]):
+        risky = self._analysis(compiled)[1]
+        label = label or compiled.pattern[:60]
+        size = len(string)
+
+        isolate = (size >= self.isolate_above or risky) and not (
+            op == 'subn' and callable(args[0]))
+        start = time.perf_counter()
+        if isolate:
+            try:
+                if self._worker is None:
+                    self._worker = _Worker()
+                result = self._worker.call(compiled.pattern, compiled.flags, op, args, self.budget)
+            except TimeoutError:
+                self._worker.kill()
+                self._worker = None
+                logger.error('⏰ regex %r aborted after %.1fs on %d bytes', label, self.budget, size)
+                raise RegexTimeout(label, size, self.budget)
+            if op == 'search' and result is not None:
+                result = _MatchResult(*result)
+        elif op == 'search':
+            result = compiled.search(string)
+        else:
+            result = _execute(compiled, op, args)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if elapsed_ms >= self.slow_ms:
+            self.slow_calls.append({'pattern': label, 'input_bytes': size,
+                                    'ms': round(elapsed_ms, 1), 'isolated': isolate})
+            logger.warning('🐢 slow regex %r: %.1f ms on %d bytes', label, elapsed_ms, size)
+        if not isolate and elapsed_ms > self.budget * 1000:
+            # Im eigenen Prozess erst nachträglich erkennbar - trotzdem als Timeout behandeln,
+            # damit ein Budget-Überlauf nicht je nach Isolation still durchgeht
+            logger.error('⏰ regex %r exceeded %.1fs in-process on %d bytes (not isolated)',
+                         label, self.budget, size)
+            raise RegexTimeout(label, size, self.budget)
+        return result
+
+    def subn(self, pattern, repl, string: str, count: int = 0, flags: int = 0,
+             label: Optional[str] = None) -> Tuple[str, int]:
+        compiled = self.compile(pattern, flags)
+        if self._skip(compiled, string):
+            return string, 0
+        return self._run(compiled, 'subn', (repl, string, count), string, label)
+
+    def sub(self, pattern, repl, string: str, count: int = 0, flags: int = 0,
+            label: Optional[str] = None) -> str:
+        return self.subn(pattern, repl, string, count=count, flags=flags, label=label)[0]
+
+    def search(self, pattern, string: str, flags: int = 0, label: Optional[str] = None):
+        compiled = self.compile(pattern, flags)
+        if self._skip(compiled, string):
+            return None
+        return self._run(compiled, 'search', (string,), string, label)
+
+    def findall(self, pattern, string: str, flags: int = 0, label: Optional[str] = None) -> List:
+        compiled = self.compile(pattern, flags)
+        if self._skip(compiled, string):
+            return []
+        return self._run(compiled, 'findall', (string,), string, label)
+
+    def _skip(self, compiled: re.Pattern, string: str) -> bool:
+        literals = self._analysis(compiled)[0]
+        return any(literal not in string for literal in literals)
+
+    def close(self):
+        if self._worker is not None:
+            self._worker.kill()
+            self._worker = None
+
+
+# Prozessweiter Executor für Skripte und Builder
+guarded = GuardedRegex()
+
+
+# --- Lint für Quelltexte -----------------------------------------------------
+
+REGEX_FUNCTIONS = {'sub', 'subn', 'search', 'match', 'fullmatch', 'findall', 'finditer',
+                   'compile', 'split'}
+
+
+def _string_constants(tree: ast.AST) -> Dict[str, str]:
+    """Modulweite NAME = r'...' Zuweisungen (für Patterns in Konstanten)"""
+    constants = {}
+    for node in getattr(tree, 'body', []):
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) \
+                and isinstance(node.value.value, str):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    constants[target.id] = node.value.value
+    return constants
+
+
+def lint_file(path: Path) -> List[Dict]:
+    """Findet Regex-Aufrufe mit verschachtelten Quantoren in einer Python-Datei"""
+    source = Path(path).read_text(encoding='utf-8')
+    tree = ast.parse(source, filename=str(path))
+    constants = _string_constants(tree)
+    findings = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr in REGEX_FUNCTIONS and node.args):
+            continue
+        argument = node.args[0]
+        if isinstance(argument, ast.Constant) and isinstance(argument.value, str):
+            pattern = argument.value
+        elif isinstance(argument, ast.Name) and argument.id in constants:
+            pattern = constants[argument.id]
+        else:
+            continue
+        try:
+            problems = find_nested_quantifiers(pattern)
+        except re.error as e:
+            problems = [f'invalid pattern: {e}']
+        for problem in problems:
+            findings.append({'file': str(path), 'line': node.lineno,
+                             'pattern': pattern[:80], 'problem': problem})
+    return findings
+
+
+def lint_paths(paths: Iterable[Path]) -> List[Dict]:
+    findings = []
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.rglob('*.py')) if path.is_dir() else [path]
+        for file_path in files:
+            if 'node_modules' in file_path.parts or '__pycache__' in file_path.parts:
+                continue
+            try:
+                findings.extend(lint_file(file_path))
+            except SyntaxError as e:
+                findings.append({'file': str(file_path), 'line': e.lineno or 0,
+                                 'pattern': '', 'problem': f'syntax error: {e.msg}'})
+    return findings
@@ -0,0 +1,230 @@
+"""
+LYD Design System - Service Worker
+Erzeugt design-system/v2/sw.js mit eingebettetem Precache-Manifest (URL + Inhalts-Hash
+der generierten Seiten und der von ihnen benutzten shared/-Dateien). Nach einem
+Deploy lädt der Browser nur Einträge neu, deren Hash sich geändert hat.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin, urlsplit
+
+from lyd_ds.dry_run import TrackedText
+from lyd_ds.js_bundle import code_block_spans
+
+WORKER_NAME = 'sw.js'
+CACHE_PREFIX = 'lyd-ds'
+REGISTER_ID = 'lyd-sw-register'
+
+# Dateinamen mit Inhalts-Hash (Bundles, Such-Shards) ändern sich nie -> kein Precache,
+# zur Laufzeit cache-first
+HASHED_NAME = re.compile(r'\.[0-9a-f]{8,}\.(?:js|json|css)$')
+# Nur was die Seite wirklich lädt: <script src>, <link href>, <img src> (keine <a>-Links)
+ASSET_REFERENCE = re.compile(r'<(?:script\b[^>]*?\bsrc|link\b[^>]*?\bhref|img\b[^>]*?\bsrc)\s*=\s*["\']([^"\'#?]+)',
+                             re.IGNORECASE)
+
+REGISTER_SNIPPET = (
+    f'<script id="{REGISTER_ID}">'
+    "if ('serviceWorker' in navigator) { window.addEventListener('load', () => "
+    f"navigator.serviceWorker.register('/{WORKER_NAME}')); }}"
+    '</script>'
+)
+REGISTER_PATTERN = re.compile(rf'[ \t]*<script id="{REGISTER_ID}">.*?</script>[ \t]*\n?', re.DOTALL)
+
+
+def revision(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def page_url(v2_root: Path, path: Path) -> str:
+    """design-system/v2/components/buttons/index.html -> /components/buttons/"""
+    relative = PurePosixPath(path.relative_to(v2_root).as_posix())
+    if relative.name == 'index.html':
+        parent = relative.parent.as_posix()
+        return '/' if parent == '.' else f'/{parent}/'
+    return f'/{relative.as_posix()}'
+
+
+def shared_references(url: str, html: str) -> Iterable[str]:
+    """/shared/-URLs aus <script src>/<link href>/<img src> einer Seite (auch relativ angegebene);
+    Beispiel-Markup in Codeblöcken zählt nicht"""
+    code = code_block_spans(html)
+    for match in ASSET_REFERENCE.finditer(html):
+        if any(start <= match.start() < end for start, end in code):
+            continue
+        reference = match.group(1)
+        if urlsplit(reference).scheme:
+            continue
+        absolute = urljoin(url, reference)
+        if absolute.startswith('/shared/'):
+            yield absolute
+
+
+def add_registration(doc: TrackedText) -> bool:
+    """Registrierungs-Snippet in eigener Zeile vor </body>, eine Ebene tiefer als
+    </body> eingerückt (idempotent); False ohne </body>"""
+    existing = REGISTER_PATTERN.search(doc.text)
+    if existing:
+        if REGISTER_SNIPPET not in existing.group(0):
+            indent = re.match(r'[ \t]*', existing.group(0)).group(0)
+            doc.splice([(existing.start(), existing.end(), f'{indent}{REGISTER_SNIPPET}\n')])
+        return True
+    end = doc.text.rfind('</body>')
+    if end < 0:
+        return False
+    line_start = doc.text.rfind('\n', 0, end) + 1
+    indent = doc.text[line_start:end]
+    if indent.strip():  # </body> hinter anderem Markup
+        doc.splice([(end, end, f'\n    {REGISTER_SNIPPET}\n')])
+    else:
+        doc.splice([(line_start, line_start, f'{indent}    {REGISTER_SNIPPET}\n')])
+    return True
+
+
+def build_precache(v2_root: Path, pages: Dict[Path, str]) -> List[Dict]:
+    """Precache-Einträge {url, revision}: alle Seiten und die von ihnen referenzierten
+    shared/-Dateien ohne Hash im Namen. pages: Pfad -> (fertiger) Seiteninhalt."""
+    entries = {}
+    assets = set()
+    for path, html in pages.items():
+        url = page_url(v2_root, path)
+        entries[url] = revision(html.encode('utf-8'))
+        assets.update(shared_references(url, html))
+
+    for url in sorted(assets):
+        path = v2_root / url.lstrip('/')
+        if HASHED_NAME.search(url) or not path.is_file():
+            continue
+        entries[url] = revision(path.read_bytes())
+    return [{'url': url, 'revision': entries[url]} for url in sorted(entries)]
+
+
+def render_worker(precache: List[Dict]) -> str:
+    manifest = json.dumps(precache, separators=(',', ':'), sort_keys=True)
+    return WORKER_TEMPLATE % {'prefix': CACHE_PREFIX, 'manifest': manifest,
+                              'revision': revision(manifest.encode('utf-8'))}
+
+
+def build_service_worker(v2_root, writer, pages: Optional[Iterable[Path]] = None) -> Dict:
+    """Registrierung in die Seiten einsetzen und sw.js schreiben (über writer:
+    AtomicWriter oder DiffPreview)"""
+    from lyd_ds.baked_styles import iter_pages
+
+    v2_root = Path(v2_root)
+    track = getattr(writer, 'tracks_edits', False)
+    contents: Dict[Path, str] = {}
+    registered = 0
+    for path in (pages if pages is not None else iter_pages(v2_root, ('backups', 'node_modules', 'templates'))):
+        doc = TrackedText(path.read_text(encoding='utf-8'), track=track)
+        if not add_registration(doc):
+            continue
+        if doc.changed:
+            writer.write(path, doc)
+            registered += 1
+        contents[path] = doc.text
+
+    precache = build_precache(v2_root, contents)
+    worker = render_worker(precache)
+    worker_path = v2_root / WORKER_NAME
+    if not worker_path.exists() or worker_path.read_text(encoding='utf-8') != worker:
+        writer.write(worker_path, worker)
+    return {
+        'pages': len(contents),
+        'registered': registered,
+        'entries': len(precache),
+        'assets': sum(1 for entry in precache if entry['url'].startswith('/shared/')),
+    }
+
+
+# Precache: Cache-Schlüssel = URL + Revision, install lädt nur neue Schlüssel,
+# activate löscht alte. HTML stale-while-revalidate, Assets cache-first.
+# Gehashte Assets landen in einem Laufzeit-Cache pro Manifest-Revision; activate
+# löscht die Laufzeit-Caches älterer Revisionen (alte Bundles/Shards).
+WORKER_TEMPLATE = r'''/* LYD Design System service worker - generated by scripts/lyd_ds/service_worker.py, do not edit */
+const PRECACHE = '%(prefix)s-precache';
+const PAGES = '%(prefix)s-pages';
+const RUNTIME_PREFIX = '%(prefix)s-immutable';
+const RUNTIME = `${RUNTIME_PREFIX}-%(revision)s`;
+const MANIFEST = %(manifest)s;
+
+const HASHED = /\.[0-9a-f]{8,}\.(?:js|json|css)$/;
+const keyFor = entry => `${entry.url}?__rev=${entry.revision}`;
+const byUrl = new Map(MANIFEST.map(entry => [entry.url, keyFor(entry)]));
+
+function normalize(url) {
+    const path = new URL(url).pathname;
+    if (path.endsWith('/index.html')) return path.slice(0, -'index.html'.length);
+    if (!path.endsWith('/') && !path.split('/').pop().includes('.') && byUrl.has(path + '/')) return path + '/';
+    return path;
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(PRECACHE);
+        const cached = new Set((await cache.keys()).map(request => new URL(request.url).pathname + new URL(request.url).search));
+        const missing = MANIFEST.filter(entry => !cached.has(keyFor(entry)));
+        await Promise.all(missing.map(async entry => {
+            const response = await fetch(entry.url, { cache: 'no-cache' });
+            if (response.ok) await cache.put(keyFor(entry), response);
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        const current = new Set(byUrl.values());
+        const cache = await caches.open(PRECACHE);
+        for (const request of await cache.keys()) {
+            const url = new URL(request.url);
+            if (!current.has(url.pathname + url.search)) await cache.delete(request);
+        }
+        // Revalidierte Seiten verwerfen, deren Precache-Revision neuer ist
+        await caches.delete(PAGES);
+        for (const name of await caches.keys()) {
+            if (name.startsWith(RUNTIME_PREFIX) && name !== RUNTIME) await caches.delete(name);
+        }
+        await self.clients.claim();
+    })());
+});
+
+async function staleWhileRevalidate(event, path) {
+    const pages = await caches.open(PAGES);
+    const cached = await pages.match(path) ||
+        (byUrl.has(path) ? await caches.match(byUrl.get(path), { cacheName: PRECACHE }) : undefined);
+    const network = fetch(event.request).then(response => {
+        if (response.ok) pages.put(path, response.clone());
+        return response;
+    });
+    if (cached) {
+        event.waitUntil(network.catch(() => undefined));
+        return cached;
+    }
+    return network;
+}
+
+async function cacheFirst(request, key, cacheName) {
+    const cached = await caches.match(key, { cacheName });
+    if (cached) return cached;
+    const response = await fetch(request);
+    if (response.ok) (await caches.open(cacheName)).put(key, response.clone());
+    return response;
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET' || new URL(request.url).origin !== self.location.origin) return;
+    const path = normalize(request.url);
+
+    if (request.mode === 'navigate' || (byUrl.has(path) && path.endsWith('/'))) {
+        event.respondWith(staleWhileRevalidate(event, path));
+    } else if (byUrl.has(path)) {
+        event.respondWith(cacheFirst(request, byUrl.get(path), PRECACHE));
+    } else if (HASHED.test(path)) {
+        event.respondWith(cacheFirst(request, path, RUNTIME));
+    }
+});
+'''
@@ -0,0 +1,527 @@
+"""
+LYD Design System - Site Search Index
+Invertierter Index über Seitentitel, Abschnitts-Überschriften, API-Props und
+Code-Beispiele der v2-Seiten, zur Build-Zeit berechnet und nach Term-Präfix in
+kleine Shards aufgeteilt - der Browser lädt pro Suche nur die Shards, die er braucht
+"""
+
+import hashlib
+import json
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+INDEX_DIR = 'search'
+MANIFEST_NAME = 'manifest.json'
+RUNTIME_NAME = 'site-search.js'
+INDEX_VERSION = 1
+
+SHARD_PREFIX = 2   # Shard = erste zwei Zeichen eines Terms
+MIN_TERM = 2
+
+# Felder als Bitmaske pro Posting; Gewichte für das Ranking
+TITLE, HEADING, PROP, CODE = 1, 2, 4, 8
+FIELD_WEIGHTS = {TITLE: 8, HEADING: 4, PROP: 3, CODE: 1}
+
+# Wörter = Buchstaben/Ziffern mit einzelnen Bindestrichen ('lyd-button'); per split
+# statt [a-z]+(?:-[a-z]+)* gesucht, damit lint-regex keine verschachtelten Quantoren sieht
+WORD_SEPARATOR = re.compile(r'[^a-z0-9äöüß-]+|-{2,}')
+CAMEL_PATTERN = re.compile(r'[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])')
+
+_VLQ_DIGITS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+_VLQ_VALUES = {char: value for value, char in enumerate(_VLQ_DIGITS)}
+
+
+def terms(text: str, code: bool = False) -> List[str]:
+    """Normalisierte Terme: 'lyd-button-primary' auch als lyd/button/primary,
+    in Code zusätzlich camelCase zerlegt ('useState' -> usestate, use, state)"""
+    found = []
+    if code:
+        for identifier in re.findall(r'[A-Za-z][A-Za-z0-9]*', text):
+            parts = CAMEL_PATTERN.findall(identifier)
+            if len(parts) > 1:
+                found.extend(part.lower() for part in parts)
+    for word in WORD_SEPARATOR.split(text.lower()):
+        word = word.strip('-')
+        if not word:
+            continue
+        found.append(word)
+        if '-' in word:
+            found.extend(word.split('-'))
+    return [term for term in dict.fromkeys(found) if len(term) >= MIN_TERM]
+
+
+def shard_key(term: str) -> str:
+    return term[:SHARD_PREFIX]
+
+
+def _shard_file_stem(key: str) -> str:
+    # ä/ö/ü/ß nicht in Dateinamen
+    return ''.join(char if char.isascii() and char.isalnum() else f'_{ord(char):x}' for char in key)
+
+
+# --- Posting-Listen ------------------------------------------------------
+
+def encode_postings(postings: Sequence[Tuple[int, int]]) -> str:
+    """(doc, felder)-Paare, doc aufsteigend -> VLQ-Base64 der Deltas
+    (wie in Source Maps: 5 Bit pro Zeichen, Bit 6 = Fortsetzung)"""
+    out = []
+    previous = 0
+    for doc, fields in postings:
+        for value in (doc - previous, fields):
+            while True:
+                digit = value & 31
+                value >>= 5
+                out.append(_VLQ_DIGITS[digit | (32 if value else 0)])
+                if not value:
+                    break
+        previous = doc
+    return ''.join(out)
+
+
+def decode_postings(encoded: str) -> List[Tuple[int, int]]:
+    values = []
+    value = shift = 0
+    for char in encoded:
+        digit = _VLQ_VALUES[char]
+        value |= (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+        else:
+            values.append(value)
+            value = shift = 0
+    postings = []
+    doc = 0
+    for index in range(0, len(values) - 1, 2):
+        doc += values[index]
+        postings.append((doc, values[index + 1]))
+    return postings
+
+
+# --- Seiten einlesen -----------------------------------------------------
+
+class _PageSections(HTMLParser):
+    """Zerlegt eine Seite in Dokumente: die Seite selbst (Titel) und je ein
+    Dokument pro <h2>-Abschnitt mit h3-Überschriften, Props und Code"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ''
+        self.sections: List[Dict] = [{'heading': '', 'anchor': '', 'fields': {}}]
+        self._capture: Optional[str] = None
+        self._buffer: List[str] = []
+        self._capture_tag = ''
+        self._depth = 0
+        self._in_row = False
+        self._cell = 0
+
+    def _start_capture(self, kind: str, tag: str):
+        if self._capture is None:
+            self._capture, self._capture_tag, self._depth = kind, tag, 0
+            self._buffer = []
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        if self._capture is not None:
+            if tag == self._capture_tag:
+                self._depth += 1
+            return
+        if tag == 'title' and not self.title:
+            self._start_capture('title', tag)
+        elif tag == 'h1':
+            self._start_capture('h1', tag)
+        elif tag == 'h2':
+            self.sections.append({'heading': '', 'anchor': attributes.get('id') or '', 'fields': {}})
+            self._start_capture('h2', tag)
+        elif tag in ('h3', 'h4'):
+            self._start_capture('heading', tag)
+        elif tag == 'tr':
+            self._in_row, self._cell = True, 0
+        elif tag == 'td' and self._in_row:
+            self._cell += 1
+        elif tag == 'code' and self._in_row and self._cell == 1:
+            self._start_capture('prop', tag)
+        elif tag == 'pre':
+            self._start_capture('code', tag)
+
+    def handle_endtag(self, tag):
+        if tag == 'tr':
+            self._in_row = False
+        if self._capture is None or tag != self._capture_tag:
+            return
+        if self._depth:
+            self._depth -= 1
+            return
+        text = ' '.join(''.join(self._buffer).split())
+        kind, self._capture = self._capture, None
+        if kind == 'title':
+            # "Button - LYD Design System V2" -> "Button"
+            self.title = self.title or text.split(' - ')[0]
+        elif kind == 'h1':
+            self.title = text or self.title
+        elif kind == 'h2':
+            self.sections[-1]['heading'] = text
+            self._add(HEADING, text)
+        elif kind == 'heading':
+            self._add(HEADING, text)
+        elif kind == 'prop':
+            self._add(PROP, text)
+        else:
+            self._add(CODE, ''.join(self._buffer), code=True)
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._buffer.append(data)
+
+    def _add(self, field: int, text: str, code: bool = False):
+        fields = self.sections[-1]['fields']
+        for term in terms(text, code=code or field == PROP):
+            fields[term] = fields.get(term, 0) | field
+
+
+def page_documents(url: str, html: str, title: Optional[str] = None) -> List[Dict]:
+    """Dokumente einer Seite: {url, title, section, fields: term -> Feldmaske}"""
+    parser = _PageSections()
+    parser.feed(html)
+    parser.close()
+    title = title or parser.title
+    documents = []
+    for position, section in enumerate(parser.sections):
+        fields = dict(section['fields'])
+        if position == 0:
+            for term in terms(title):
+                fields[term] = fields.get(term, 0) | TITLE
+        elif not fields:
+            continue
+        link = f"{url}#{section['anchor']}" if section['anchor'] else url
+        documents.append({'url': link, 'title': title, 'section': section['heading'], 'fields': fields})
+    return documents
+
+
+# --- Index bauen ---------------------------------------------------------
+
+def build_index(documents: Iterable[Dict]) -> Dict:
+    """Dokumenttabelle + Shards {präfix: {term: postings}}"""
+    docs = []
+    inverted: Dict[str, List[Tuple[int, int]]] = {}
+    for doc_id, document in enumerate(documents):
+        docs.append([document['url'], document['title'], document['section']])
+        for term, fields in document['fields'].items():
+            inverted.setdefault(term, []).append((doc_id, fields))
+
+    shards: Dict[str, Dict[str, str]] = {}
+    for term in sorted(inverted):
+        shards.setdefault(shard_key(term), {})[term] = encode_postings(inverted[term])
+    return {'docs': docs, 'shards': shards}
+
+
+def write_index(index: Dict, output_dir: Path, writer) -> Dict:
+    """Shards als <präfix>.<hash>.json, Manifest mit Dokumenttabelle und Shard-Namen"""
+    output_dir = Path(output_dir)
+    files = {}
+    for key, shard in index['shards'].items():
+        payload = json.dumps(shard, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+        digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:8]
+        name = f'{_shard_file_stem(key)}.{digest}.json'
+        files[key] = name
+        if not (output_dir / name).exists():  # Name = Inhalt
+            writer.write(output_dir / name, payload + '\n')
+
+    manifest = {'v': INDEX_VERSION, 'prefix': SHARD_PREFIX, 'weights': FIELD_WEIGHTS,
+                'docs': index['docs'], 'shards': files}
+    payload = json.dumps(manifest, ensure_ascii=False, separators=(',', ':'), sort_keys=True) + '\n'
+    manifest_path = output_dir / MANIFEST_NAME
+    if not manifest_path.exists() or manifest_path.read_text(encoding='utf-8') != payload:
+        writer.write(manifest_path, payload)
+    return manifest
+
+
+def stale_shards(output_dir: Path, manifest: Dict) -> List[Path]:
+    current = set(manifest['shards'].values())
+    return [path for path in sorted(Path(output_dir).glob('*.json'))
+            if path.name != MANIFEST_NAME and path.name not in current]
+
+
+def build_site_index(v2_root, writer, pages: Optional[Dict[str, str]] = None) -> Dict:
+    """Index für v2_root/shared/search/ bauen.
+
+    pages: Seitenpfad (relativ zu v2_root, ohne index.html) -> Titel, z.B. aus
+    COMPONENTS/OTHER_PAGES; None -> alle Seiten unter v2_root. Schreibt auch die
+    Laufzeit nach shared/site-search.js.
+    """
+    from lyd_ds.baked_styles import iter_pages
+
+    v2_root = Path(v2_root)
+    if pages is None:
+        paths = {path.parent.relative_to(v2_root).as_posix(): None
+                 for path in iter_pages(v2_root, ('backups', 'node_modules', 'templates'))
+                 if path.name == 'index.html'}
+    else:
+        paths = dict(pages)
+
+    documents = []
+    for page, title in paths.items():
+        path = v2_root / page / 'index.html'
+        if not path.exists():
+            continue
+        url = '/' if page in ('', '.') else f'/{page}/'
+        documents.extend(page_documents(url, path.read_text(encoding='utf-8'), title))
+
+    index = build_index(documents)
+    output_dir = v2_root / 'shared' / INDEX_DIR
+    manifest = write_index(index, output_dir, writer)
+
+    runtime_path = v2_root / 'shared' / RUNTIME_NAME
+    if not runtime_path.exists() or runtime_path.read_text(encoding='utf-8') != SEARCH_RUNTIME_JS:
+        writer.write(runtime_path, SEARCH_RUNTIME_JS)
+
+    terms_total = sum(len(shard) for shard in index['shards'].values())
+    return {'pages': len(paths), 'docs': len(index['docs']), 'terms': terms_total,
+            'shards': len(index['shards']), 'manifest': manifest,
+            'stale': stale_shards(output_dir, manifest)}
+
+
+# --- Suchfeld in der Sidebar ---------------------------------------------------
+
+SEARCH_BOX_ID = 'lyd-site-search'
+SEARCH_RESULTS_ID = 'lyd-site-search-results'
+SEARCH_BOX = (
+    f'<div class="lyd-site-search" id="{SEARCH_BOX_ID}">',
+    f'    <input type="search" class="lyd-site-search-input" placeholder="Suchen …" '
+    f'aria-label="Design System durchsuchen" autocomplete="off" data-site-search="{SEARCH_RESULTS_ID}">',
+    f'    <div class="lyd-search-results" id="{SEARCH_RESULTS_ID}"></div>',
+    '</div>',
+)
+SEARCH_STYLE_ID = 'lyd-site-search-styles'
+SEARCH_CSS = '''
+        /* Sidebar-Suche (lyd_ds.site_search) */
+        .lyd-site-search { padding: 0 16px 16px; }
+        .lyd-site-search-input { width: 100%; padding: 8px 12px; border: 1px solid #e5e7eb; border-radius: 8px; font: inherit; font-size: 14px; }
+        .lyd-site-search-input:focus { outline: 2px solid #0066ff; outline-offset: 1px; }
+        .lyd-search-results:empty { display: none; }
+        .lyd-search-results { margin-top: 8px; max-height: 320px; overflow-y: auto; }
+        .lyd-search-result { display: block; padding: 6px 8px; border-radius: 6px; color: inherit; font-size: 13px; text-decoration: none; }
+        .lyd-search-result:hover, .lyd-search-result:focus { background: #f3f4f6; }
+'''
+SIDEBAR_HEADER = re.compile(r'^([ \t]*)<div\b[^>]*\bclass="sidebar-header"[^>]*>', re.MULTILINE)
+_DIV_TAG = re.compile(r'<(/?)div\b[^>]*>', re.IGNORECASE)
+
+
+def search_box(indent: str = '') -> str:
+    return ''.join(f'{indent}{line}\n' for line in SEARCH_BOX)
+
+
+def add_search_box(doc) -> bool:
+    """Suchfeld hinter den Sidebar-Header (mit der Laufzeit als defer-Skript) und den
+    Stylesheet-Block vor </head>, beides idempotent; False ohne Sidebar-Header.
+    Seiten, die das Feld schon enthalten (v2-Template), bekommen nur die Styles."""
+    head_end = doc.text.find('</head>')
+    if head_end < 0:
+        return False
+    edits = []
+    if f'id="{SEARCH_BOX_ID}"' not in doc.text:
+        header = SIDEBAR_HEADER.search(doc.text)
+        if header is None:
+            return False
+        depth, end = 1, None
+        for tag in _DIV_TAG.finditer(doc.text, header.end()):
+            depth += -1 if tag.group(1) else 1
+            if depth == 0:
+                end = tag.end()
+                break
+        if end is None:
+            return False
+        line_end = doc.text.find('\n', end)
+        line_end = len(doc.text) if line_end < 0 else line_end + 1
+        edits.append((head_end, head_end, f'    <script defer src="/shared/{RUNTIME_NAME}"></script>\n'))
+        edits.append((line_end, line_end, search_box(header.group(1))))
+    if f'id="{SEARCH_STYLE_ID}"' not in doc.text:
+        edits.append((head_end, head_end, f'    <style id="{SEARCH_STYLE_ID}">{SEARCH_CSS}    </style>\n'))
+    if edits:
+        doc.splice(edits)
+    return True
+
+
+def add_search_boxes(v2_root, writer, skip: Iterable[str] = ('backups', 'node_modules', 'templates')) -> List[Path]:
+    """add_search_box für alle Seiten unter v2_root; liefert die geänderten Seiten"""
+    from lyd_ds.baked_styles import iter_pages
+    from lyd_ds.dry_run import TrackedText
+
+    changed = []
+    for path in iter_pages(Path(v2_root), skip):
+        doc = TrackedText(path.read_text(encoding='utf-8'), track=getattr(writer, 'tracks_edits', False))
+        if add_search_box(doc) and doc.changed:
+            writer.write(path, doc)
+            changed.append(path)
+    return changed
+
+
+# --- Abfragen (Python-Gegenstück zur Laufzeit, für CLI und Prüfungen) --------
+
+class SiteSearch:
+    """Sucht wie shared/site-search.js: jeder Suchbegriff als Präfix, Treffer müssen
+    alle Begriffe enthalten, Ranking nach Feldgewichten (+1 für exakte Treffer)"""
+
+    def __init__(self, index_dir):
+        self.index_dir = Path(index_dir)
+        with open(self.index_dir / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        self.weights = {int(field): weight for field, weight in self.manifest['weights'].items()}
+        self._shards: Dict[str, Dict[str, str]] = {}
+        self.loaded: List[str] = []
+
+    def shard(self, key: str) -> Dict[str, str]:
+        if key not in self._shards:
+            name = self.manifest['shards'].get(key)
+            if name:
+                with open(self.index_dir / name, 'r', encoding='utf-8') as f:
+                    self._shards[key] = json.load(f)
+                self.loaded.append(key)
+            else:
+                self._shards[key] = {}
+        return self._shards[key]
+
+    def _score(self, fields: int) -> int:
+        return sum(weight for field, weight in self.weights.items() if fields & field)
+
+    def query(self, text: str, limit: int = 10) -> List[Dict]:
+        scores: Optional[Dict[int, int]] = None
+        for word in dict.fromkeys(terms(text)):
+            matches: Dict[int, int] = {}
+            for term, encoded in self.shard(shard_key(word)).items():
+                if not term.startswith(word):
+                    continue
+                for doc, fields in decode_postings(encoded):
+                    score = self._score(fields) + (term == word)
+                    matches[doc] = max(matches.get(doc, 0), score)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {doc: score + matches[doc] for doc, score in scores.items() if doc in matches}
+            if not scores:
+                return []
+        ranked = sorted((scores or {}).items(), key=lambda item: (-item[1], item[0]))[:limit]
+        docs = self.manifest['docs']
+        return [{'url': docs[doc][0], 'title': docs[doc][1], 'section': docs[doc][2], 'score': score}
+                for doc, score in ranked]
+
+
+# Browser-Laufzeit: Manifest einmal laden, Shards nur bei Bedarf (gecacht)
+SEARCH_RUNTIME_JS = r'''/* LYD Site Search - generated by scripts/lyd_ds/site_search.py, do not edit */
+window.LYDSiteSearch = (() => {
+    const WORD = /[a-z0-9äöüß]+(?:-[a-z0-9äöüß]+)*/g;
+    const VLQ = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/';
+    const BASE = '/shared/%(index_dir)s/';
+    let manifest = null;
+    const shards = new Map();
+    const cache = new Map();
+
+    function terms(text) {
+        const found = [];
+        (text.toLowerCase().match(WORD) || []).forEach(word => {
+            found.push(word);
+            if (word.includes('-')) found.push(...word.split('-'));
+        });
+        return [...new Set(found)].filter(term => term.length >= %(min_term)d);
+    }
+
+    function decode(encoded) {
+        const values = [];
+        let value = 0, shift = 0;
+        for (const char of encoded) {
+            const digit = VLQ.indexOf(char);
+            value |= (digit & 31) << shift;
+            if (digit & 32) { shift += 5; } else { values.push(value); value = 0; shift = 0; }
+        }
+        const postings = [];
+        for (let i = 0, doc = 0; i + 1 < values.length; i += 2) {
+            doc += values[i];
+            postings.push([doc, values[i + 1]]);
+        }
+        return postings;
+    }
+
+    async function loadManifest() {
+        if (!manifest) {
+            manifest = fetch(BASE + '%(manifest)s').then(response => response.json());
+        }
+        return manifest;
+    }
+
+    function loadShard(index, key) {
+        if (!shards.has(key)) {
+            const name = index.shards[key];
+            shards.set(key, name ? fetch(BASE + name).then(response => response.json()) : Promise.resolve({}));
+        }
+        return shards.get(key);
+    }
+
+    function score(index, fields) {
+        let total = 0;
+        for (const field in index.weights) if (fields & field) total += index.weights[field];
+        return total;
+    }
+
+    async function query(text, limit = 10) {
+        const words = terms(text);
+        const key = words.join(' ') + '|' + limit;
+        if (cache.has(key)) return cache.get(key);
+        const index = await loadManifest();
+        const loaded = await Promise.all(words.map(word => loadShard(index, word.slice(0, index.prefix))));
+
+        let scores = null;
+        words.forEach((word, i) => {
+            const matches = new Map();
+            for (const term in loaded[i]) {
+                if (!term.startsWith(word)) continue;
+                decode(loaded[i][term]).forEach(([doc, fields]) => {
+                    const value = score(index, fields) + (term === word ? 1 : 0);
+                    if (!(matches.get(doc) >= value)) matches.set(doc, value);
+                });
+            }
+            if (scores === null) {
+                scores = matches;
+            } else {
+                const next = new Map();
+                scores.forEach((value, doc) => { if (matches.has(doc)) next.set(doc, value + matches.get(doc)); });
+                scores = next;
+            }
+        });
+
+        const results = [...(scores || new Map())]
+            .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+            .slice(0, limit)
+            .map(([doc, value]) => ({ url: index.docs[doc][0], title: index.docs[doc][1],
+                                      section: index.docs[doc][2], score: value }));
+        cache.set(key, results);
+        return results;
+    }
+
+    // <input data-site-search="results-id"> -> Trefferliste in #results-id
+    function bind(input) {
+        const list = document.getElementById(input.dataset.siteSearch);
+        if (!list) return;
+        let latest = 0;
+        input.addEventListener('input', async () => {
+            const current = ++latest;
+            const results = await query(input.value);
+            if (current !== latest) return;
+            list.replaceChildren(...results.map(result => {
+                const item = document.createElement('a');
+                item.href = result.url;
+                item.className = 'lyd-search-result';
+                item.textContent = result.section ? `${result.title} › ${result.section}` : result.title;
+                return item;
+            }));
+        });
+        input.addEventListener('focus', loadManifest, { once: true });
+    }
+
+    document.addEventListener('DOMContentLoaded', () => {
+        document.querySelectorAll('[data-site-search]').forEach(bind);
+    });
+
+    return { query, terms };
+})();
+''' % {'index_dir': INDEX_DIR, 'manifest': MANIFEST_NAME, 'min_term': MIN_TERM}
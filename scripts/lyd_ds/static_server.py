@@ -0,0 +1,318 @@
+"""
+LYD Design System - Local Static Server
+Liefert den generierten Baum (design-system/v2) so aus wie der Produktions-Host:
+saubere URLs, index.html-Auflösung, vorkomprimierte .br/.gz-Dateien, Cache-Header
+und ETags. HTTP/1.1 mit Keep-Alive, Anfragen laufen in einem festen Thread-Pool.
+Validatoren und Screenshots prüfen damit offline und ohne Netzwerk-Rauschen.
+"""
+
+import mimetypes
+import os
+import select
+import socket
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import unquote, urlsplit
+
+from lyd_ds.service_worker import HASHED_NAME, WORKER_NAME
+
+PRODUCTION_URL = 'http://designsystem.liveyourdreams.online'
+SITE_DIR = Path('design-system') / 'v2'
+
+DEFAULT_WORKERS = 8
+REQUEST_TIMEOUT = 5      # Sekunden für eine begonnene Anfrage
+IDLE_TIMEOUT = 5         # so lange hält eine leerlaufende Keep-Alive-Verbindung ihren Worker
+
+# Reihenfolge = Präferenz, wenn der Client beides akzeptiert
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+CACHE_IMMUTABLE = 'public, max-age=31536000, immutable'
+CACHE_HTML = 'public, max-age=0, must-revalidate'
+CACHE_ASSET = 'public, max-age=3600'
+CACHE_WORKER = 'no-cache'
+
+mimetypes.add_type('application/manifest+json', '.webmanifest')
+mimetypes.add_type('image/svg+xml', '.svg')
+mimetypes.add_type('text/javascript', '.js')
+
+
+def cache_control(path: Path) -> str:
+    if path.name == WORKER_NAME:
+        return CACHE_WORKER
+    if HASHED_NAME.search(path.name):
+        return CACHE_IMMUTABLE
+    if path.suffix == '.html':
+        return CACHE_HTML
+    return CACHE_ASSET
+
+
+def accepted_encodings(header: str) -> Set[str]:
+    """Accept-Encoding -> Codierungen mit q > 0 ("gzip;q=0" schließt gzip aus);
+    "*" steht für alle nicht ausdrücklich genannten"""
+    accepted, refused = set(), set()
+    for item in header.split(','):
+        name, *params = [part.strip() for part in item.split(';')]
+        if not name:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        (accepted if quality > 0 else refused).add(name.lower())
+    if '*' in accepted:
+        accepted.update(encoding for encoding, _ in ENCODINGS if encoding not in refused)
+    return accepted
+
+
+def content_type(path: Path) -> str:
+    kind = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+    if kind.startswith('text/') or kind in ('application/json', 'image/svg+xml'):
+        kind += '; charset=utf-8'
+    return kind
+
+
+class StaticSite:
+    """URL -> Datei wie auf dem Host: /x/ -> x/index.html, /x -> x.html oder
+    Weiterleitung auf /x/, /x.html und /x/index.html -> Weiterleitung auf die saubere URL"""
+
+    def __init__(self, root):
+        self.root = Path(root).resolve()
+
+    def _inside(self, path: Path) -> Optional[Path]:
+        try:
+            path.resolve().relative_to(self.root)
+        except ValueError:
+            return None
+        return path if path.is_file() else None
+
+    def resolve(self, url_path: str) -> Tuple[int, Optional[Path], Optional[str]]:
+        """(Status, Datei, Weiterleitungsziel)"""
+        path = unquote(url_path)
+        if '\0' in path or not path.startswith('/'):
+            return HTTPStatus.BAD_REQUEST, None, None
+        relative = path.lstrip('/')
+
+        if path.endswith('/index.html'):
+            return HTTPStatus.PERMANENT_REDIRECT, None, path[:-len('index.html')]
+        if path.endswith('.html') and self._inside(self.root / relative):
+            return HTTPStatus.PERMANENT_REDIRECT, None, path[:-len('.html')]
+
+        if path.endswith('/'):
+            found = self._inside(self.root / relative / 'index.html')
+            return (HTTPStatus.OK, found, None) if found else (HTTPStatus.NOT_FOUND, None, None)
+
+        found = self._inside(self.root / relative)
+        if found:
+            return HTTPStatus.OK, found, None
+        found = self._inside(self.root / f'{relative}.html')
+        if found:
+            return HTTPStatus.OK, found, None
+        if self._inside(self.root / relative / 'index.html'):
+            return HTTPStatus.PERMANENT_REDIRECT, None, path + '/'
+        return HTTPStatus.NOT_FOUND, None, None
+
+    def not_found_page(self) -> Optional[Path]:
+        return self._inside(self.root / '404.html')
+
+
+class StaticHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # Keep-Alive
+    timeout = REQUEST_TIMEOUT
+    # Header und Body gehen getrennt raus; ohne TCP_NODELAY wartet jede Antwort
+    # auf Keep-Alive-Verbindungen ~40 ms auf das verzögerte ACK
+    disable_nagle_algorithm = True
+    server_version = 'lyd-ds-static'
+    site: StaticSite = None
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def handle(self):
+        # Wie BaseHTTPRequestHandler.handle, aber ohne Worker-Blockade im Leerlauf:
+        # kommt nach IDLE_TIMEOUT keine Anfrage, wird die Verbindung geschlossen
+        self.handle_one_request()
+        while not self.close_connection and self._wait_for_request():
+            self.handle_one_request()
+
+    def _wait_for_request(self) -> bool:
+        # Schon gepufferte (gepipelinete) Daten? Nicht-blockierend nachsehen
+        self.connection.settimeout(0)
+        try:
+            if self.rfile.peek(1):
+                return True
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+        return bool(select.select([self.connection], [], [], IDLE_TIMEOUT)[0])
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def _respond(self, send_body: bool):
+        url = urlsplit(self.path)
+        status, path, location = self.site.resolve(url.path)
+        if location:
+            target = location + (f'?{url.query}' if url.query else '')
+            self._send_empty(status, {'Location': target})
+            return
+        if path is None:
+            page = self.site.not_found_page() if status == HTTPStatus.NOT_FOUND else None
+            if page is None:
+                body = f'{status.value} {status.phrase}\n'.encode('utf-8')
+                self._send(status, body, {'Content-Type': 'text/plain; charset=utf-8',
+                                          'Cache-Control': 'no-store'}, send_body)
+                return
+            path = page
+
+        file_path, encoding = self._negotiate(path)
+        stat = file_path.stat()
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-" + encoding if encoding else ""}"'
+        headers = {
+            'Content-Type': content_type(path),
+            'Cache-Control': cache_control(path),
+            'ETag': etag,
+            'Last-Modified': formatdate(stat.st_mtime, usegmt=True),
+            'Vary': 'Accept-Encoding',
+        }
+        if encoding:
+            headers['Content-Encoding'] = encoding
+        if status == HTTPStatus.OK and etag in self.headers.get('If-None-Match', ''):
+            self._send_empty(HTTPStatus.NOT_MODIFIED, headers)
+            return
+        self._send(status, file_path.read_bytes(), headers, send_body)
+
+    def _negotiate(self, path: Path) -> Tuple[Path, Optional[str]]:
+        accepted = accepted_encodings(self.headers.get('Accept-Encoding', ''))
+        for encoding, suffix in ENCODINGS:
+            compressed = path.with_name(path.name + suffix)
+            if encoding in accepted and compressed.is_file():
+                return compressed, encoding
+        return path, None
+
+    def _send_empty(self, status, headers: Dict[str, str]):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _send(self, status, body: bytes, headers: Dict[str, str], send_body: bool):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer, der Verbindungen an einen festen Thread-Pool übergibt
+    (statt wie ThreadingHTTPServer einen Thread pro Verbindung zu starten)"""
+
+    allow_reuse_address = True
+
+    def __init__(self, address, handler, workers: int = DEFAULT_WORKERS, verbose: bool = False):
+        super().__init__(address, handler)
+        self.verbose = verbose
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='lyd-static')
+        self.connections = set()
+        self.connections_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address):
+        with self.connections_lock:
+            self.connections.add(request)
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self.connections_lock:
+                self.connections.discard(request)
+            self.shutdown_request(request)
+
+    def handle_error(self, request, client_address):
+        # Client hat eine Keep-Alive-Verbindung geschlossen oder ist abgelaufen
+        if not isinstance(sys.exc_info()[1], (ConnectionError, TimeoutError)):
+            super().handle_error(request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        # Leerlaufende Keep-Alive-Verbindungen warten sonst bis zu IDLE_TIMEOUT
+        with self.connections_lock:
+            for request in self.connections:
+                try:
+                    request.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class LocalServer:
+    """Server im Hintergrund-Thread; als Kontextmanager oder über local_url()"""
+
+    def __init__(self, root, host: str = '127.0.0.1', port: int = 0,
+                 workers: int = DEFAULT_WORKERS, verbose: bool = False):
+        handler = type('SiteHandler', (StaticHandler,), {'site': StaticSite(root)})
+        self.httpd = PooledHTTPServer((host, port), handler, workers, verbose)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'LocalServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='lyd-static-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> 'LocalServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+_servers: Dict[Path, LocalServer] = {}
+_servers_lock = threading.Lock()
+
+
+def local_url(root) -> str:
+    """Basis-URL eines (pro Prozess einmal gestarteten) lokalen Servers für root"""
+    root = Path(root).resolve()
+    with _servers_lock:
+        if root not in _servers:
+            _servers[root] = LocalServer(root).start()
+        return _servers[root].url
+
+
+def site_root(repo_root=None) -> Path:
+    """Generierter Baum: <repo>/design-system/v2 ($LYD_DS_SITE überschreibt)"""
+    if os.environ.get('LYD_DS_SITE'):
+        return Path(os.environ['LYD_DS_SITE'])
+    if repo_root is None:
+        repo_root = Path(__file__).resolve().parents[2]
+    return Path(repo_root) / SITE_DIR
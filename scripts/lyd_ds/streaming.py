@@ -0,0 +1,153 @@
+"""
+LYD Design System - Streaming Rewriter
+Ersetzungen auf sehr großen HTML-Dateien in Blöcken (mmap) mit Übertrags-Fenster
+für Treffer über Blockgrenzen; Speicherbedarf hängt vom Fenster ab, nicht von der Dateigröße
+"""
+
+import codecs
+import mmap
+import os
+import re
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from lyd_ds.atomic import AtomicWriter
+from lyd_ds.safe_regex import guarded
+
+CHUNK_SIZE = 256 * 1024           # Bytes pro gelesenem Block
+DEFAULT_WINDOW = 64 * 1024        # maximale Trefferlänge eines Regex-Schritts (Logo/Navigation: wenige KB)
+LOOKBEHIND = 256                  # bereits ausgegebener Kontext für Lookbehind/\b
+
+Replacement = Union[str, Callable[[re.Match], str]]
+
+
+class _Stage:
+    __slots__ = ('pattern', 'repl', 'window', 'subs')
+
+    def __init__(self, pattern: re.Pattern, repl: Replacement, window: int):
+        self.pattern = pattern
+        # Ohne Backslash keine Gruppen-Referenzen: Template nicht pro Treffer parsen
+        self.repl = repl if callable(repl) or '\\' in repl else (lambda match: repl)
+        self.window = window
+        self.subs = 0
+
+    def expand(self, match: re.Match) -> str:
+        if callable(self.repl):
+            return self.repl(match)
+        return match.expand(self.repl)
+
+
+def read_chunks(path: Path, chunk_size: int = CHUNK_SIZE, encoding: str = 'utf-8') -> Iterator[str]:
+    """Dekodierte Blöcke einer Datei über mmap (Multibyte-Zeichen an Blockgrenzen bleiben ganz)"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            for offset in range(0, len(mapped), chunk_size):
+                text = decoder.decode(mapped[offset:offset + chunk_size])
+                if text:
+                    yield text
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+
+
+class StreamRewriter:
+    """Kette von Regex-/Literal-Ersetzungen, die wie nacheinander ausgeführte
+    re.sub/str.replace auf dem ganzen Dokument wirken.
+
+    Jeder Schritt hält höchstens zwei Fenster + Block im Speicher. Ein Treffer wird erst
+    übernommen, wenn er vollständig vor dem Fensterende liegt; alles ab dem Fensterende
+    wird in den nächsten Block übertragen. Voraussetzung: kein Treffer ist länger als
+    das Fenster des Schritts.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, chunk_size: int = CHUNK_SIZE):
+        self.window = window
+        self.chunk_size = chunk_size
+        self.stages: List[_Stage] = []
+
+    def sub(self, pattern, repl: Replacement, flags: int = 0,
+            window: Optional[int] = None) -> 'StreamRewriter':
+        self.stages.append(_Stage(guarded.compile(pattern, flags), repl, window or self.window))
+        return self
+
+    def replace(self, old: str, new: str) -> 'StreamRewriter':
+        self.stages.append(_Stage(re.compile(re.escape(old)), lambda match: new, len(old)))
+        return self
+
+    @property
+    def subs(self) -> int:
+        return sum(stage.subs for stage in self.stages)
+
+    def _run_stage(self, stage: _Stage, chunks: Iterable[str]) -> Iterator[str]:
+        context = ''
+        pending: List[str] = []
+        pending_size = 0
+        for chunk in chain(chunks, [None]):
+            eof = chunk is None
+            if not eof:
+                pending.append(chunk)
+                pending_size += len(chunk)
+                if pending_size < 2 * stage.window:
+                    continue  # mindestens ein Fenster pro Durchlauf ausgeben
+
+            buffer = context + ''.join(pending)
+            start = len(context)
+            safe = len(buffer) if eof else len(buffer) - stage.window
+            stop = safe
+            position = start
+            parts = []
+            for match in stage.pattern.finditer(buffer, start):
+                if match.start() >= safe:
+                    break
+                if not eof and match.end() >= len(buffer):
+                    stop = match.start()  # könnte mit mehr Eingabe länger werden
+                    break
+                parts.append(buffer[position:match.start()])
+                parts.append(stage.expand(match))
+                position = match.end()
+                stage.subs += 1
+
+            emit_to = max(position, stop)
+            parts.append(buffer[position:emit_to])
+            output = ''.join(parts)
+            if output:
+                yield output
+            context = buffer[max(0, emit_to - LOOKBEHIND):emit_to]
+            pending = [buffer[emit_to:]]
+            pending_size = len(pending[0])
+
+    def rewrite_chunks(self, chunks: Iterable[str]) -> Iterator[str]:
+        for stage in self.stages:
+            chunks = self._run_stage(stage, chunks)
+        return iter(chunks)
+
+    def rewrite_text(self, text: str) -> str:
+        return ''.join(self.rewrite_chunks([text[i:i + self.chunk_size]
+                                            for i in range(0, len(text), self.chunk_size)]))
+
+    def rewrite_file(self, source: Path, target: Optional[Path] = None, encoding: str = 'utf-8',
+                     writer: Optional[AtomicWriter] = None) -> Dict[str, int]:
+        """Schreibt das Ergebnis blockweise über writer nach target (Standard: source);
+        ohne writer sofort atomar, mit writer erst beim Commit des Batches"""
+        if writer is None:
+            with AtomicWriter() as writer:
+                return self.rewrite_file(source, target, encoding, writer)
+        source = Path(source)
+        target = Path(target or source)
+        for stage in self.stages:
+            stage.subs = 0
+        bytes_in = source.stat().st_size
+        sizes = []
+
+        def encoded() -> Iterator[bytes]:
+            for part in self.rewrite_chunks(read_chunks(source, self.chunk_size, encoding)):
+                data = part.encode(encoding)
+                sizes.append(len(data))
+                yield data
+
+        writer.write_chunks(target, encoded())
+        return {'bytes_in': bytes_in, 'bytes_out': sum(sizes), 'subs': self.subs}
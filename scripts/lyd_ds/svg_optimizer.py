@@ -0,0 +1,471 @@
+"""
+LYD Design System - SVG Optimizer
+Optimiert Inline-SVG-Icons zur Build-Zeit (Koordinaten runden, Pfade
+zusammenführen, gemeinsame Attribute hochziehen, Defaults entfernen)
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from lyd_ds.dry_run import TrackedText
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+
+# Nur "flache" Icons werden optimiert - Logos mit <defs>, <g>, <text> bleiben unverändert
+SHAPE_TAGS = {'path', 'polyline', 'polygon', 'line', 'circle', 'rect', 'ellipse'}
+MERGEABLE_TAGS = {'path', 'polyline', 'polygon', 'line'}
+
+# Vererbbare Präsentationsattribute, die auf das <svg> hochgezogen werden dürfen
+INHERITED_ATTRS = (
+    'fill', 'fill-rule', 'fill-opacity',
+    'stroke', 'stroke-width', 'stroke-linecap', 'stroke-linejoin',
+    'stroke-miterlimit', 'stroke-dasharray', 'stroke-opacity', 'clip-rule'
+)
+
+NUMERIC_ATTRS = {
+    'x', 'y', 'x1', 'y1', 'x2', 'y2', 'cx', 'cy', 'r', 'rx', 'ry',
+    'width', 'height', 'stroke-width'
+}
+
+# Attribute, die Merging verhindern (Identität, eigenes Styling, Deckkraft)
+MERGE_BLOCKERS = {'id', 'class', 'style', 'opacity', 'fill-opacity', 'stroke-opacity',
+                  'marker-start', 'marker-mid', 'marker-end', 'transform', 'onclick'}
+
+ROOT_DROP_ATTRS = {'version', 'baseProfile', 'enable-background', 'xml:space'}
+
+SVG_PATTERN = re.compile(r'<svg\b[^>]*>.*?</svg>', re.DOTALL | re.IGNORECASE)
+NUMBER_PATTERN = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+PATH_ARG_COUNTS = {'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4, 'T': 2, 'A': 7, 'Z': 0}
+
+
+class SVGOptimizeError(ValueError):
+    """SVG kann nicht sicher optimiert werden"""
+
+
+def format_number(value: float, precision: int = 2) -> str:
+    """Kürzeste Darstellung einer Zahl (ohne führende Null, ohne Nachkommanullen)"""
+    rounded = round(value, precision)
+    if rounded == 0:
+        return '0'
+    text = f'{rounded:.{precision}f}'.rstrip('0').rstrip('.')
+    if text.startswith('0.'):
+        text = text[1:]
+    elif text.startswith('-0.'):
+        text = '-' + text[2:]
+    return text
+
+
+def join_numbers(numbers: List[str]) -> str:
+    """Verbindet Zahlen mit minimalen Trennzeichen"""
+    out = ''
+    for number in numbers:
+        if not out:
+            out = number
+        elif number.startswith('-'):
+            out += number
+        elif number.startswith('.') and '.' in _last_number(out):
+            out += number
+        else:
+            out += ' ' + number
+    return out
+
+
+def _last_number(text: str) -> str:
+    match = re.search(r'[-+]?[\d.]*$', text)
+    return match.group(0) if match else ''
+
+
+# ---------------------------------------------------------------------------
+# Pfad-Daten
+# ---------------------------------------------------------------------------
+
+class _PathScanner:
+    """Tokenisiert SVG-Pfaddaten inklusive kompakt geschriebener Arc-Flags"""
+
+    def __init__(self, data: str):
+        self.data = data
+        self.pos = 0
+
+    def _skip_separators(self):
+        while self.pos < len(self.data) and self.data[self.pos] in ' \t\r\n,':
+            self.pos += 1
+
+    def at_end(self) -> bool:
+        self._skip_separators()
+        return self.pos >= len(self.data)
+
+    def peek_command(self) -> Optional[str]:
+        self._skip_separators()
+        if self.pos < len(self.data) and self.data[self.pos].upper() in PATH_ARG_COUNTS:
+            return self.data[self.pos]
+        return None
+
+    def read_command(self) -> str:
+        command = self.peek_command()
+        if command is None:
+            raise SVGOptimizeError(f"Expected path command at {self.pos}: {self.data!r}")
+        self.pos += 1
+        return command
+
+    def read_number(self) -> float:
+        self._skip_separators()
+        match = NUMBER_PATTERN.match(self.data, self.pos)
+        if not match:
+            raise SVGOptimizeError(f"Expected number at {self.pos}: {self.data!r}")
+        self.pos = match.end()
+        return float(match.group(0))
+
+    def read_flag(self) -> float:
+        self._skip_separators()
+        if self.pos < len(self.data) and self.data[self.pos] in '01':
+            self.pos += 1
+            return float(self.data[self.pos - 1])
+        raise SVGOptimizeError(f"Invalid arc flag at {self.pos}: {self.data!r}")
+
+
+def parse_path(data: str) -> List[Tuple[str, List[float]]]:
+    """Parst Pfaddaten in absolute Segmente (M, L, H, V, C, S, Q, T, A, Z)"""
+    scanner = _PathScanner(data)
+    segments = []
+    cx = cy = 0.0
+    start_x = start_y = 0.0
+    command = None
+
+    while not scanner.at_end():
+        if scanner.peek_command() is not None:
+            command = scanner.read_command()
+        elif command is None:
+            raise SVGOptimizeError(f"Path data must start with a command: {data!r}")
+        elif command in 'Zz':
+            raise SVGOptimizeError(f"Unexpected number after Z: {data!r}")
+
+        upper = command.upper()
+        relative = command.islower()
+
+        if upper == 'Z':
+            segments.append(('Z', []))
+            cx, cy = start_x, start_y
+            continue
+
+        if upper == 'A':
+            args = [scanner.read_number(), scanner.read_number(), scanner.read_number(),
+                    scanner.read_flag(), scanner.read_flag(),
+                    scanner.read_number(), scanner.read_number()]
+        else:
+            args = [scanner.read_number() for _ in range(PATH_ARG_COUNTS[upper])]
+
+        if upper == 'H':
+            x = args[0] + (cx if relative else 0)
+            segments.append(('H', [x]))
+            cx = x
+        elif upper == 'V':
+            y = args[0] + (cy if relative else 0)
+            segments.append(('V', [y]))
+            cy = y
+        elif upper == 'A':
+            x = args[5] + (cx if relative else 0)
+            y = args[6] + (cy if relative else 0)
+            segments.append(('A', args[:5] + [x, y]))
+            cx, cy = x, y
+        else:
+            points = []
+            for i in range(0, len(args), 2):
+                points.append(args[i] + (cx if relative else 0))
+                points.append(args[i + 1] + (cy if relative else 0))
+            segments.append((upper, points))
+            cx, cy = points[-2], points[-1]
+            if upper == 'M':
+                start_x, start_y = cx, cy
+                # Implizite Folgepaare nach M sind Linien
+                command = 'l' if relative else 'L'
+
+    if segments and segments[0][0] != 'M':
+        raise SVGOptimizeError(f"Path data must start with M: {data!r}")
+    return segments
+
+
+def serialize_path(segments: List[Tuple[str, List[float]]], precision: int = 2) -> str:
+    """Serialisiert absolute Segmente - pro Segment die kürzere Form (absolut/relativ)"""
+    parts = []
+    previous = None
+    cx = cy = 0.0
+    start_x = start_y = 0.0
+
+    for upper, args in segments:
+        if upper == 'Z':
+            parts.append('z')
+            previous = 'z'
+            cx, cy = start_x, start_y
+            continue
+
+        rounded = [round(value, precision) for value in args]
+        # Horizontale/vertikale Linien als H/V schreiben
+        if upper == 'L' and rounded[1] == round(cy, precision):
+            upper, rounded = 'H', rounded[:1]
+        elif upper == 'L' and rounded[0] == round(cx, precision):
+            upper, rounded = 'V', rounded[1:]
+
+        if upper == 'H':
+            relative_args = [rounded[0] - cx]
+        elif upper == 'V':
+            relative_args = [rounded[0] - cy]
+        elif upper == 'A':
+            relative_args = rounded[:5] + [rounded[5] - cx, rounded[6] - cy]
+        else:
+            relative_args = [value - (cx if i % 2 == 0 else cy) for i, value in enumerate(rounded)]
+
+        candidates = []
+        for letter, values in ((upper, rounded), (upper.lower(), relative_args)):
+            numbers = [format_number(value, precision) for value in values]
+            if upper == 'A':
+                numbers[3] = '1' if values[3] else '0'
+                numbers[4] = '1' if values[4] else '0'
+            implicit = (letter == previous and letter not in 'Mm') or \
+                (previous == 'M' and letter == 'L') or (previous == 'm' and letter == 'l')
+            body = join_numbers(numbers)
+            if implicit:
+                separator = '' if body.startswith('-') or (
+                    body.startswith('.') and '.' in _last_number(parts[-1])) else ' '
+                candidates.append((separator + body, letter))
+            else:
+                candidates.append((letter + body, letter))
+
+        text, letter = min(candidates, key=lambda candidate: len(candidate[0]))
+        if previous is None:
+            # Der erste Befehl ist immer absolut zu lesen
+            text, letter = candidates[0]
+        parts.append(text)
+        previous = letter
+
+        if upper == 'H':
+            cx = rounded[0]
+        elif upper == 'V':
+            cy = rounded[0]
+        else:
+            cx, cy = rounded[-2], rounded[-1]
+        if upper == 'M':
+            start_x, start_y = cx, cy
+
+    return ''.join(parts)
+
+
+def _points_to_segments(points: str, closed: bool) -> List[Tuple[str, List[float]]]:
+    values = [float(value) for value in NUMBER_PATTERN.findall(points)]
+    if len(values) < 4 or len(values) % 2:
+        raise SVGOptimizeError(f"Invalid points list: {points!r}")
+    segments = [('M', values[:2])]
+    for i in range(2, len(values), 2):
+        segments.append(('L', values[i:i + 2]))
+    if closed:
+        segments.append(('Z', []))
+    return segments
+
+
+# ---------------------------------------------------------------------------
+# SVG-Elemente
+# ---------------------------------------------------------------------------
+
+def _local_name(name: str) -> str:
+    if name.startswith('{'):
+        namespace, local = name[1:].split('}', 1)
+        if namespace == 'http://www.w3.org/XML/1998/namespace':
+            return f'xml:{local}'
+        return local
+    return name
+
+
+def escape_attr(value: str) -> str:
+    return value.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;')
+
+
+def parse_icon(markup: str) -> Tuple[Dict[str, str], List[Tuple[str, Dict[str, str]]]]:
+    """Parst ein flaches Icon-SVG in Root-Attribute und Kind-Elemente"""
+    try:
+        root = ET.fromstring(markup)
+    except ET.ParseError as e:
+        raise SVGOptimizeError(f"Unparseable SVG: {e}")
+
+    if _local_name(root.tag) != 'svg':
+        raise SVGOptimizeError("Root element is not <svg>")
+    if root.text and root.text.strip():
+        raise SVGOptimizeError("SVG contains text content")
+
+    root_attrs = {_local_name(key): value for key, value in root.attrib.items()}
+    children = []
+    for child in root:
+        tag = _local_name(child.tag)
+        if tag not in SHAPE_TAGS or len(child) or (child.text and child.text.strip()):
+            raise SVGOptimizeError(f"Unsupported element <{tag}>")
+        if child.tail and child.tail.strip():
+            raise SVGOptimizeError("SVG contains text content")
+        children.append((tag, {_local_name(key): value for key, value in child.attrib.items()}))
+    return root_attrs, children
+
+
+def serialize_icon(root_attrs: Dict[str, str], children: List[Tuple[str, Dict[str, str]]],
+                   inline: bool = True) -> str:
+    """Serialisiert ein Icon kompakt"""
+    attrs = dict(root_attrs)
+    if inline:
+        attrs.pop('xmlns', None)
+    elif 'xmlns' not in attrs:
+        attrs = {'xmlns': SVG_NS, **attrs}
+    head = ''.join(f' {key}="{escape_attr(value)}"' for key, value in attrs.items())
+    body = ''.join(
+        f'<{tag}' + ''.join(f' {key}="{escape_attr(value)}"' for key, value in child.items()) + '/>'
+        for tag, child in children
+    )
+    return f'<svg{head}>{body}</svg>'
+
+
+def _round_attributes(attrs: Dict[str, str], precision: int) -> Dict[str, str]:
+    rounded = {}
+    for key, value in attrs.items():
+        if key in NUMERIC_ATTRS and NUMBER_PATTERN.fullmatch(value.strip()):
+            rounded[key] = format_number(float(value), precision)
+        elif key == 'viewBox':
+            rounded[key] = ' '.join(format_number(float(v), precision) for v in NUMBER_PATTERN.findall(value))
+        else:
+            rounded[key] = value
+    return rounded
+
+
+def _to_path(tag: str, attrs: Dict[str, str]) -> Optional[Tuple[Dict[str, str], List]]:
+    """Wandelt line/polyline/polygon/path in (Restattribute, Segmente) um"""
+    rest = dict(attrs)
+    if tag == 'path':
+        segments = parse_path(rest.pop('d', ''))
+    elif tag == 'line':
+        coords = [float(rest.pop(key, '0')) for key in ('x1', 'y1', 'x2', 'y2')]
+        segments = [('M', coords[:2]), ('L', coords[2:])]
+    elif tag in ('polyline', 'polygon'):
+        segments = _points_to_segments(rest.pop('points', ''), closed=tag == 'polygon')
+    else:
+        return None
+    return rest, segments
+
+
+def _effective(attrs: Dict[str, str], root_attrs: Dict[str, str], name: str, default: str) -> str:
+    return attrs.get(name, root_attrs.get(name, default))
+
+
+def optimize_svg(markup: str, precision: int = 2, inline: bool = True) -> str:
+    """Optimiert ein einzelnes Icon-SVG; wirft SVGOptimizeError wenn nicht sicher möglich"""
+    root_attrs, children = parse_icon(markup)
+
+    for key in ROOT_DROP_ATTRS:
+        root_attrs.pop(key, None)
+    for key in ('x', 'y'):
+        if root_attrs.get(key) in ('0', '0px'):
+            root_attrs.pop(key)
+    if not any(key.startswith('xlink:') for _, attrs in children for key in attrs):
+        root_attrs.pop('xmlns:xlink', None)
+
+    root_attrs = _round_attributes(root_attrs, precision)
+    children = [(tag, _round_attributes(attrs, precision)) for tag, attrs in children]
+
+    # 1. Gemeinsame Präsentationsattribute aufs <svg> hochziehen
+    if len(children) > 1:
+        for name in INHERITED_ATTRS:
+            values = {attrs.get(name) for _, attrs in children}
+            if len(values) == 1 and None not in values:
+                root_attrs[name] = values.pop()
+                for _, attrs in children:
+                    del attrs[name]
+
+    # 2. Redundante (geerbte) Werte und Geometrie-Defaults entfernen
+    for tag, attrs in children:
+        for name in INHERITED_ATTRS:
+            if name in attrs and root_attrs.get(name) == attrs[name]:
+                del attrs[name]
+        if tag == 'rect':
+            for key in ('x', 'y'):
+                if attrs.get(key) == '0':
+                    del attrs[key]
+            if 'rx' in attrs and attrs.get('ry') == attrs['rx']:
+                del attrs['ry']
+        if tag in ('circle', 'ellipse'):
+            for key in ('cx', 'cy'):
+                if attrs.get(key) == '0':
+                    del attrs[key]
+
+    # 3. Benachbarte, gleich gestylte Strich-Pfade zusammenführen
+    merged = []
+    for tag, attrs in children:
+        converted = _to_path(tag, attrs) if tag in MERGEABLE_TAGS else None
+        if converted is None:
+            merged.append((tag, attrs, None))
+            continue
+        rest, segments = converted
+        mergeable = (
+            not MERGE_BLOCKERS.intersection(rest)
+            and _effective(rest, root_attrs, 'fill', 'black') == 'none'
+        )
+        if merged and merged[-1][2] is not None and mergeable and merged[-1][1] == rest \
+                and merged[-1][0] == 'merge':
+            merged[-1][2].extend(segments)
+        else:
+            merged.append(('merge' if mergeable else 'path', rest, list(segments)))
+
+    optimized_children = []
+    for kind, attrs, segments in merged:
+        if segments is None:
+            optimized_children.append((kind, attrs))
+        else:
+            optimized_children.append(('path', {'d': serialize_path(segments, precision), **attrs}))
+
+    return serialize_icon(root_attrs, optimized_children, inline=inline)
+
+
+@lru_cache(maxsize=1024)
+def optimize_svg_cached(markup: str, precision: int = 2, inline: bool = True) -> str:
+    """Wie optimize_svg, liefert bei nicht optimierbaren SVGs das Original zurück"""
+    try:
+        optimized = optimize_svg(markup, precision, inline)
+    except (SVGOptimizeError, ValueError):
+        return markup
+    return optimized if len(optimized) < len(markup) else markup
+
+
+def optimize_html_svgs(html, precision: int = 2) -> Tuple[str, Dict]:
+    """Optimiert alle Inline-Icons einer Seite und liefert Statistiken zurück.
+    html darf ein TrackedText (lyd_ds.dry_run) sein; der wird direkt umgeschrieben."""
+    stats = {'svgs': 0, 'optimized': 0, 'bytes_before': 0, 'bytes_after': 0}
+
+    def replace(match):
+        original = match.group(0)
+        optimized = optimize_svg_cached(original, precision, True)
+        stats['svgs'] += 1
+        stats['bytes_before'] += len(original.encode('utf-8'))
+        stats['bytes_after'] += len(optimized.encode('utf-8'))
+        if optimized != original:
+            stats['optimized'] += 1
+        return optimized
+
+    page_bytes_before = len(str(html).encode('utf-8'))
+    if isinstance(html, TrackedText):
+        new_html = html.sub(SVG_PATTERN, replace)
+    else:
+        new_html = SVG_PATTERN.sub(replace, html)
+    stats['saved'] = stats['bytes_before'] - stats['bytes_after']
+    stats['page_bytes_before'] = page_bytes_before
+    stats['page_bytes_after'] = len(new_html.encode('utf-8'))
+    return new_html, stats
+
+
+def optimize_icon_set(icons: Dict[str, str], precision: int = 2) -> Dict[str, str]:
+    """Optimiert ein Icon-Dictionary (name -> SVG-Markup)"""
+    return {name: optimize_svg_cached(markup, precision, True) for name, markup in icons.items()}
+
+
+def format_savings(label: str, stats: Dict) -> str:
+    """Einzeiliger Report der eingesparten Bytes einer Seite"""
+    before = stats['bytes_before']
+    saved = stats['saved']
+    percent = (saved / before * 100) if before else 0
+    return (f"💾 {label}: {stats['optimized']}/{stats['svgs']} SVGs optimiert, "
+            f"{before / 1024:.1f} KB → {stats['bytes_after'] / 1024:.1f} KB "
+            f"(-{saved / 1024:.1f} KB, {percent:.0f}%)")
@@ -0,0 +1,177 @@
+"""
+LYD Design System - SVG Sprite Builder
+Sammelt die auf der Site verwendeten Icons in einem cachebaren icons.svg
+(<symbol>-Einträge) und ersetzt Inline-Icons durch <use>-Referenzen
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from lyd_ds.atomic import AtomicWriter, write_atomic
+from lyd_ds.dry_run import TrackedText
+from lyd_ds.svg_optimizer import (
+    SVG_NS, SVG_PATTERN, SVGOptimizeError, escape_attr, optimize_svg_cached, parse_icon
+)
+
+SYMBOL_PATTERN = re.compile(
+    r'<symbol\s+id="([^"]+)"(?:\s+viewBox="([^"]*)")?\s*>(.*?)</symbol>', re.DOTALL
+)
+# Bereits umgeschriebene Icons: <use href="/assets/icons.svg?v=...#icon-x"/>
+USE_PATTERN = re.compile(r'<use\b[^>]*?\b(?:xlink:)?href="([^"#?]*)(?:\?[^"#]*)?#([^"]+)"')
+
+
+def _children_markup(children: List[Tuple[str, Dict[str, str]]]) -> str:
+    return ''.join(
+        f'<{tag}' + ''.join(f' {key}="{escape_attr(value)}"' for key, value in attrs.items()) + '/>'
+        for tag, attrs in children
+    )
+
+
+def icon_key(markup: str, precision: int = 2) -> Optional[Tuple[str, str, Dict[str, str]]]:
+    """Liefert (viewBox, Symbol-Inhalt, Wrapper-Attribute) oder None für Nicht-Icons
+    (Logos, bereits umgeschriebene <use>-Icons)"""
+    optimized = optimize_svg_cached(markup, precision, True)
+    try:
+        root_attrs, children = parse_icon(optimized)
+    except SVGOptimizeError:
+        return None
+    if not children or 'viewBox' not in root_attrs:
+        return None
+    return root_attrs['viewBox'], _children_markup(children), root_attrs
+
+
+class SpriteBuilder:
+    """Baut icons.svg und schreibt Seiten auf <use href="...#id"/> um"""
+
+    def __init__(self, sprite_url: str = '/assets/icons.svg', id_prefix: str = 'icon-',
+                 precision: int = 2):
+        self.sprite_url = sprite_url
+        self.id_prefix = id_prefix
+        self.precision = precision
+        self.symbols = {}       # (viewBox, inhalt) -> symbol id
+        self.names = {}         # symbol id -> (viewBox, inhalt)
+        self.usage = {}         # (viewBox, inhalt) -> Anzahl Vorkommen
+        self.known_names = {}   # (viewBox, inhalt) -> sprechende id
+        self.referenced = set() # symbol ids, auf die Seiten schon per <use> zeigen
+
+    def _register(self, symbol_id: str, key: Tuple[str, str]) -> str:
+        if key in self.symbols:
+            return self.symbols[key]
+        if symbol_id in self.names and self.names[symbol_id] != key:
+            symbol_id = f'{symbol_id}-{hashlib.sha1(key[1].encode()).hexdigest()[:6]}'
+        self.symbols[key] = symbol_id
+        self.names[symbol_id] = key
+        return symbol_id
+
+    def add_icon(self, name: str, markup: str):
+        """Hinterlegt einen sprechenden Namen für ein Icon (z.B. aus SVG_ICONS)"""
+        key = icon_key(markup, self.precision)
+        if key is not None:
+            self.known_names.setdefault(key[:2], f'{self.id_prefix}{name}')
+
+    def add_icons(self, icons: Dict[str, str]):
+        for name, markup in icons.items():
+            self.add_icon(name, markup)
+
+    def load(self, sprite_path: Path):
+        """Übernimmt Symbole aus einem bestehenden Sprite (site-weit akkumulierend)"""
+        sprite_path = Path(sprite_path)
+        if not sprite_path.exists():
+            return
+        content = sprite_path.read_text(encoding='utf-8')
+        for symbol_id, view_box, body in SYMBOL_PATTERN.findall(content):
+            self._register(symbol_id, (view_box or '', body))
+
+    def collect(self, html: str):
+        """Zählt die Inline-Icons einer Seite und merkt sich ihre <use>-Referenzen aufs Sprite"""
+        for match in SVG_PATTERN.finditer(html):
+            key = icon_key(match.group(0), self.precision)
+            if key is not None:
+                self.usage[key[:2]] = self.usage.get(key[:2], 0) + 1
+        for url, symbol_id in USE_PATTERN.findall(html):
+            if url == self.sprite_url:
+                self.referenced.add(symbol_id)
+
+    def finalize(self, min_uses: int = 2):
+        """Nimmt benutzte Icons ins Sprite auf (benannte immer, unbenannte ab min_uses)"""
+        for key, count in self.usage.items():
+            if key in self.symbols:
+                continue
+            if key in self.known_names:
+                self._register(self.known_names[key], key)
+            elif count >= min_uses:
+                digest = hashlib.sha1('|'.join(key).encode()).hexdigest()[:8]
+                self._register(f'{self.id_prefix}{digest}', key)
+
+    def prune(self) -> List[str]:
+        """Entfernt Symbole, die keine gesammelte Seite benutzt (weder inline noch per <use>).
+        Nur nach einem vollständigen Lauf aufrufen: collect() muss jede Seite gesehen haben,
+        die das Sprite einbindet - sonst verschwinden Symbole, auf die sie noch zeigt."""
+        unused = [symbol_id for symbol_id, key in self.names.items()
+                  if key not in self.usage and symbol_id not in self.referenced]
+        for symbol_id in unused:
+            del self.symbols[self.names.pop(symbol_id)]
+        return sorted(unused)
+
+    def build(self) -> str:
+        """Erzeugt das Sprite-Markup (stabil sortiert, damit der Hash nur bei Änderungen wechselt)"""
+        symbols = []
+        for symbol_id in sorted(self.names):
+            view_box, body = self.names[symbol_id]
+            view_box_attr = f' viewBox="{view_box}"' if view_box else ''
+            symbols.append(f'<symbol id="{symbol_id}"{view_box_attr}>{body}</symbol>')
+        return (f'<svg xmlns="{SVG_NS}" style="display:none">\n'
+                + '\n'.join(symbols) + '\n</svg>\n')
+
+    def version(self) -> str:
+        return hashlib.sha1(self.build().encode('utf-8')).hexdigest()[:8]
+
+    def write(self, sprite_path: Path, writer: Optional[AtomicWriter] = None) -> str:
+        """Schreibt icons.svg (atomar, mit writer zusammen mit den Seiten) und liefert
+        die versionierte URL zurück"""
+        sprite_path = Path(sprite_path)
+        sprite_path.parent.mkdir(parents=True, exist_ok=True)
+        if writer:
+            writer.write(sprite_path, self.build())
+        else:
+            write_atomic(sprite_path, self.build())
+        return f'{self.sprite_url}?v={self.version()}'
+
+    def rewrite_html(self, html, sprite_href: Optional[str] = None) -> Tuple[str, Dict]:
+        """Ersetzt Inline-Icons, die im Sprite liegen, durch <use>-Referenzen
+        (ein TrackedText wird direkt umgeschrieben)"""
+        href = sprite_href or self.sprite_url
+        stats = {'icons': 0, 'replaced': 0, 'bytes_before': len(str(html).encode('utf-8'))}
+
+        def replace(match):
+            key = icon_key(match.group(0), self.precision)
+            if key is None:
+                return match.group(0)
+            stats['icons'] += 1
+            symbol_id = self.symbols.get(key[:2])
+            if symbol_id is None:
+                return match.group(0)
+            # Präsentationsattribute bleiben am Wrapper, damit CSS-Overrides weiter greifen
+            wrapper = ''.join(f' {k}="{escape_attr(v)}"' for k, v in key[2].items())
+            reference = f'<svg{wrapper}><use href="{href}#{symbol_id}"/></svg>'
+            # Nur ersetzen, wenn Bytes oder DOM-Knoten gespart werden
+            if len(reference) >= len(match.group(0)) and key[1].count('/>') < 2:
+                return match.group(0)
+            stats['replaced'] += 1
+            return reference
+
+        if isinstance(html, TrackedText):
+            new_html = html.sub(SVG_PATTERN, replace)
+        else:
+            new_html = SVG_PATTERN.sub(replace, html)
+        stats['bytes_after'] = len(new_html.encode('utf-8'))
+        stats['saved'] = stats['bytes_before'] - stats['bytes_after']
+        return new_html, stats
+
+
+def format_sprite_report(label: str, stats: Dict) -> str:
+    """Einzeiliger Report der <use>-Umschreibung einer Seite"""
+    return (f"🧩 {label}: {stats['replaced']}/{stats['icons']} Icons → <use>, "
+            f"{-stats['saved'] / 1024:+.1f} KB")
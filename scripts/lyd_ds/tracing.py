@@ -0,0 +1,155 @@
+"""
+LYD Design System - Build Tracing
+Misst Build-Stufen (Wall-Time, Bytes rein/raus, Regex-Ersetzungen) und schreibt
+Chrome Trace-Event JSON (chrome://tracing, Perfetto, speedscope)
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from lyd_ds.safe_regex import guarded
+
+TRACE_ENV = 'LYD_TRACE'
+
+
+def _size(content: Any) -> Optional[int]:
+    if isinstance(content, str):
+        return len(content.encode('utf-8'))
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+    return None
+
+
+class Span:
+    """Eine laufende Stufe; Zähler werden beim Schließen ins Trace-Event übernommen"""
+
+    __slots__ = ('name', 'bytes_in', 'bytes_out', 'regex_calls', 'regex_subs', 'args')
+
+    def __init__(self, name: str, bytes_in: Optional[int] = None, args: Optional[Dict] = None):
+        self.name = name
+        self.bytes_in = bytes_in
+        self.bytes_out = None
+        self.regex_calls = 0
+        self.regex_subs = 0
+        self.args = args or {}
+
+    def output(self, content: Any):
+        """Merkt sich die Ausgabegröße der Stufe"""
+        self.bytes_out = _size(content)
+        return content
+
+
+class Tracer:
+    """Sammelt Stufen eines Build-Laufs als Trace-Events ('X' = complete event)"""
+
+    def __init__(self, name: str, trace_path: Optional[str] = None):
+        self.name = name
+        self.trace_path = trace_path
+        self.events: List[Dict] = []
+        self._stack: List[Span] = []
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    @classmethod
+    def from_env(cls, name: str) -> 'Tracer':
+        """Tracer, der nur schreibt, wenn $LYD_TRACE gesetzt ist (Datei oder Verzeichnis)"""
+        return cls(name, os.environ.get(TRACE_ENV) or None)
+
+    @contextmanager
+    def stage(self, name: str, content: Any = None, **args) -> Iterator[Span]:
+        span = Span(name, _size(content), args)
+        self._stack.append(span)
+        start = time.perf_counter_ns()
+        try:
+            yield span
+        finally:
+            end = time.perf_counter_ns()
+            self._stack.pop()
+            self._record(span, start, end)
+
+    @contextmanager
+    def session(self, name: str, **args) -> Iterator[Span]:
+        """Äußere Stufe eines Build-Laufs; der Trace wird auch bei Fehlern geschrieben"""
+        try:
+            with self.stage(name, **args) as span:
+                yield span
+        finally:
+            self.save()
+
+    def run(self, name: str, func: Callable, content: Any, *args, **kwargs) -> Any:
+        """Führt func(content, ...) als Stufe aus und misst Ein-/Ausgabegröße"""
+        with self.stage(name, content) as span:
+            return span.output(func(content, *args, **kwargs))
+
+    def sub(self, pattern, repl, string: str, count: int = 0, flags: int = 0) -> str:
+        """re.sub (über den Guarded-Regex-Executor) mit Zählung der Ersetzungen
+        für alle offenen Stufen"""
+        label = self._stack[-1].name if self._stack else None
+        result, subs = guarded.subn(pattern, repl, string, count=count, flags=flags, label=label)
+        for span in self._stack:
+            span.regex_calls += 1
+            span.regex_subs += subs
+        return result
+
+    def _record(self, span: Span, start: int, end: int):
+        args = dict(span.args)
+        for key in ('bytes_in', 'bytes_out'):
+            value = getattr(span, key)
+            if value is not None:
+                args[key] = value
+        if span.regex_calls:
+            args['regex_calls'] = span.regex_calls
+            args['regex_subs'] = span.regex_subs
+        self.events.append({
+            'name': span.name,
+            'cat': self.name,
+            'ph': 'X',
+            'ts': (start - self._origin) / 1000,
+            'dur': (end - start) / 1000,
+            'pid': self._pid,
+            'tid': threading.get_ident(),
+            'args': args,
+        })
+
+    def to_trace(self) -> Dict:
+        metadata = {'name': 'process_name', 'ph': 'M', 'pid': self._pid,
+                    'args': {'name': self.name}}
+        return {'traceEvents': [metadata] + sorted(self.events, key=lambda e: e['ts']),
+                'displayTimeUnit': 'ms'}
+
+    def report(self) -> List[str]:
+        """Kurzübersicht der Stufen, langsamste zuerst"""
+        lines = []
+        for event in sorted(self.events, key=lambda e: -e['dur']):
+            args = event['args']
+            details = []
+            if 'bytes_in' in args and 'bytes_out' in args:
+                details.append(f"{args['bytes_in'] / 1024:.1f} → {args['bytes_out'] / 1024:.1f} KB")
+            elif 'bytes_in' in args or 'bytes_out' in args:
+                details.append(f"{args.get('bytes_in', args.get('bytes_out')) / 1024:.1f} KB")
+            if 'regex_subs' in args:
+                details.append(f"{args['regex_subs']} subs/{args['regex_calls']} re")
+            lines.append(f"  ⏱️  {event['name']:<32} {event['dur'] / 1000:8.2f} ms  {', '.join(details)}")
+        return lines
+
+    def save(self, trace_path: Optional[str] = None) -> Optional[Path]:
+        """Schreibt den Trace (Verzeichnis -> <name>-<timestamp>.json) und druckt die Übersicht"""
+        trace_path = trace_path or self.trace_path
+        if not trace_path:
+            return None
+        path = Path(trace_path)
+        if path.is_dir():
+            path = path / f"{self.name}-{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_trace(), f, indent=1)
+        print(f"📈 Trace written: {path}")
+        for line in self.report():
+            print(line)
+        return path
@@ -54,6 +54,14 @@ echo "3. GOLD STANDARD VERIFIKATION:"
 echo "=============================="
 npx playwright test --config=playwright.ds.config.ts tests/ds/golden-standard.spec.ts --project=desktop-light --max-failures=1 | grep -E "passed|failed|Expected|Received"
 
+# 4. Regex-Patterns der Build-Skripte (verschachtelte Quantoren)
+echo ""
+echo "4. REGEX BACKTRACKING CHECK:"
+echo "============================"
+if ! python3 scripts/lyd-ds lint-regex; then
+    ((ERRORS++))
+fi
+
 echo ""
 echo "=== PRE-DEPLOYMENT CHECK SUMMARY ==="
 if [ $ERRORS -eq 0 ]; then
@@ -11,6 +11,21 @@ Remove Icon Library tab completely.
 
 import os
 import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lyd_ds.safe_regex import guarded
+
+# Regex-Pässe (auch vom Benchmark genutzt)
+TAB_NAV_PATTERN = r'<!-- Tab Navigation -->\s*<div class="tabs">.*?</div>'
+OVERVIEW_TAB_PATTERN = r'<!-- Tab Content: Overview -->\s*<div class="tab-content active" id="overview">.*?</div>\s*</div>'
+VARIANTS_TAB_PATTERN = r'<!-- Tab Content: Variants -->\s*<div class="tab-content" id="variants">.*?</div>\s*</div>'
+ICON_TAB_PATTERN = r'<!-- Tab Content: Icon Library -->\s*<div class="tab-content" id="icons">.*?</div>\s*</div>'
+API_TAB_PATTERN = r'<!-- Tab Content: API -->\s*<div class="tab-content" id="api">.*?</div>\s*</div>'
+TAB_SCRIPT_PATTERN = r'// Tab switching functionality.*?}'
+REGEX_PASSES = [TAB_NAV_PATTERN, OVERVIEW_TAB_PATTERN, VARIANTS_TAB_PATTERN,
+                ICON_TAB_PATTERN, API_TAB_PATTERN, TAB_SCRIPT_PATTERN]
 
 def reorganize_select_new_structure():
     """Reorganisiere Select nach neuem 4-Tab-System."""
@@ -577,24 +592,19 @@ export {};</code></pre>
     # Apply all changes
     try:
         # Replace tab navigation
-        tab_pattern = r'<!-- Tab Navigation -->\s*<div class="tabs">.*?</div>'
-        content = re.sub(tab_pattern, new_tab_navigation, content, flags=re.DOTALL)
+        content = guarded.sub(TAB_NAV_PATTERN, new_tab_navigation, content, flags=re.DOTALL)
         
         # Remove Overview tab completely
-        overview_pattern = r'<!-- Tab Content: Overview -->\s*<div class="tab-content active" id="overview">.*?</div>\s*</div>'
-        content = re.sub(overview_pattern, '', content, flags=re.DOTALL)
+        content = guarded.sub(OVERVIEW_TAB_PATTERN, '', content, flags=re.DOTALL)
         
         # Replace Variants tab with new combined content
-        variants_pattern = r'<!-- Tab Content: Variants -->\s*<div class="tab-content" id="variants">.*?</div>\s*</div>'
-        content = re.sub(variants_pattern, new_variants_tab, content, flags=re.DOTALL)
+        content = guarded.sub(VARIANTS_TAB_PATTERN, new_variants_tab, content, flags=re.DOTALL)
         
         # Remove Icon Library tab completely
-        icon_pattern = r'<!-- Tab Content: Icon Library -->\s*<div class="tab-content" id="icons">.*?</div>\s*</div>'
-        content = re.sub(icon_pattern, '', content, flags=re.DOTALL)
+        content = guarded.sub(ICON_TAB_PATTERN, '', content, flags=re.DOTALL)
         
         # Replace API tab with Implementation tab
-        api_pattern = r'<!-- Tab Content: API -->\s*<div class="tab-content" id="api">.*?</div>\s*</div>'
-        content = re.sub(api_pattern, new_implementation_tab, content, flags=re.DOTALL)
+        content = guarded.sub(API_TAB_PATTERN, new_implementation_tab, content, flags=re.DOTALL)
         
         # Update JavaScript to handle new tab structure
         js_update = '''
@@ -628,8 +638,8 @@ export {};</code></pre>
         }'''
         
         # Replace tab switching JavaScript
-        content = re.sub(
-            r'// Tab switching functionality.*?}',
+        content = guarded.sub(
+            TAB_SCRIPT_PATTERN,
             js_update,
             content,
             flags=re.DOTALL
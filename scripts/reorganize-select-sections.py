@@ -7,6 +7,16 @@ Reorganize Select Component:
 
 import os
 import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lyd_ds.safe_regex import guarded
+
+# Regex-Pässe (auch vom Benchmark genutzt)
+OVERVIEW_PATTERN = r'<section class="section">\s*<h2 class="section-title">Select System Overview</h2>.*?</section>'
+VARIANTS_PATTERN = r'<section class="section">\s*<h2 class="section-title">Select Variants & States</h2>.*?</section>'
+REGEX_PASSES = [OVERVIEW_PATTERN, VARIANTS_PATTERN]
 
 def reorganize_select_sections():
     """Reorganisiere Select-Sektionen für bessere Struktur."""
@@ -363,12 +373,10 @@ def reorganize_select_sections():
     # Apply replacements
     try:
         # Replace Overview section
-        overview_pattern = r'<section class="section">\s*<h2 class="section-title">Select System Overview</h2>.*?</section>'
-        content = re.sub(overview_pattern, new_overview, content, flags=re.DOTALL)
+        content = guarded.sub(OVERVIEW_PATTERN, new_overview, content, flags=re.DOTALL)
         
         # Replace Variants section
-        variants_pattern = r'<section class="section">\s*<h2 class="section-title">Select Variants & States</h2>.*?</section>'
-        content = re.sub(variants_pattern, new_variants, content, flags=re.DOTALL)
+        content = guarded.sub(VARIANTS_PATTERN, new_variants, content, flags=re.DOTALL)
         
         # Write file
         with open(file_path, 'w', encoding='utf-8') as f:
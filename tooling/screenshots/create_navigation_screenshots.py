@@ -5,12 +5,18 @@ Erstellt Screenshots aller über die linke Navigation aufrufbaren Seiten
 """
 
 import subprocess
+import sys
 import time
 from datetime import datetime
 import os
+from pathlib import Path
 
-# Base URL des Design Systems
-BASE_URL = "http://designsystem.liveyourdreams.online"
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'scripts'))
+from lyd_ds.static_server import PRODUCTION_URL, local_url, site_root
+
+# Base URL des Design Systems (None: lokaler Server auf design-system/v2,
+# --live: PRODUCTION_URL)
+BASE_URL = None
 
 # Alle URLs aus der Navigation (basierend auf der Gold Standard Navigation)
 NAVIGATION_URLS = [
@@ -60,9 +66,9 @@ NAVIGATION_URLS = [
     "/components/upload/"
 ]
 
-def create_screenshot(url, filename):
+def create_screenshot(url, filename, base_url=None):
     """Erstellt einen Screenshot einer URL mit Playwright"""
-    full_url = BASE_URL + url
+    full_url = (base_url or BASE_URL or local_url(site_root())) + url
     
     # Playwright Screenshot Command
     cmd = [
@@ -92,18 +98,20 @@ def create_screenshot(url, filename):
         print(f"   💥 Exception: {e}")
         return False
 
-def main():
+def main(screenshots_dir=None):
     """Hauptfunktion - erstellt alle Screenshots"""
     
     # Datum für Dateinamen
     today = datetime.now().strftime("%Y-%m-%d")
     
     # Screenshots Ordner
-    screenshots_dir = "/Users/christianbernecker/live-your-dreams/screenshots"
+    screenshots_dir = screenshots_dir or "/Users/christianbernecker/live-your-dreams/screenshots"
     
     print(f"🚀 Starte Screenshot-Erstellung für {len(NAVIGATION_URLS)} Seiten")
     print(f"📅 Datum: {today}")
     print(f"📁 Ordner: {screenshots_dir}")
+    base_url = BASE_URL or local_url(site_root())
+    print(f"🌐 Seite: {base_url}")
     print("-" * 60)
     
     successful = 0
@@ -119,13 +127,14 @@ def main():
             filename = f"{screenshots_dir}/{clean_url}_{today}.png"
         
         # Screenshot erstellen
-        if create_screenshot(url, filename):
+        if create_screenshot(url, filename, base_url):
             successful += 1
         else:
             failed += 1
             
-        # Kurze Pause zwischen Screenshots
-        time.sleep(1)
+        # Kurze Pause zwischen Screenshots (nur gegen die Live-Seite nötig)
+        if BASE_URL:
+            time.sleep(1)
     
     print("-" * 60)
     print(f"📊 ZUSAMMENFASSUNG:")
@@ -143,4 +152,10 @@ def main():
         print("   Fehler beim Auflisten der Dateien")
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Screenshot all navigation pages')
+    parser.add_argument('--live', action='store_true', help=f'Capture {PRODUCTION_URL} instead of a local server')
+    if parser.parse_args().live:
+        BASE_URL = PRODUCTION_URL
     main()